@@ -0,0 +1 @@
+"""Offline performance benchmarks for the Flight Tracker API core."""
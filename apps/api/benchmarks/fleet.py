@@ -0,0 +1,263 @@
+"""Simulate a fleet of display devices polling for snapshots.
+
+Run from `apps/api` with `python -m benchmarks.fleet`. Each simulated device
+has its own seeded viewing zone and polls again after the refresh interval
+it was given, compressed by `--time-scale`. By default devices call an
+in-process DeviceSnapshotService backed by the mock provider, which shows how
+many devices one process can serve and how many upstream calls they cause.
+With `--url`, devices poll a running API over HTTP instead; upstream call
+counts are then not observable.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from random import Random
+from time import perf_counter
+from urllib.parse import urlsplit
+
+from flight_tracker.domain.models import (
+    AircraftBatch,
+    AircraftState,
+    FlightInformation,
+    ViewingZone,
+)
+from flight_tracker.providers import (
+    CachingFlightDataProvider,
+    EnrichmentCachingFlightDataProvider,
+    FlightDataProvider,
+    GeographicArea,
+    MockFlightDataProvider,
+    MockScenario,
+    ProviderCapability,
+    fetch_aircraft_batch,
+)
+from flight_tracker.services import DeviceSnapshotService, HistogramCollector
+
+DEFAULT_SNAPSHOT_PATH = "/api/v1/devices/{device_id}/snapshot"
+
+# One poll: returns an outcome label and the refresh interval in seconds.
+Poll = Callable[[ViewingZone], Awaitable[tuple[str, float]]]
+
+
+class CountingProvider:
+    """Count the calls that would reach a paid upstream provider."""
+
+    def __init__(self, provider: FlightDataProvider) -> None:
+        self.provider = provider
+        self.aircraft_calls = 0
+        self.enrichment_calls = 0
+
+    @property
+    def name(self) -> str:
+        return self.provider.name
+
+    @property
+    def capabilities(self) -> frozenset[ProviderCapability]:
+        return self.provider.capabilities
+
+    async def get_aircraft(self, area: GeographicArea) -> list[AircraftState]:
+        self.aircraft_calls += 1
+        return await self.provider.get_aircraft(area)
+
+    async def get_aircraft_batch(self, area: GeographicArea) -> AircraftBatch:
+        self.aircraft_calls += 1
+        return await fetch_aircraft_batch(self.provider, area)
+
+    async def get_flight_information(self, aircraft: AircraftState) -> FlightInformation | None:
+        self.enrichment_calls += 1
+        return await self.provider.get_flight_information(aircraft)
+
+
+@dataclass(slots=True)
+class FleetReport:
+    latencies: list[float] = field(default_factory=list)
+    outcomes: Counter[str] = field(default_factory=Counter)
+    errors: int = 0
+
+    def percentile(self, fraction: float) -> float:
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def device_zones(count: int, seed: int) -> list[ViewingZone]:
+    rng = Random(seed)
+    return [
+        ViewingZone(
+            device_id=f"load-{index:05d}",
+            name="Window",
+            latitude=round(51.5 + rng.uniform(-0.5, 0.5), 3),
+            longitude=round(-0.2 + rng.uniform(-0.8, 0.8), 3),
+            bearing_degrees=rng.uniform(0.0, 359.0),
+            field_of_view_degrees=rng.uniform(40.0, 120.0),
+            max_distance_km=rng.choice((20.0, 35.0, 50.0)),
+        )
+        for index in range(count)
+    ]
+
+
+def service_poll(service: DeviceSnapshotService) -> Poll:
+    async def poll(zone: ViewingZone) -> tuple[str, float]:
+        snapshot = await service.generate(zone)
+        return snapshot.status.value, float(snapshot.refresh_after_seconds)
+
+    return poll
+
+
+def http_poll(url: str, path: str, default_refresh_seconds: float) -> Poll:
+    parts = urlsplit(url)
+    host = parts.hostname or "127.0.0.1"
+    port = parts.port or 80
+
+    async def poll(zone: ViewingZone) -> tuple[str, float]:
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            target = path.format(device_id=zone.device_id)
+            writer.write(
+                f"GET {target} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode()
+            )
+            await writer.drain()
+            response = await reader.read()
+        finally:
+            writer.close()
+        head, _, body = response.partition(b"\r\n\r\n")
+        status = int(head.split(b" ", 2)[1])
+        if status >= 400:
+            raise RuntimeError(f"HTTP {status}")
+        try:
+            refresh = float(json.loads(body)["refresh_after_seconds"])
+        except (ValueError, KeyError, TypeError):
+            refresh = default_refresh_seconds
+        return f"http_{status}", refresh
+
+    return poll
+
+
+async def run_device(
+    zone: ViewingZone,
+    poll: Poll,
+    report: FleetReport,
+    *,
+    stop_at: float,
+    time_scale: float,
+    first_delay: float,
+    retry_seconds: float,
+) -> None:
+    loop = asyncio.get_running_loop()
+    await asyncio.sleep(first_delay)
+    while loop.time() < stop_at:
+        started = perf_counter()
+        try:
+            outcome, refresh_seconds = await poll(zone)
+        except Exception:  # noqa: BLE001 - every failure counts against the error rate
+            report.errors += 1
+            refresh_seconds = retry_seconds
+        else:
+            report.outcomes[outcome] += 1
+            report.latencies.append(perf_counter() - started)
+        await asyncio.sleep(refresh_seconds * time_scale)
+
+
+async def run_fleet(args: argparse.Namespace) -> int:
+    zones = device_zones(args.devices, args.seed)
+    counter: CountingProvider | None = None
+    collector: HistogramCollector | None = None
+    if args.url:
+        poll = http_poll(args.url, args.path, args.refresh_seconds)
+    else:
+        counter = CountingProvider(
+            MockFlightDataProvider(
+                seed=args.seed,
+                scenario=MockScenario(args.scenario),
+                traffic_size=args.traffic,
+            )
+        )
+        provider: FlightDataProvider = counter
+        if args.cached:
+            provider = EnrichmentCachingFlightDataProvider(CachingFlightDataProvider(counter))
+        collector = HistogramCollector()
+        poll = service_poll(DeviceSnapshotService(provider, instrumentation=collector))
+
+    report = FleetReport()
+    rng = Random(args.seed)
+    loop = asyncio.get_running_loop()
+    started_at = loop.time()
+    stop_at = started_at + args.duration
+    await asyncio.gather(
+        *(
+            run_device(
+                zone,
+                poll,
+                report,
+                stop_at=stop_at,
+                time_scale=args.time_scale,
+                first_delay=rng.uniform(0.0, args.refresh_seconds * args.time_scale),
+                retry_seconds=args.refresh_seconds,
+            )
+            for zone in zones
+        )
+    )
+    elapsed = loop.time() - started_at
+
+    requests = len(report.latencies) + report.errors
+    print(f"devices          {args.devices}")
+    print(f"requests         {requests} in {elapsed:.1f}s ({requests / elapsed:,.1f}/s)")
+    print(f"error rate       {report.errors / max(requests, 1):.2%}")
+    if report.latencies:
+        for label, fraction in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99)):
+            print(f"latency {label}      {report.percentile(fraction) * 1_000:.2f} ms")
+    for outcome, count in sorted(report.outcomes.items()):
+        print(f"  {outcome:<22} {count}")
+    if counter is not None:
+        print(f"upstream live    {counter.aircraft_calls}")
+        print(f"upstream enrich  {counter.enrichment_calls}")
+    if collector is not None:
+        print("stage                  p50 ms    p99 ms    max ms")
+        for stage, stats in collector.summary().items():
+            print(
+                f"  {stage:<18} {stats['p50_ms']:>9.3f} {stats['p99_ms']:>9.3f}"
+                f" {stats['max_ms']:>9.3f}"
+            )
+    return 1 if report.errors and not report.latencies else 0
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--devices", type=int, default=1_000)
+    parser.add_argument("--duration", type=float, default=10.0, help="wall-clock seconds")
+    parser.add_argument(
+        "--time-scale",
+        type=float,
+        default=0.01,
+        help="multiplier applied to refresh intervals; 0.01 turns 30 s into 0.3 s",
+    )
+    parser.add_argument("--refresh-seconds", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=20260808)
+    parser.add_argument(
+        "--traffic", type=int, default=1_000, help="synthetic aircraft in the mock airspace"
+    )
+    parser.add_argument(
+        "--scenario",
+        choices=[scenario.value for scenario in MockScenario],
+        default=MockScenario.NORMAL.value,
+        help="mock upstream behaviour, such as slow, long_tail or flaky",
+    )
+    parser.add_argument(
+        "--cached", action="store_true", help="put regional and enrichment caches in front"
+    )
+    parser.add_argument("--url", help="poll a running API instead of an in-process service")
+    parser.add_argument("--path", default=DEFAULT_SNAPSHOT_PATH)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    return asyncio.run(run_fleet(parse_args(argv)))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
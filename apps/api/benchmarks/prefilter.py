@@ -0,0 +1,100 @@
+"""Measure visibility pre-rejection rate and throughput across feed sizes.
+
+Run from `apps/api` with `python -m benchmarks.prefilter`. Aircraft are
+scattered uniformly over a regional box around a 35 km window sector, which
+mirrors a shared regional provider response rather than a per-device query.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+from datetime import UTC, datetime
+from functools import partial
+from random import Random
+from time import perf_counter
+
+from flight_tracker.domain.geometry import CompiledViewingZone, compile_viewing_zone
+from flight_tracker.domain.models import AircraftState, ViewingZone, VisibleAircraft
+
+OBSERVED_AT = datetime(2026, 8, 8, 12, 0, tzinfo=UTC)
+DEFAULT_FEED_SIZES = (100, 1_000, 10_000, 50_000)
+
+
+def regional_feed(
+    size: int, zone: ViewingZone, span_degrees: float, seed: int
+) -> list[AircraftState]:
+    rng = Random(seed)
+    return [
+        AircraftState(
+            provider="benchmark",
+            provider_aircraft_id=f"BENCH{index:06d}",
+            latitude=zone.latitude + rng.uniform(-span_degrees, span_degrees),
+            longitude=zone.longitude + rng.uniform(-span_degrees, span_degrees),
+            altitude_ft=rng.randrange(1_000, 41_000, 500),
+            observed_at=OBSERVED_AT,
+        )
+        for index in range(size)
+    ]
+
+
+def exact_only(compiled: CompiledViewingZone, states: list[AircraftState]) -> list[VisibleAircraft]:
+    """Evaluate every aircraft exactly, as before pre-rejection existed."""
+
+    return [match for match in map(compiled.evaluate, states) if match.inside_view]
+
+
+def best_of(repeats: int, run: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeats):
+        started = perf_counter()
+        run()
+        timings.append(perf_counter() - started)
+    return min(timings)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_FEED_SIZES))
+    parser.add_argument("--span-degrees", type=float, default=3.0)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=20260808)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    zone = ViewingZone(
+        device_id="benchmark",
+        name="North window",
+        latitude=51.477,
+        longitude=-0.210,
+        bearing_degrees=0.0,
+        field_of_view_degrees=80.0,
+        max_distance_km=35.0,
+    )
+    compiled = compile_viewing_zone(zone)
+
+    print(
+        f"{'aircraft':>9} {'rejected':>9} {'visible':>8} "
+        f"{'exact/s':>12} {'prefilter/s':>12} {'speedup':>8}"
+    )
+    for size in args.sizes:
+        states = regional_feed(size, zone, args.span_degrees, args.seed)
+        rejected = sum(
+            not compiled.may_contain(state.latitude, state.longitude) for state in states
+        )
+        visible = len(compiled.filter(states))
+
+        exact_seconds = best_of(args.repeats, partial(exact_only, compiled, states))
+        prefilter_seconds = best_of(args.repeats, partial(compiled.filter, states))
+        print(
+            f"{size:>9} {rejected / size:>9.1%} {visible:>8} "
+            f"{size / exact_seconds:>12,.0f} {size / prefilter_seconds:>12,.0f} "
+            f"{exact_seconds / prefilter_seconds:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,218 @@
+"""Measure core throughput across feed sizes and gate on a stored baseline.
+
+Run from `apps/api` with `python -m benchmarks.suite`. Feeds come from the
+mock provider's synthetic traffic mode, so the suite needs no network. When
+`--baseline` names an existing file, any case whose throughput falls more than
+`--max-regression` below it fails the run; `--update-baseline` rewrites the
+file from this run instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import partial
+from pathlib import Path
+from timeit import Timer
+
+from flight_tracker.domain.geometry import (
+    evaluate_aircraft,
+    great_circle_distance_km,
+    visible_aircraft,
+    visible_aircraft_by_zone,
+)
+from flight_tracker.domain.models import AircraftState, FlightInformation, ViewingZone
+from flight_tracker.domain.ranking import rank_visible_aircraft
+from flight_tracker.providers import GeographicArea, MockFlightDataProvider, ProviderCapability
+from flight_tracker.services import DeviceSnapshotService
+
+BASELINE_FORMAT_VERSION = 1
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+DEFAULT_FEED_SIZES = (10, 1_000, 10_000, 100_000)
+DEFAULT_ZONE_COUNTS = (1, 16)
+REGION = GeographicArea(center_latitude=51.477, center_longitude=-0.210, radius_km=150.0)
+GENERATED_AT = datetime(2026, 8, 8, 12, 0, tzinfo=UTC)
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    case: str
+    aircraft: int
+    seconds: float
+
+    @property
+    def aircraft_per_second(self) -> float:
+        return self.aircraft / self.seconds
+
+
+class FrameProvider:
+    """Serve one fixed frame so snapshot timings exclude feed generation."""
+
+    def __init__(self, states: list[AircraftState], mock: MockFlightDataProvider) -> None:
+        self.states = states
+        self.mock = mock
+
+    @property
+    def name(self) -> str:
+        return self.mock.name
+
+    @property
+    def capabilities(self) -> frozenset[ProviderCapability]:
+        return self.mock.capabilities
+
+    async def get_aircraft(self, area: GeographicArea) -> list[AircraftState]:
+        return self.states
+
+    async def get_flight_information(self, aircraft: AircraftState) -> FlightInformation | None:
+        return await self.mock.get_flight_information(aircraft)
+
+
+def window_zone(index: int = 0, *, field_of_view_degrees: float = 80.0) -> ViewingZone:
+    """Return a window zone, spreading observers across the region by index."""
+
+    return ViewingZone(
+        device_id=f"benchmark-{index}",
+        name="Window",
+        latitude=REGION.center_latitude + (index % 4) * 0.2,
+        longitude=REGION.center_longitude + (index // 4 % 4) * 0.3,
+        bearing_degrees=(index * 37.0) % 360.0,
+        field_of_view_degrees=field_of_view_degrees,
+        max_distance_km=35.0,
+    )
+
+
+def distances(states: list[AircraftState]) -> None:
+    origin_latitude, origin_longitude = REGION.center_latitude, REGION.center_longitude
+    for state in states:
+        great_circle_distance_km(origin_latitude, origin_longitude, state.latitude, state.longitude)
+
+
+def evaluate_each(states: list[AircraftState], zone: ViewingZone) -> None:
+    for state in states:
+        evaluate_aircraft(state, zone)
+
+
+def seconds_per_run(run: Callable[[], object], repeats: int) -> float:
+    """Return the best per-call time, looping fast cases long enough to time reliably."""
+
+    timer = Timer(run)
+    loops, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeats, number=loops)) / loops
+
+
+def run_suite(
+    sizes: tuple[int, ...], zone_counts: tuple[int, ...], repeats: int, seed: int
+) -> list[BenchmarkResult]:
+    results: list[BenchmarkResult] = []
+    runner = asyncio.Runner()
+
+    def measure(case: str, aircraft: int, run: Callable[[], object]) -> None:
+        results.append(BenchmarkResult(case, aircraft, seconds_per_run(run, repeats)))
+
+    zone = window_zone()
+    for size in sizes:
+        mock = MockFlightDataProvider(seed=seed, traffic_size=size)
+        states = runner.run(mock.get_aircraft(REGION))
+        wide_zone = window_zone(field_of_view_degrees=360.0)
+        matches = visible_aircraft(states, wide_zone)
+
+        measure(f"great_circle_distance_km[n={size}]", size, partial(distances, states))
+        measure(f"evaluate_aircraft[n={size}]", size, partial(evaluate_each, states, zone))
+        measure(f"visible_aircraft[n={size}]", size, partial(visible_aircraft, states, zone))
+        for count in zone_counts:
+            zones = [window_zone(index) for index in range(count)]
+            measure(
+                f"visible_aircraft_by_zone[n={size},zones={count}]",
+                size * count,
+                partial(visible_aircraft_by_zone, states, zones),
+            )
+        if matches:
+            measure(
+                f"rank_visible_aircraft[n={size}]",
+                len(matches),
+                partial(rank_visible_aircraft, matches, wide_zone),
+            )
+        service = DeviceSnapshotService(FrameProvider(states, mock), clock=lambda: GENERATED_AT)
+        measure(
+            f"snapshot_generate[n={size}]",
+            size,
+            lambda service=service: runner.run(service.generate(zone)),
+        )
+    runner.close()
+    return results
+
+
+def compare(
+    results: list[BenchmarkResult], baseline: dict[str, float], max_regression: float
+) -> list[str]:
+    """Return a description of every case slower than the baseline allows."""
+
+    regressions = []
+    for result in results:
+        expected = baseline.get(result.case)
+        if expected is None:
+            continue
+        ratio = result.aircraft_per_second / expected
+        if ratio < 1.0 - max_regression:
+            regressions.append(f"{result.case}: {ratio:.0%} of baseline throughput")
+    return regressions
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_FEED_SIZES))
+    parser.add_argument("--zones", type=int, nargs="+", default=list(DEFAULT_ZONE_COUNTS))
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=20260808)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--max-regression", type=float, default=0.3)
+    parser.add_argument("--update-baseline", action="store_true")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    results = run_suite(tuple(args.sizes), tuple(args.zones), args.repeats, args.seed)
+
+    print(f"{'case':<52} {'aircraft/s':>14}")
+    for result in results:
+        print(f"{result.case:<52} {result.aircraft_per_second:>14,.0f}")
+
+    if args.update_baseline:
+        payload = {
+            "version": BASELINE_FORMAT_VERSION,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "aircraft_per_second": {
+                result.case: round(result.aircraft_per_second, 1) for result in results
+            },
+        }
+        args.baseline.write_text(json.dumps(payload, indent=2) + "\n")
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"\nNo baseline at {args.baseline}; run with --update-baseline to create one.")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    if baseline.get("version") != BASELINE_FORMAT_VERSION:
+        print(f"Unsupported baseline version in {args.baseline}", file=sys.stderr)
+        return 2
+    regressions = compare(results, baseline["aircraft_per_second"], args.max_regression)
+    if regressions:
+        print("\nThroughput regressions:", file=sys.stderr)
+        for regression in regressions:
+            print(f"  {regression}", file=sys.stderr)
+        return 1
+    print(f"\nNo case regressed more than {args.max_regression:.0%} against {args.baseline}.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
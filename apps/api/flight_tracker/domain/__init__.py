@@ -1,6 +1,7 @@
 """Framework-independent Flight Tracker domain."""
 
 from .errors import (
+    AircraftRowsInvalid,
     DomainValidationError,
     FlightTrackerError,
     ProviderError,
@@ -8,9 +9,11 @@ from .errors import (
     ProviderResponseInvalid,
     ProviderTimeout,
     ProviderUnavailable,
+    RequestBudgetExhausted,
     ViewingZoneNotConfigured,
 )
 from .models import (
+    AircraftBatch,
     AircraftState,
     Device,
     DeviceStatus,
@@ -24,6 +27,8 @@ from .models import (
 )
 
 __all__ = [
+    "AircraftRowsInvalid",
+    "AircraftBatch",
     "AircraftState",
     "Device",
     "DeviceStatus",
@@ -37,6 +42,7 @@ __all__ = [
     "ProviderResponseInvalid",
     "ProviderTimeout",
     "ProviderUnavailable",
+    "RequestBudgetExhausted",
     "SnapshotStatus",
     "User",
     "ViewingZone",
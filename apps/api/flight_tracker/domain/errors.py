@@ -9,6 +9,17 @@ class DomainValidationError(FlightTrackerError, ValueError):
     """Raised when a domain value violates an invariant."""
 
 
+class AircraftRowsInvalid(DomainValidationError):
+    """Raised when bulk validation rejects rows of a columnar aircraft payload."""
+
+    def __init__(self, row_errors: dict[int, str]) -> None:
+        shown = "; ".join(f"row {row}: {error}" for row, error in list(row_errors.items())[:5])
+        hidden = len(row_errors) - 5
+        suffix = f"; and {hidden} more" if hidden > 0 else ""
+        super().__init__(f"{len(row_errors)} invalid aircraft row(s): {shown}{suffix}")
+        self.row_errors = row_errors
+
+
 class ViewingZoneNotConfigured(FlightTrackerError):
     """Raised when a device has no usable viewing zone."""
 
@@ -35,3 +46,7 @@ class ProviderRateLimited(ProviderUnavailable):
     def __init__(self, message: str, *, retry_after_seconds: int | None = None) -> None:
         super().__init__(message)
         self.retry_after_seconds = retry_after_seconds
+
+
+class RequestBudgetExhausted(ProviderRateLimited):
+    """A local request budget refused a call before it reached the provider."""
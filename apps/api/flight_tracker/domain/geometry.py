@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
-from math import asin, atan2, cos, degrees, isclose, radians, sin, sqrt
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from math import asin, atan2, cos, degrees, inf, isclose, pi, radians, sin, sqrt
+from typing import Any
 
-from .models import AircraftState, ViewingZone, VisibleAircraft
+from .models import AircraftBatch, AircraftState, ViewingZone, VisibleAircraft
 
 EARTH_RADIUS_KM = 6_371.0088
 BOUNDARY_EPSILON = 1e-9
+COMPILED_ZONE_CACHE_SIZE = 1_024
+# Pre-rejection only discards aircraft that miss a constraint by more than
+# these margins; anything closer falls through to the exact evaluation.
+PREFILTER_MARGIN_KM = 0.01
+PREFILTER_MARGIN_DEGREES = 0.01
 
 
 def great_circle_distance_km(
@@ -86,6 +94,290 @@ def destination_point(
     return degrees(destination_latitude), normalised_longitude
 
 
+def covering_spans_degrees(latitude: float, distance_km: float) -> tuple[float, float]:
+    """Return latitude/longitude half-spans of a box covering a spherical cap.
+
+    The longitude span is the widest offset reached anywhere on the cap, plus
+    the prefilter margin. Caps that touch a pole span every longitude and
+    report an infinite longitude span.
+    """
+
+    reach = distance_km / EARTH_RADIUS_KM
+    latitude_span = degrees(reach)
+    if reach < pi / 2.0 and abs(latitude) + latitude_span < 90.0:
+        longitude_span = (
+            degrees(asin(sin(reach) / cos(radians(latitude)))) + PREFILTER_MARGIN_DEGREES
+        )
+    else:
+        longitude_span = inf
+    return latitude_span, longitude_span
+
+
+def batch_within_distance(
+    aircraft: AircraftBatch, latitude: float, longitude: float, distance_km: float
+) -> AircraftBatch:
+    """Select the rows of a batch within a great-circle distance of a point.
+
+    A covering box on the position columns rejects most rows before any
+    haversine work, and no `AircraftState` is materialised.
+    """
+
+    latitude_span, longitude_span = covering_spans_degrees(
+        latitude, distance_km + PREFILTER_MARGIN_KM
+    )
+    rows = [
+        row
+        for row, (row_latitude, row_longitude) in enumerate(
+            zip(aircraft.latitude, aircraft.longitude, strict=True)
+        )
+        if abs(row_latitude - latitude) <= latitude_span
+        and abs((row_longitude - longitude + 540.0) % 360.0 - 180.0) <= longitude_span
+        and great_circle_distance_km(latitude, longitude, row_latitude, row_longitude)
+        <= distance_km
+    ]
+    return aircraft if len(rows) == len(aircraft) else aircraft.take(rows)
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledViewingZone:
+    """A viewing zone with its observer trigonometry and bounds resolved once.
+
+    Build instances with `compile_viewing_zone`, which caches them by zone
+    value. Zones are immutable and carry `updated_at`, so an edited zone is a
+    different cache key and never reuses stale constants.
+    """
+
+    zone: ViewingZone
+    latitude_rad: float
+    latitude_sin: float
+    latitude_cos: float
+    angle_limit_degrees: float
+    distance_floor_km: float
+    distance_ceiling_km: float
+    altitude_is_required: bool
+    latitude_span_degrees: float
+    longitude_span_degrees: float
+    outer_reach_cos: float
+    inner_reach_cos: float
+    centre_east: float
+    centre_north: float
+    wedge_cos: float
+
+    @classmethod
+    def from_zone(cls, zone: ViewingZone) -> CompiledViewingZone:
+        latitude_rad = radians(zone.latitude)
+        outer_reach = (zone.max_distance_km + PREFILTER_MARGIN_KM) / EARTH_RADIUS_KM
+        inner_reach = (zone.min_distance_km - PREFILTER_MARGIN_KM) / EARTH_RADIUS_KM
+        latitude_span, longitude_span = covering_spans_degrees(
+            zone.latitude, zone.max_distance_km + PREFILTER_MARGIN_KM
+        )
+        wedge_half_angle = zone.field_of_view_degrees / 2.0 + PREFILTER_MARGIN_DEGREES
+        centre_rad = radians(zone.bearing_degrees)
+        return cls(
+            zone=zone,
+            latitude_rad=latitude_rad,
+            latitude_sin=sin(latitude_rad),
+            latitude_cos=cos(latitude_rad),
+            angle_limit_degrees=zone.field_of_view_degrees / 2.0 + BOUNDARY_EPSILON,
+            distance_floor_km=zone.min_distance_km - BOUNDARY_EPSILON,
+            distance_ceiling_km=zone.max_distance_km + BOUNDARY_EPSILON,
+            altitude_is_required=(
+                zone.min_altitude_ft is not None or zone.max_altitude_ft is not None
+            ),
+            latitude_span_degrees=latitude_span,
+            longitude_span_degrees=longitude_span,
+            outer_reach_cos=cos(outer_reach) if outer_reach < pi else -2.0,
+            inner_reach_cos=cos(inner_reach) if inner_reach > 0.0 else 2.0,
+            centre_east=sin(centre_rad),
+            centre_north=cos(centre_rad),
+            wedge_cos=cos(radians(wedge_half_angle)) if wedge_half_angle < 180.0 else -2.0,
+        )
+
+    def may_contain(self, latitude: float, longitude: float) -> bool:
+        """Cheaply test whether a position could be inside the view.
+
+        A trig-free bounding box runs first, then the spherical cap and sector
+        wedge are checked with dot products instead of haversine and atan2.
+        Both are conservative by the prefilter margins: `False` is a definite
+        rejection, while `True` still requires the exact evaluation.
+        """
+
+        longitude_delta_degrees = self._box_offset(latitude, longitude)
+        if longitude_delta_degrees is None:
+            return False
+        return self._admits(*self._tangent_vector(latitude, longitude_delta_degrees))
+
+    def _box_offset(self, latitude: float, longitude: float) -> float | None:
+        """Return the wrapped longitude offset, or `None` outside the bounding box."""
+
+        if abs(latitude - self.zone.latitude) > self.latitude_span_degrees:
+            return None
+        longitude_delta_degrees = (longitude - self.zone.longitude + 540.0) % 360.0 - 180.0
+        if abs(longitude_delta_degrees) > self.longitude_span_degrees:
+            return None
+        return longitude_delta_degrees
+
+    def _tangent_vector(
+        self, latitude: float, longitude_delta_degrees: float
+    ) -> tuple[float, float, float]:
+        """Return the central-angle cosine and tangent-plane east/north components.
+
+        The east/north direction is exactly the initial great-circle bearing.
+        It depends only on the observer location, so zones sharing a location
+        can share one vector per aircraft.
+        """
+
+        latitude_rad = radians(latitude)
+        latitude_sin = sin(latitude_rad)
+        latitude_cos = cos(latitude_rad)
+        longitude_delta = radians(longitude_delta_degrees)
+        longitude_cos = cos(longitude_delta)
+        reach_cos = (
+            self.latitude_sin * latitude_sin + self.latitude_cos * latitude_cos * longitude_cos
+        )
+        east = sin(longitude_delta) * latitude_cos
+        north = self.latitude_cos * latitude_sin - self.latitude_sin * latitude_cos * longitude_cos
+        return reach_cos, east, north
+
+    def _admits(self, reach_cos: float, east: float, north: float) -> bool:
+        # A larger central-angle cosine means closer to the observer.
+        if not self.outer_reach_cos <= reach_cos <= self.inner_reach_cos:
+            return False
+        if self.wedge_cos > -1.0:
+            along = east * self.centre_east + north * self.centre_north
+            if along < self.wedge_cos * sqrt(east * east + north * north):
+                return False
+        return True
+
+    def _within_altitude(self, altitude_ft: int | None) -> bool:
+        if altitude_ft is None:
+            return not self.altitude_is_required
+        zone = self.zone
+        return (zone.min_altitude_ft is None or altitude_ft >= zone.min_altitude_ft) and (
+            zone.max_altitude_ft is None or altitude_ft <= zone.max_altitude_ft
+        )
+
+    def _measure(self, latitude: float, longitude: float) -> tuple[float, float]:
+        """Return the exact distance and bearing used for every final decision."""
+
+        latitude_rad = radians(latitude)
+        latitude_cos = cos(latitude_rad)
+        longitude_delta = radians(longitude - self.zone.longitude)
+
+        haversine = (
+            sin(radians(latitude - self.zone.latitude) / 2.0) ** 2
+            + self.latitude_cos * latitude_cos * sin(longitude_delta / 2.0) ** 2
+        )
+        distance_km = EARTH_RADIUS_KM * (
+            2.0 * atan2(sqrt(haversine), sqrt(max(0.0, 1.0 - haversine)))
+        )
+
+        y = sin(longitude_delta) * latitude_cos
+        x = self.latitude_cos * sin(latitude_rad) - self.latitude_sin * latitude_cos * cos(
+            longitude_delta
+        )
+        bearing = (degrees(atan2(y, x)) + 360.0) % 360.0
+        return distance_km, 0.0 if isclose(bearing, 360.0, abs_tol=1e-10) else bearing
+
+    def _accepts(self, distance_km: float, relative_bearing: float) -> bool:
+        return (
+            relative_bearing <= self.angle_limit_degrees
+            and self.distance_floor_km <= distance_km <= self.distance_ceiling_km
+        )
+
+    def _visible(
+        self, aircraft: AircraftState, distance_km: float, bearing: float
+    ) -> VisibleAircraft | None:
+        relative_bearing = angular_difference_degrees(self.zone.bearing_degrees, bearing)
+        if not self._accepts(distance_km, relative_bearing):
+            return None
+        return VisibleAircraft(
+            aircraft=aircraft,
+            flight_information=None,
+            distance_km=distance_km,
+            bearing_degrees=bearing,
+            relative_bearing_degrees=relative_bearing,
+            inside_view=True,
+        )
+
+    def evaluate(self, aircraft: AircraftState) -> VisibleAircraft:
+        """Evaluate one aircraft, keeping measurements for rejected aircraft too."""
+
+        distance_km, bearing = self._measure(aircraft.latitude, aircraft.longitude)
+        relative_bearing = angular_difference_degrees(self.zone.bearing_degrees, bearing)
+        return VisibleAircraft(
+            aircraft=aircraft,
+            flight_information=None,
+            distance_km=distance_km,
+            bearing_degrees=bearing,
+            relative_bearing_degrees=relative_bearing,
+            inside_view=(
+                self.zone.enabled
+                and self._accepts(distance_km, relative_bearing)
+                and self._within_altitude(aircraft.altitude_ft)
+            ),
+        )
+
+    def filter(self, aircraft_states: Iterable[AircraftState]) -> list[VisibleAircraft]:
+        """Return only visible aircraft, rejecting cheapest constraints first.
+
+        Altitude and `may_contain` discard most of a regional feed before any
+        haversine or atan2 work. Rejected aircraft never allocate a
+        `VisibleAircraft`, and candidates that pass are evaluated with the
+        same arithmetic as `evaluate`, so results are identical to filtering
+        its output.
+        """
+
+        if not self.zone.enabled:
+            return []
+
+        within_altitude = self._within_altitude
+        may_contain = self.may_contain
+        measure = self._measure
+        visible = self._visible
+        rows, resolve = _aircraft_rows(aircraft_states)
+
+        survivors: list[VisibleAircraft] = []
+        for row, latitude, longitude, altitude_ft in rows:
+            if not within_altitude(altitude_ft):
+                continue
+            if not may_contain(latitude, longitude):
+                continue
+            match = visible(resolve(row), *measure(latitude, longitude))
+            if match is not None:
+                survivors.append(match)
+        return survivors
+
+
+def _aircraft_rows(
+    aircraft_states: Iterable[AircraftState],
+) -> tuple[Iterator[tuple[Any, float, float, int | None]], Callable[[Any], AircraftState]]:
+    """Return position rows plus a resolver that materialises a surviving row.
+
+    Columnar batches are scanned without building `AircraftState` objects;
+    ordinary iterables resolve each row to the state it already is.
+    """
+
+    if isinstance(aircraft_states, AircraftBatch):
+        return aircraft_states.positions(), aircraft_states.__getitem__
+    rows = (
+        (aircraft, aircraft.latitude, aircraft.longitude, aircraft.altitude_ft)
+        for aircraft in aircraft_states
+    )
+    return rows, _same_aircraft
+
+
+def _same_aircraft(aircraft: AircraftState) -> AircraftState:
+    return aircraft
+
+
+@lru_cache(maxsize=COMPILED_ZONE_CACHE_SIZE)
+def compile_viewing_zone(zone: ViewingZone) -> CompiledViewingZone:
+    """Return the cached compiled evaluator for a viewing zone."""
+
+    return CompiledViewingZone.from_zone(zone)
+
+
 def evaluate_aircraft(aircraft: AircraftState, zone: ViewingZone) -> VisibleAircraft:
     """Evaluate one aircraft against all viewing-zone constraints.
 
@@ -94,43 +386,15 @@ def evaluate_aircraft(aircraft: AircraftState, zone: ViewingZone) -> VisibleAirc
     as inside the view unless its altitude is known.
     """
 
-    distance_km = great_circle_distance_km(
-        zone.latitude,
-        zone.longitude,
-        aircraft.latitude,
-        aircraft.longitude,
-    )
-    bearing_degrees = initial_bearing_degrees(
-        zone.latitude,
-        zone.longitude,
-        aircraft.latitude,
-        aircraft.longitude,
-    )
-    relative_bearing = angular_difference_degrees(zone.bearing_degrees, bearing_degrees)
+    return compile_viewing_zone(zone).evaluate(aircraft)
 
-    within_angle = relative_bearing <= zone.field_of_view_degrees / 2.0 + BOUNDARY_EPSILON
-    within_distance = (
-        zone.min_distance_km - BOUNDARY_EPSILON
-        <= distance_km
-        <= zone.max_distance_km + BOUNDARY_EPSILON
-    )
 
-    altitude_is_required = zone.min_altitude_ft is not None or zone.max_altitude_ft is not None
-    if aircraft.altitude_ft is None:
-        within_altitude = not altitude_is_required
-    else:
-        above_minimum = zone.min_altitude_ft is None or aircraft.altitude_ft >= zone.min_altitude_ft
-        below_maximum = zone.max_altitude_ft is None or aircraft.altitude_ft <= zone.max_altitude_ft
-        within_altitude = above_minimum and below_maximum
-
-    return VisibleAircraft(
-        aircraft=aircraft,
-        flight_information=None,
-        distance_km=distance_km,
-        bearing_degrees=bearing_degrees,
-        relative_bearing_degrees=relative_bearing,
-        inside_view=zone.enabled and within_angle and within_distance and within_altitude,
-    )
+def evaluate_aircraft_batch(
+    aircraft_states: Iterable[AircraftState], zone: ViewingZone
+) -> list[VisibleAircraft]:
+    """Evaluate a whole provider response and materialise only visible aircraft."""
+
+    return compile_viewing_zone(zone).filter(aircraft_states)
 
 
 def visible_aircraft(
@@ -138,5 +402,52 @@ def visible_aircraft(
 ) -> list[VisibleAircraft]:
     """Return only aircraft that satisfy every viewing-zone constraint."""
 
-    matches = (evaluate_aircraft(aircraft, zone) for aircraft in aircraft_states)
-    return [match for match in matches if match.inside_view]
+    return evaluate_aircraft_batch(aircraft_states, zone)
+
+
+def visible_aircraft_by_zone(
+    aircraft_states: Sequence[AircraftState], zones: Sequence[ViewingZone]
+) -> list[list[VisibleAircraft]]:
+    """Evaluate one aircraft list against many zones in a single pass.
+
+    The result holds one list of visible aircraft per zone, in zone order,
+    which is the sparse form of a zone-by-aircraft visibility matrix. Zones
+    that share an observer location share one tangent vector and one exact
+    distance/bearing per aircraft, so devices in the same building or street
+    cost little more than one. Each list equals `visible_aircraft` for its zone.
+    """
+
+    results: list[list[VisibleAircraft]] = [[] for _ in zones]
+    observers: dict[tuple[float, float], list[tuple[int, CompiledViewingZone]]] = {}
+    for position, zone in enumerate(zones):
+        if zone.enabled:
+            observers.setdefault((zone.latitude, zone.longitude), []).append(
+                (position, compile_viewing_zone(zone))
+            )
+
+    for members in observers.values():
+        # The bounding box depends only on the observer and reach, so the
+        # farthest-reaching zone bounds every zone at this location.
+        observer = max(
+            (compiled for _, compiled in members), key=lambda item: item.zone.max_distance_km
+        )
+        rows, resolve = _aircraft_rows(aircraft_states)
+        for row, latitude, longitude, altitude_ft in rows:
+            longitude_delta_degrees = observer._box_offset(latitude, longitude)
+            if longitude_delta_degrees is None:
+                continue
+            vector = observer._tangent_vector(latitude, longitude_delta_degrees)
+            candidates = [
+                (position, compiled)
+                for position, compiled in members
+                if compiled._within_altitude(altitude_ft) and compiled._admits(*vector)
+            ]
+            if not candidates:
+                continue
+            distance_km, bearing = observer._measure(latitude, longitude)
+            aircraft = resolve(row)
+            for position, compiled in candidates:
+                match = compiled._visible(aircraft, distance_km, bearing)
+                if match is not None:
+                    results[position].append(match)
+    return results
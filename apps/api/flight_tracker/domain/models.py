@@ -7,11 +7,16 @@ boundaries without making the domain depend on those technologies.
 
 from __future__ import annotations
 
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import StrEnum
+from math import isnan, nan
+from sys import intern
+from typing import Any
 
-from .errors import DomainValidationError
+from .errors import AircraftRowsInvalid, DomainValidationError
 
 
 def utc_now() -> datetime:
@@ -25,6 +30,9 @@ def _require_aware(value: datetime, field_name: str) -> None:
         raise DomainValidationError(f"{field_name} must be timezone-aware")
 
 
+_set_field = object.__setattr__
+
+
 def _validate_coordinates(latitude: float, longitude: float) -> None:
     if not -90.0 <= latitude <= 90.0:
         raise DomainValidationError("latitude must be between -90 and 90")
@@ -160,6 +168,7 @@ class AircraftState:
     ground_speed_knots: float | None = None
     vertical_speed_fpm: int | None = None
     track_degrees: float | None = None
+    extrapolated_at: datetime | None = None
 
     def __post_init__(self) -> None:
         if not self.provider.strip() or not self.provider_aircraft_id.strip():
@@ -170,6 +179,304 @@ class AircraftState:
             raise DomainValidationError("ground_speed_knots must not be negative")
         if self.track_degrees is not None and not 0.0 <= self.track_degrees < 360.0:
             raise DomainValidationError("track_degrees must be at least 0 and less than 360")
+        if self.extrapolated_at is not None:
+            _require_aware(self.extrapolated_at, "extrapolated_at")
+
+    @property
+    def is_extrapolated(self) -> bool:
+        """Whether the position is predicted rather than observed."""
+
+        return self.extrapolated_at is not None
+
+    @classmethod
+    def trusted(
+        cls,
+        provider: str,
+        provider_aircraft_id: str,
+        latitude: float,
+        longitude: float,
+        observed_at: datetime,
+        icao_hex: str | None = None,
+        callsign: str | None = None,
+        registration: str | None = None,
+        altitude_ft: int | None = None,
+        ground_speed_knots: float | None = None,
+        vertical_speed_fpm: int | None = None,
+        track_degrees: float | None = None,
+        extrapolated_at: datetime | None = None,
+    ) -> AircraftState:
+        """Build a state from values that were already validated in bulk.
+
+        This skips `__post_init__`, so callers must only pass values checked
+        by `AircraftBatch.validate` or an equivalent adapter-level pass.
+        """
+
+        state = object.__new__(cls)
+        _set_field(state, "provider", provider)
+        _set_field(state, "provider_aircraft_id", provider_aircraft_id)
+        _set_field(state, "latitude", latitude)
+        _set_field(state, "longitude", longitude)
+        _set_field(state, "observed_at", observed_at)
+        _set_field(state, "icao_hex", icao_hex)
+        _set_field(state, "callsign", callsign)
+        _set_field(state, "registration", registration)
+        _set_field(state, "altitude_ft", altitude_ft)
+        _set_field(state, "ground_speed_knots", ground_speed_knots)
+        _set_field(state, "vertical_speed_fpm", vertical_speed_fpm)
+        _set_field(state, "track_degrees", track_degrees)
+        _set_field(state, "extrapolated_at", extrapolated_at)
+        return state
+
+
+def _optional_column(values: Iterable[float | None]) -> array[float]:
+    return array("d", (nan if value is None else value for value in values))
+
+
+def _optional_int(value: float) -> int | None:
+    return None if isnan(value) else int(value)
+
+
+def _optional_float(value: float) -> float | None:
+    return None if isnan(value) else value
+
+
+def _is_blank(value: str) -> bool:
+    return not value.strip()
+
+
+def _invalid_latitude(value: float) -> bool:
+    return not -90.0 <= value <= 90.0
+
+
+def _invalid_longitude(value: float) -> bool:
+    return not -180.0 <= value <= 180.0
+
+
+def _is_naive(value: datetime) -> bool:
+    return value.tzinfo is None or value.utcoffset() is None
+
+
+def _is_naive_if_set(value: datetime | None) -> bool:
+    return value is not None and _is_naive(value)
+
+
+def _is_negative(value: float) -> bool:
+    return value < 0.0
+
+
+def _invalid_track(value: float) -> bool:
+    return not isnan(value) and not 0.0 <= value < 360.0
+
+
+def _interned(values: Iterable[str | None]) -> tuple[str | None, ...]:
+    return tuple(None if value is None else intern(value) for value in values)
+
+
+@dataclass(frozen=True, slots=True)
+class AircraftBatch:
+    """Columnar, struct-of-arrays form of many `AircraftState` records.
+
+    Numeric columns are compact `array("d")` buffers with NaN marking missing
+    optional values, and repeated strings are interned. `AircraftState` rows
+    are created only when indexed or iterated, so geometry can scan the
+    position columns of a large regional feed and materialise survivors.
+    """
+
+    provider: tuple[str, ...]
+    provider_aircraft_id: tuple[str, ...]
+    latitude: array[float]
+    longitude: array[float]
+    observed_at: tuple[datetime, ...]
+    icao_hex: tuple[str | None, ...]
+    callsign: tuple[str | None, ...]
+    registration: tuple[str | None, ...]
+    altitude_ft: array[float]
+    ground_speed_knots: array[float]
+    vertical_speed_fpm: array[float]
+    track_degrees: array[float]
+    extrapolated_at: tuple[datetime | None, ...]
+
+    def __post_init__(self) -> None:
+        size = len(self.provider_aircraft_id)
+        columns = (
+            self.provider,
+            self.latitude,
+            self.longitude,
+            self.observed_at,
+            self.icao_hex,
+            self.callsign,
+            self.registration,
+            self.altitude_ft,
+            self.ground_speed_knots,
+            self.vertical_speed_fpm,
+            self.track_degrees,
+            self.extrapolated_at,
+        )
+        if any(len(column) != size for column in columns):
+            raise DomainValidationError("aircraft batch columns must have equal lengths")
+
+    @classmethod
+    def from_columns(
+        cls,
+        *,
+        provider: Sequence[str],
+        provider_aircraft_id: Sequence[str],
+        latitude: Sequence[float],
+        longitude: Sequence[float],
+        observed_at: Sequence[datetime],
+        icao_hex: Sequence[str | None] | None = None,
+        callsign: Sequence[str | None] | None = None,
+        registration: Sequence[str | None] | None = None,
+        altitude_ft: Sequence[int | None] | None = None,
+        ground_speed_knots: Sequence[float | None] | None = None,
+        vertical_speed_fpm: Sequence[int | None] | None = None,
+        track_degrees: Sequence[float | None] | None = None,
+        extrapolated_at: Sequence[datetime | None] | None = None,
+        trusted: bool = False,
+    ) -> AircraftBatch:
+        """Build a batch from plain column sequences, using `None` for missing.
+
+        Every row is validated in one columnar pass unless `trusted` is set
+        by a caller whose values are already known to be valid.
+        """
+
+        missing = (None,) * len(provider_aircraft_id)
+        batch = cls(
+            provider=tuple(intern(value) for value in provider),
+            provider_aircraft_id=tuple(provider_aircraft_id),
+            latitude=array("d", latitude),
+            longitude=array("d", longitude),
+            observed_at=tuple(observed_at),
+            icao_hex=_interned(missing if icao_hex is None else icao_hex),
+            callsign=_interned(missing if callsign is None else callsign),
+            registration=_interned(missing if registration is None else registration),
+            altitude_ft=_optional_column(missing if altitude_ft is None else altitude_ft),
+            ground_speed_knots=_optional_column(
+                missing if ground_speed_knots is None else ground_speed_knots
+            ),
+            vertical_speed_fpm=_optional_column(
+                missing if vertical_speed_fpm is None else vertical_speed_fpm
+            ),
+            track_degrees=_optional_column(missing if track_degrees is None else track_degrees),
+            extrapolated_at=missing if extrapolated_at is None else tuple(extrapolated_at),
+        )
+        if not trusted:
+            batch.validate()
+        return batch
+
+    @classmethod
+    def from_states(cls, states: Iterable[AircraftState]) -> AircraftBatch:
+        rows = list(states)
+        return cls.from_columns(
+            provider=[state.provider for state in rows],
+            provider_aircraft_id=[state.provider_aircraft_id for state in rows],
+            latitude=[state.latitude for state in rows],
+            longitude=[state.longitude for state in rows],
+            observed_at=[state.observed_at for state in rows],
+            icao_hex=[state.icao_hex for state in rows],
+            callsign=[state.callsign for state in rows],
+            registration=[state.registration for state in rows],
+            altitude_ft=[state.altitude_ft for state in rows],
+            ground_speed_knots=[state.ground_speed_knots for state in rows],
+            vertical_speed_fpm=[state.vertical_speed_fpm for state in rows],
+            track_degrees=[state.track_degrees for state in rows],
+            extrapolated_at=[state.extrapolated_at for state in rows],
+            trusted=True,
+        )
+
+    def validate(self) -> None:
+        """Apply `AircraftState` invariants to every row in one columnar pass.
+
+        Each column is first checked as a whole; only a failing column is
+        rescanned to report offending rows through `AircraftRowsInvalid`.
+        """
+
+        checks: tuple[tuple[Sequence[Any], Callable[[Any], bool], str], ...] = (
+            (self.provider, _is_blank, "provider must not be empty"),
+            (self.provider_aircraft_id, _is_blank, "provider_aircraft_id must not be empty"),
+            (self.latitude, _invalid_latitude, "latitude must be between -90 and 90"),
+            (self.longitude, _invalid_longitude, "longitude must be between -180 and 180"),
+            (self.observed_at, _is_naive, "observed_at must be timezone-aware"),
+            (self.ground_speed_knots, _is_negative, "ground_speed_knots must not be negative"),
+            (
+                self.track_degrees,
+                _invalid_track,
+                "track_degrees must be at least 0 and less than 360",
+            ),
+            (self.extrapolated_at, _is_naive_if_set, "extrapolated_at must be timezone-aware"),
+        )
+        row_errors: dict[int, str] = {}
+        for column, is_invalid, message in checks:
+            # Repeated values such as provider names and poll timestamps are
+            # checked once each before falling back to a row scan.
+            distinct = set(column) if isinstance(column, tuple) else column
+            if not any(map(is_invalid, distinct)):
+                continue
+            for row, value in enumerate(column):
+                if is_invalid(value):
+                    row_errors.setdefault(row, message)
+        if row_errors:
+            raise AircraftRowsInvalid(dict(sorted(row_errors.items())))
+
+    def __len__(self) -> int:
+        return len(self.provider_aircraft_id)
+
+    def __getitem__(self, index: int) -> AircraftState:
+        """Materialise one row as an `AircraftState`."""
+
+        return AircraftState.trusted(
+            provider=self.provider[index],
+            provider_aircraft_id=self.provider_aircraft_id[index],
+            latitude=self.latitude[index],
+            longitude=self.longitude[index],
+            observed_at=self.observed_at[index],
+            icao_hex=self.icao_hex[index],
+            callsign=self.callsign[index],
+            registration=self.registration[index],
+            altitude_ft=_optional_int(self.altitude_ft[index]),
+            ground_speed_knots=_optional_float(self.ground_speed_knots[index]),
+            vertical_speed_fpm=_optional_int(self.vertical_speed_fpm[index]),
+            track_degrees=_optional_float(self.track_degrees[index]),
+            extrapolated_at=self.extrapolated_at[index],
+        )
+
+    def __iter__(self) -> Iterator[AircraftState]:
+        return (self[index] for index in range(len(self)))
+
+    def take(self, rows: Sequence[int]) -> AircraftBatch:
+        """Return the selected rows, in the given order, as a new batch."""
+
+        def pick[ValueT](column: Sequence[ValueT]) -> tuple[ValueT, ...]:
+            return tuple(column[row] for row in rows)
+
+        def pick_numbers(column: array[float]) -> array[float]:
+            return array("d", (column[row] for row in rows))
+
+        return AircraftBatch(
+            provider=pick(self.provider),
+            provider_aircraft_id=pick(self.provider_aircraft_id),
+            latitude=pick_numbers(self.latitude),
+            longitude=pick_numbers(self.longitude),
+            observed_at=pick(self.observed_at),
+            icao_hex=pick(self.icao_hex),
+            callsign=pick(self.callsign),
+            registration=pick(self.registration),
+            altitude_ft=pick_numbers(self.altitude_ft),
+            ground_speed_knots=pick_numbers(self.ground_speed_knots),
+            vertical_speed_fpm=pick_numbers(self.vertical_speed_fpm),
+            track_degrees=pick_numbers(self.track_degrees),
+            extrapolated_at=pick(self.extrapolated_at),
+        )
+
+    def positions(self) -> Iterator[tuple[int, float, float, int | None]]:
+        """Yield `(row, latitude, longitude, altitude_ft)` without materialising rows."""
+
+        return (
+            (index, latitude, longitude, _optional_int(altitude))
+            for index, (latitude, longitude, altitude) in enumerate(
+                zip(self.latitude, self.longitude, self.altitude_ft, strict=True)
+            )
+        )
 
 
 @dataclass(frozen=True, slots=True)
@@ -238,6 +545,8 @@ class DisplaySnapshot:
     refresh_after_seconds: int
     primary: DisplayAircraft | None = None
     secondary_count: int = 0
+    # True when served from a last-good aircraft set while a refresh is pending.
+    stale: bool = False
 
     def __post_init__(self) -> None:
         _require_aware(self.generated_at, "generated_at")
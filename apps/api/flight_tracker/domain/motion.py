@@ -0,0 +1,325 @@
+"""Dead-reckoning and sector-entry predictions from aircraft track and speed."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, replace
+from datetime import datetime
+from math import atan2, cos, degrees, isnan, radians, sin, sqrt
+from typing import Any
+
+from .geometry import EARTH_RADIUS_KM, angular_difference_degrees, destination_point
+from .models import AircraftBatch, AircraftState, ViewingZone
+
+KM_PER_NAUTICAL_MILE = 1.852
+# Crossing instants sit exactly on a boundary, so membership there is tested
+# with a tolerance that absorbs floating-point noise in the crossing solve.
+ENTRY_TOLERANCE_KM = 1e-6
+ENTRY_TOLERANCE_DEGREES = 1e-6
+
+
+def extrapolate_aircraft(
+    aircraft: AircraftState, at: datetime, *, max_age_seconds: float
+) -> AircraftState | None:
+    """Predict an aircraft's state at `at` by dead reckoning from its last fix.
+
+    The aircraft follows a great circle along `track_degrees` at
+    `ground_speed_knots`, and altitude follows `vertical_speed_fpm` when it
+    is known. `observed_at` keeps the real fix time while `extrapolated_at`
+    marks the prediction. Observations older than `max_age_seconds` return
+    `None`; aircraft without track or speed, or times at or before the fix,
+    are returned unchanged.
+    """
+
+    elapsed_seconds = (at - aircraft.observed_at).total_seconds()
+    if elapsed_seconds > max_age_seconds:
+        return None
+    if (
+        elapsed_seconds <= 0.0
+        or aircraft.track_degrees is None
+        or aircraft.ground_speed_knots is None
+    ):
+        return aircraft
+
+    distance_km = aircraft.ground_speed_knots * KM_PER_NAUTICAL_MILE * elapsed_seconds / 3_600.0
+    latitude, longitude = destination_point(
+        aircraft.latitude,
+        aircraft.longitude,
+        aircraft.track_degrees,
+        distance_km,
+    )
+    altitude_ft = aircraft.altitude_ft
+    if altitude_ft is not None and aircraft.vertical_speed_fpm is not None:
+        altitude_ft = max(
+            0, round(altitude_ft + aircraft.vertical_speed_fpm * elapsed_seconds / 60.0)
+        )
+    return replace(
+        aircraft,
+        latitude=latitude,
+        longitude=longitude,
+        altitude_ft=altitude_ft,
+        extrapolated_at=at,
+    )
+
+
+def extrapolate_batch(
+    aircraft: AircraftBatch, at: datetime, *, max_age_seconds: float
+) -> AircraftBatch:
+    """Apply `extrapolate_aircraft` to every row of a batch, column by column.
+
+    Rows older than `max_age_seconds` are dropped, and only the position,
+    altitude, and `extrapolated_at` columns are rebuilt.
+    """
+
+    kept: list[int] = []
+    latitudes = array("d")
+    longitudes = array("d")
+    altitudes = array("d")
+    extrapolated_at: list[datetime | None] = []
+    # A provider frame usually shares one fix time, so ages repeat.
+    ages: dict[datetime, float] = {}
+    for row, observed_at in enumerate(aircraft.observed_at):
+        elapsed_seconds = ages.get(observed_at)
+        if elapsed_seconds is None:
+            elapsed_seconds = ages[observed_at] = (at - observed_at).total_seconds()
+        if elapsed_seconds > max_age_seconds:
+            continue
+        kept.append(row)
+        latitude = aircraft.latitude[row]
+        longitude = aircraft.longitude[row]
+        altitude_ft = aircraft.altitude_ft[row]
+        track_degrees = aircraft.track_degrees[row]
+        ground_speed_knots = aircraft.ground_speed_knots[row]
+        if elapsed_seconds <= 0.0 or isnan(track_degrees) or isnan(ground_speed_knots):
+            latitudes.append(latitude)
+            longitudes.append(longitude)
+            altitudes.append(altitude_ft)
+            extrapolated_at.append(aircraft.extrapolated_at[row])
+            continue
+
+        distance_km = ground_speed_knots * KM_PER_NAUTICAL_MILE * elapsed_seconds / 3_600.0
+        latitude, longitude = destination_point(latitude, longitude, track_degrees, distance_km)
+        vertical_speed_fpm = aircraft.vertical_speed_fpm[row]
+        if not isnan(altitude_ft) and not isnan(vertical_speed_fpm):
+            altitude_ft = max(0, round(altitude_ft + vertical_speed_fpm * elapsed_seconds / 60.0))
+        latitudes.append(latitude)
+        longitudes.append(longitude)
+        altitudes.append(altitude_ft)
+        extrapolated_at.append(at)
+
+    selected = aircraft if len(kept) == len(aircraft) else aircraft.take(kept)
+    return replace(
+        selected,
+        latitude=latitudes,
+        longitude=longitudes,
+        altitude_ft=altitudes,
+        extrapolated_at=tuple(extrapolated_at),
+    )
+
+
+def seconds_until_visible(
+    aircraft: AircraftState, zone: ViewingZone, *, horizon_seconds: float
+) -> float | None:
+    """Predict when an aircraft first enters a zone within a time horizon.
+
+    Motion is linear in the observer's local east/north plane, which is
+    accurate at window-sector ranges and cheap enough to run over a whole
+    regional feed. Each constraint boundary (distance rings, sector edges,
+    altitude limits) yields at most two crossing times; the sector can only
+    be entered at one of them, so only those instants and the intervals
+    between them are tested. Returns `0.0` for aircraft already inside and
+    `None` when the aircraft does not enter before the horizon.
+    """
+
+    if not zone.enabled:
+        return None
+    path = _LocalPath.from_aircraft(aircraft, zone)
+
+    candidates = {0.0, horizon_seconds}
+    for radius in (zone.min_distance_km, zone.max_distance_km):
+        candidates.update(path.ring_crossings(radius))
+    if zone.field_of_view_degrees < 360.0:
+        half_view = zone.field_of_view_degrees / 2.0
+        for edge in (zone.bearing_degrees - half_view, zone.bearing_degrees + half_view):
+            candidates.update(path.ray_crossings(edge))
+    for limit in (zone.min_altitude_ft, zone.max_altitude_ft):
+        if limit is not None:
+            candidates.update(path.altitude_crossings(limit))
+
+    instants = sorted(time for time in candidates if 0.0 <= time <= horizon_seconds)
+    for index, instant in enumerate(instants):
+        if path.is_inside(instant, zone):
+            return instant
+        following = instants[index + 1] if index + 1 < len(instants) else None
+        if following is not None and path.is_inside((instant + following) / 2.0, zone):
+            return instant
+    return None
+
+
+def earliest_entry_seconds(
+    aircraft_states: Iterable[AircraftState], zone: ViewingZone, *, horizon_seconds: float
+) -> float | None:
+    """Return the soonest entry time of any aircraft not already in the zone.
+
+    Aircraft that cannot cover the gap to the outer ring before the horizon,
+    even flying straight at the observer, are skipped before any path work.
+    """
+
+    km_per_degree = radians(1.0) * EARTH_RADIUS_KM
+    east_scale = km_per_degree * cos(radians(zone.latitude))
+    earliest: float | None = None
+    rows, resolve = _motion_rows(aircraft_states)
+    for row, latitude, longitude, track_degrees, ground_speed_knots in rows:
+        travel_km = 0.0
+        if track_degrees is not None and ground_speed_knots is not None:
+            travel_km = ground_speed_knots * KM_PER_NAUTICAL_MILE * horizon_seconds / 3_600
+        reach_km = zone.max_distance_km + travel_km
+        north_km = (latitude - zone.latitude) * km_per_degree
+        if abs(north_km) > reach_km:
+            continue
+        east_km = ((longitude - zone.longitude + 540.0) % 360.0 - 180.0) * east_scale
+        if north_km * north_km + east_km * east_km > reach_km * reach_km:
+            continue
+        entry = seconds_until_visible(resolve(row), zone, horizon_seconds=horizon_seconds)
+        if entry is not None and entry > 0.0 and (earliest is None or entry < earliest):
+            earliest = entry
+    return earliest
+
+
+MotionRow = tuple[Any, float, float, float | None, float | None]
+
+
+def _motion_rows(
+    aircraft_states: Iterable[AircraftState],
+) -> tuple[Iterator[MotionRow], Callable[[Any], AircraftState]]:
+    """Return position and motion rows plus a resolver for rows that need path work.
+
+    Columnar batches are scanned without building `AircraftState` objects.
+    """
+
+    if isinstance(aircraft_states, AircraftBatch):
+        columns = zip(
+            aircraft_states.latitude,
+            aircraft_states.longitude,
+            aircraft_states.track_degrees,
+            aircraft_states.ground_speed_knots,
+            strict=True,
+        )
+        batch_rows = (
+            (
+                row,
+                latitude,
+                longitude,
+                None if isnan(track) else track,
+                None if isnan(speed) else speed,
+            )
+            for row, (latitude, longitude, track, speed) in enumerate(columns)
+        )
+        return batch_rows, aircraft_states.__getitem__
+    state_rows = (
+        (
+            aircraft,
+            aircraft.latitude,
+            aircraft.longitude,
+            aircraft.track_degrees,
+            aircraft.ground_speed_knots,
+        )
+        for aircraft in aircraft_states
+    )
+    return state_rows, _same_aircraft
+
+
+def _same_aircraft(aircraft: AircraftState) -> AircraftState:
+    return aircraft
+
+
+@dataclass(frozen=True, slots=True)
+class _LocalPath:
+    """Linear motion in kilometres east/north of an observer, per second."""
+
+    east_km: float
+    north_km: float
+    east_km_per_second: float
+    north_km_per_second: float
+    altitude_ft: float | None
+    climb_ft_per_second: float
+
+    @classmethod
+    def from_aircraft(cls, aircraft: AircraftState, zone: ViewingZone) -> _LocalPath:
+        longitude_delta = (aircraft.longitude - zone.longitude + 540.0) % 360.0 - 180.0
+        east_km = radians(longitude_delta) * EARTH_RADIUS_KM * cos(radians(zone.latitude))
+        north_km = radians(aircraft.latitude - zone.latitude) * EARTH_RADIUS_KM
+        east_speed = north_speed = 0.0
+        if aircraft.track_degrees is not None and aircraft.ground_speed_knots is not None:
+            speed = aircraft.ground_speed_knots * KM_PER_NAUTICAL_MILE / 3_600.0
+            track = radians(aircraft.track_degrees)
+            east_speed = speed * sin(track)
+            north_speed = speed * cos(track)
+        climb = 0.0
+        if aircraft.altitude_ft is not None and aircraft.vertical_speed_fpm is not None:
+            climb = aircraft.vertical_speed_fpm / 60.0
+        return cls(
+            east_km=east_km,
+            north_km=north_km,
+            east_km_per_second=east_speed,
+            north_km_per_second=north_speed,
+            altitude_ft=None if aircraft.altitude_ft is None else float(aircraft.altitude_ft),
+            climb_ft_per_second=climb,
+        )
+
+    def ring_crossings(self, radius_km: float) -> tuple[float, ...]:
+        a = self.east_km_per_second**2 + self.north_km_per_second**2
+        if a == 0.0:
+            return ()
+        b = 2.0 * (
+            self.east_km * self.east_km_per_second + self.north_km * self.north_km_per_second
+        )
+        c = self.east_km**2 + self.north_km**2 - radius_km**2
+        discriminant = b * b - 4.0 * a * c
+        if discriminant < 0.0:
+            return ()
+        root = sqrt(discriminant)
+        return ((-b - root) / (2.0 * a), (-b + root) / (2.0 * a))
+
+    def ray_crossings(self, bearing_degrees: float) -> tuple[float, ...]:
+        bearing = radians(bearing_degrees)
+        direction_east, direction_north = sin(bearing), cos(bearing)
+        # The path crosses the line through the observer when the cross
+        # product of the line direction and the position changes sign.
+        rate = direction_east * self.north_km_per_second - direction_north * self.east_km_per_second
+        if rate == 0.0:
+            return ()
+        offset = direction_east * self.north_km - direction_north * self.east_km
+        return (-offset / rate,)
+
+    def altitude_crossings(self, limit_ft: int) -> tuple[float, ...]:
+        if self.altitude_ft is None or self.climb_ft_per_second == 0.0:
+            return ()
+        return ((limit_ft - self.altitude_ft) / self.climb_ft_per_second,)
+
+    def is_inside(self, seconds: float, zone: ViewingZone) -> bool:
+        if self.altitude_ft is None:
+            if zone.min_altitude_ft is not None or zone.max_altitude_ft is not None:
+                return False
+        else:
+            altitude = self.altitude_ft + self.climb_ft_per_second * seconds
+            if zone.min_altitude_ft is not None and altitude < zone.min_altitude_ft - 1e-6:
+                return False
+            if zone.max_altitude_ft is not None and altitude > zone.max_altitude_ft + 1e-6:
+                return False
+
+        east = self.east_km + self.east_km_per_second * seconds
+        north = self.north_km + self.north_km_per_second * seconds
+        distance = sqrt(east * east + north * north)
+        if not (
+            zone.min_distance_km - ENTRY_TOLERANCE_KM
+            <= distance
+            <= zone.max_distance_km + ENTRY_TOLERANCE_KM
+        ):
+            return False
+        if zone.field_of_view_degrees >= 360.0 or distance == 0.0:
+            return True
+        bearing = degrees(atan2(east, north)) % 360.0
+        relative = angular_difference_degrees(zone.bearing_degrees, bearing)
+        return relative <= zone.field_of_view_degrees / 2.0 + ENTRY_TOLERANCE_DEGREES
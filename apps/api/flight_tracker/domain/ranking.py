@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import heapq
 from collections.abc import Iterable
 from dataclasses import replace
+from operator import itemgetter
 
 from .models import ViewingZone, VisibleAircraft
 
@@ -49,6 +51,10 @@ def relevance_score(match: VisibleAircraft, zone: ViewingZone) -> float:
     return round(score, 6)
 
 
+def _ranking_key(match: VisibleAircraft, score: float) -> tuple[float, float, str]:
+    return (-score, match.distance_km, match.aircraft.provider_aircraft_id)
+
+
 def rank_visible_aircraft(
     matches: Iterable[VisibleAircraft], zone: ViewingZone
 ) -> list[VisibleAircraft]:
@@ -59,11 +65,28 @@ def rank_visible_aircraft(
         for match in matches
         if match.inside_view
     ]
-    return sorted(
-        scored,
-        key=lambda match: (
-            -match.relevance_score,
-            match.distance_km,
-            match.aircraft.provider_aircraft_id,
-        ),
-    )
+    return sorted(scored, key=lambda match: _ranking_key(match, match.relevance_score))
+
+
+def top_ranked_aircraft(
+    matches: Iterable[VisibleAircraft], zone: ViewingZone, top_k: int
+) -> tuple[list[VisibleAircraft], int]:
+    """Return the `top_k` most relevant aircraft and the total visible count.
+
+    The winners equal the head of `rank_visible_aircraft`, including its
+    tie-break, but scoring does not copy every match and a heap selects the
+    winners without sorting the whole list. Only winners gain a score copy.
+    """
+
+    if top_k < 0:
+        raise ValueError("top_k must not be negative")
+
+    total = 0
+    scored: list[tuple[tuple[float, float, str], VisibleAircraft]] = []
+    for match in matches:
+        if match.inside_view:
+            total += 1
+            scored.append((_ranking_key(match, relevance_score(match, zone)), match))
+
+    winners = heapq.nsmallest(top_k, scored, key=itemgetter(0))
+    return [replace(match, relevance_score=-key[0]) for key, match in winners], total
@@ -1,12 +1,72 @@
 """Replaceable flight-data provider adapters."""
 
-from .base import FlightDataProvider, GeographicArea, ProviderCapability
-from .mock import MockFlightDataProvider, MockScenario
+from .base import (
+    ENRICHMENT_FAN_OUT_LIMIT,
+    FlightDataProvider,
+    GeographicArea,
+    ProviderCapability,
+    SupportsAircraftBatch,
+    SupportsFlightInformationBatch,
+    enrichment_key,
+    fan_out_flight_information,
+    fetch_aircraft_batch,
+    fetch_flight_information_many,
+    fresh_provider_error,
+)
+from .caching import CacheStats, CachingFlightDataProvider, region_area, snap_to_region
+from .circuit_breaker import CircuitBreaker, CircuitBreakerFlightDataProvider, CircuitState
+from .coalescing import CoalescingFlightDataProvider, SingleFlight
+from .composite import CompositeFlightDataProvider, aircraft_identity
+from .dead_reckoning import DeadReckoningFlightDataProvider
+from .enrichment_cache import EnrichmentCachingFlightDataProvider
+from .mock import (
+    LatencyDistribution,
+    MockConditions,
+    MockFlightDataProvider,
+    MockLatency,
+    MockScenario,
+)
+from .rate_limit import BudgetStatus, RateLimitedFlightDataProvider, RequestBudget
+from .recording import (
+    RecordingFlightDataProvider,
+    ReplayFlightDataProvider,
+    read_recording,
+)
 
 __all__ = [
+    "ENRICHMENT_FAN_OUT_LIMIT",
+    "BudgetStatus",
+    "CacheStats",
+    "CachingFlightDataProvider",
+    "CircuitBreaker",
+    "CircuitBreakerFlightDataProvider",
+    "CircuitState",
+    "CoalescingFlightDataProvider",
+    "CompositeFlightDataProvider",
+    "DeadReckoningFlightDataProvider",
+    "EnrichmentCachingFlightDataProvider",
     "FlightDataProvider",
     "GeographicArea",
+    "LatencyDistribution",
+    "MockConditions",
     "MockFlightDataProvider",
+    "MockLatency",
     "MockScenario",
     "ProviderCapability",
+    "RateLimitedFlightDataProvider",
+    "RecordingFlightDataProvider",
+    "ReplayFlightDataProvider",
+    "RequestBudget",
+    "SingleFlight",
+    "SupportsAircraftBatch",
+    "SupportsFlightInformationBatch",
+    "aircraft_identity",
+    "enrichment_key",
+    "fan_out_flight_information",
+    "fetch_aircraft_batch",
+    "fetch_flight_information_many",
+    "fresh_provider_error",
+    "read_recording",
+    "region_area",
+    "snap_to_region",
 ]
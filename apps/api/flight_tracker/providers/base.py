@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from copy import copy
 from dataclasses import dataclass
 from enum import StrEnum
 from typing import Protocol, runtime_checkable
 
-from flight_tracker.domain.errors import DomainValidationError
-from flight_tracker.domain.models import AircraftState, FlightInformation
+from flight_tracker.domain.errors import DomainValidationError, ProviderError
+from flight_tracker.domain.models import AircraftBatch, AircraftState, FlightInformation
+
+# Concurrent single lookups allowed when fanning out batch enrichment.
+ENRICHMENT_FAN_OUT_LIMIT = 4
 
 
 class ProviderCapability(StrEnum):
@@ -54,3 +60,92 @@ class FlightDataProvider(Protocol):
     async def get_aircraft(self, area: GeographicArea) -> list[AircraftState]: ...
 
     async def get_flight_information(self, aircraft: AircraftState) -> FlightInformation | None: ...
+
+
+@runtime_checkable
+class SupportsAircraftBatch(Protocol):
+    """Optional capability for adapters that can return columnar live state."""
+
+    async def get_aircraft_batch(self, area: GeographicArea) -> AircraftBatch: ...
+
+
+async def fetch_aircraft_batch(provider: FlightDataProvider, area: GeographicArea) -> AircraftBatch:
+    """Fetch live state as columns, converting from rows for row-only adapters."""
+
+    if isinstance(provider, SupportsAircraftBatch):
+        return await provider.get_aircraft_batch(area)
+    return AircraftBatch.from_states(await provider.get_aircraft(area))
+
+
+@runtime_checkable
+class SupportsFlightInformationBatch(Protocol):
+    """Optional capability for adapters that can enrich several aircraft at once.
+
+    Results follow the input order. A lookup that finds nothing or fails on
+    its own is None; ProviderError is raised only when the whole request fails.
+    """
+
+    async def get_flight_information_many(
+        self, aircraft: Sequence[AircraftState]
+    ) -> list[FlightInformation | None]: ...
+
+
+async def fan_out_flight_information(
+    lookup: Callable[[AircraftState], Awaitable[FlightInformation | None]],
+    aircraft: Sequence[AircraftState],
+    *,
+    concurrency: int = ENRICHMENT_FAN_OUT_LIMIT,
+) -> list[FlightInformation | None]:
+    """Run single enrichment lookups concurrently, failed lookups becoming None."""
+
+    if concurrency <= 0:
+        raise ValueError("concurrency must be positive")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(state: AircraftState) -> FlightInformation | None:
+        async with semaphore:
+            try:
+                return await lookup(state)
+            except ProviderError:
+                return None
+
+    return list(await asyncio.gather(*(bounded(state) for state in aircraft)))
+
+
+async def fetch_flight_information_many(
+    provider: FlightDataProvider,
+    aircraft: Sequence[AircraftState],
+    *,
+    concurrency: int = ENRICHMENT_FAN_OUT_LIMIT,
+) -> list[FlightInformation | None]:
+    """Enrich several aircraft in one request, fanning out for single-lookup adapters."""
+
+    if isinstance(provider, SupportsFlightInformationBatch):
+        return await provider.get_flight_information_many(aircraft)
+    return await fan_out_flight_information(
+        provider.get_flight_information, aircraft, concurrency=concurrency
+    )
+
+
+def fresh_provider_error[ErrorT: ProviderError](error: ErrorT) -> ErrorT:
+    """Copy a stored provider error so it can be raised again cleanly.
+
+    Raising one instance repeatedly appends every raise to its traceback and
+    keeps those frames alive; a copy keeps the message and attributes such as
+    `retry_after_seconds` but starts without a traceback.
+    """
+
+    return copy(error)
+
+
+def enrichment_key(aircraft: AircraftState) -> tuple[str, str, str]:
+    """Identify the flight whose enrichment an aircraft state would look up."""
+
+    for field, value in (
+        ("icao_hex", aircraft.icao_hex),
+        ("registration", aircraft.registration),
+        ("callsign", aircraft.callsign),
+    ):
+        if value:
+            return aircraft.provider, field, value.upper()
+    return aircraft.provider, "provider_aircraft_id", aircraft.provider_aircraft_id
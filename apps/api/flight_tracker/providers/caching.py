@@ -0,0 +1,200 @@
+"""Regional live-state caching in front of a flight-data provider."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from math import ceil, floor
+from time import monotonic
+
+from flight_tracker.domain.geometry import batch_within_distance, great_circle_distance_km
+from flight_tracker.domain.models import AircraftBatch, AircraftState, FlightInformation
+
+from .base import (
+    FlightDataProvider,
+    GeographicArea,
+    ProviderCapability,
+    fetch_aircraft_batch,
+    fetch_flight_information_many,
+)
+from .coalescing import SingleFlight
+
+GridCell = tuple[int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Point-in-time cache counters for monitoring."""
+
+    hits: int
+    misses: int
+    entries: int
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def snap_to_region(
+    area: GeographicArea, *, cell_degrees: float, radius_step_km: float
+) -> tuple[GridCell, int, GeographicArea]:
+    """Snap a request to the grid cell holding its centre and whole radius steps.
+
+    Returns the cell, the radius in steps, and the area a fetch must cover so
+    it answers every request in that cell up to that radius.
+    """
+
+    cell = (floor(area.center_latitude / cell_degrees), floor(area.center_longitude / cell_degrees))
+    radius_steps = max(1, ceil(area.radius_km / radius_step_km))
+    return (
+        cell,
+        radius_steps,
+        region_area(cell, radius_steps, cell_degrees=cell_degrees, radius_step_km=radius_step_km),
+    )
+
+
+def region_area(
+    cell: GridCell, radius_steps: int, *, cell_degrees: float, radius_step_km: float
+) -> GeographicArea:
+    """Return the area covering every request in `cell` up to `radius_steps`."""
+
+    row, column = cell
+    south = max(row * cell_degrees, -90.0)
+    north = min((row + 1) * cell_degrees, 90.0)
+    west = column * cell_degrees
+    centre_latitude = (south + north) / 2.0
+    centre_longitude = min(west + cell_degrees / 2.0, 180.0)
+    # Any request centre inside the cell is at most this far from the
+    # region centre, so adding the request radius covers the request.
+    cell_reach_km = max(
+        great_circle_distance_km(centre_latitude, centre_longitude, latitude, west)
+        for latitude in (south, north)
+    )
+    return GeographicArea(
+        center_latitude=centre_latitude,
+        center_longitude=centre_longitude,
+        radius_km=cell_reach_km + radius_steps * radius_step_km,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _Bucket:
+    fetched_at: float
+    radius_steps: int
+    aircraft: AircraftBatch
+
+
+class CachingFlightDataProvider:
+    """Serve live-state queries from briefly cached regional buckets.
+
+    Each requested area is snapped to the grid cell containing its centre and
+    a radius rounded up to `radius_step_km`. A cell's cached bucket covers
+    every request in that cell up to its radius, so a cell is fetched
+    upstream at most once per `ttl_seconds` unless a wider request arrives,
+    and each request is answered by filtering the bucket locally. Buckets are
+    held as columnar `AircraftBatch` frames, so a cached regional feed costs
+    no `AircraftState` objects until a caller asks for rows. Concurrent
+    misses for the same bucket share a single upstream fetch.
+    Enrichment passes straight through.
+    """
+
+    def __init__(
+        self,
+        provider: FlightDataProvider,
+        *,
+        ttl_seconds: float = 10.0,
+        cell_degrees: float = 0.5,
+        radius_step_km: float = 25.0,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if ttl_seconds <= 0.0 or cell_degrees <= 0.0 or radius_step_km <= 0.0:
+            raise ValueError("cache ttl, cell size, and radius step must be positive")
+        self.provider = provider
+        self.ttl_seconds = ttl_seconds
+        self.cell_degrees = cell_degrees
+        self.radius_step_km = radius_step_km
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._buckets: dict[GridCell, _Bucket] = {}
+        self._fetches: SingleFlight[tuple[GridCell, int], AircraftBatch] = SingleFlight()
+
+    @property
+    def name(self) -> str:
+        return self.provider.name
+
+    @property
+    def capabilities(self) -> frozenset[ProviderCapability]:
+        return self.provider.capabilities
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(hits=self.hits, misses=self.misses, entries=len(self._buckets))
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+    def bucket_for(self, area: GeographicArea) -> tuple[GridCell, int, GeographicArea]:
+        """Return the grid cell, radius steps, and covering area for a request."""
+
+        return snap_to_region(
+            area, cell_degrees=self.cell_degrees, radius_step_km=self.radius_step_km
+        )
+
+    async def get_aircraft(self, area: GeographicArea) -> list[AircraftState]:
+        return list(await self.get_aircraft_batch(area))
+
+    async def get_aircraft_batch(self, area: GeographicArea) -> AircraftBatch:
+        cell, radius_steps, bucket_area = self.bucket_for(area)
+        now = self.clock()
+        cached = self._buckets.get(cell)
+        if cached is not None and now - cached.fetched_at >= self.ttl_seconds:
+            cached = None
+
+        if cached is not None and cached.radius_steps >= radius_steps:
+            self.hits += 1
+            aircraft = cached.aircraft
+        else:
+            self.misses += 1
+            if cached is not None:
+                # Widen the fresh bucket so both radii keep hitting one entry.
+                radius_steps = max(radius_steps, cached.radius_steps)
+                bucket_area = self._bucket_area(cell, radius_steps)
+            aircraft = await self._fetches.run(
+                (cell, radius_steps), lambda: self._fetch(cell, radius_steps, bucket_area, now)
+            )
+        return batch_within_distance(
+            aircraft, area.center_latitude, area.center_longitude, area.radius_km
+        )
+
+    async def get_flight_information(self, aircraft: AircraftState) -> FlightInformation | None:
+        return await self.provider.get_flight_information(aircraft)
+
+    async def get_flight_information_many(
+        self, aircraft: Sequence[AircraftState]
+    ) -> list[FlightInformation | None]:
+        return await fetch_flight_information_many(self.provider, aircraft)
+
+    async def _fetch(
+        self, cell: GridCell, radius_steps: int, bucket_area: GeographicArea, now: float
+    ) -> AircraftBatch:
+        aircraft = await fetch_aircraft_batch(self.provider, bucket_area)
+        self._prune(now)
+        self._buckets[cell] = _Bucket(now, radius_steps, aircraft)
+        return aircraft
+
+    def _bucket_area(self, cell: GridCell, radius_steps: int) -> GeographicArea:
+        return region_area(
+            cell, radius_steps, cell_degrees=self.cell_degrees, radius_step_km=self.radius_step_km
+        )
+
+    def _prune(self, now: float) -> None:
+        expired = [
+            cell
+            for cell, bucket in self._buckets.items()
+            if now - bucket.fetched_at >= self.ttl_seconds
+        ]
+        for cell in expired:
+            del self._buckets[cell]
@@ -0,0 +1,174 @@
+"""Fail fast while an upstream provider is unavailable."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+from enum import StrEnum
+from time import monotonic
+
+from flight_tracker.domain.errors import (
+    ProviderRateLimited,
+    ProviderResponseInvalid,
+    ProviderUnavailable,
+)
+from flight_tracker.domain.models import AircraftBatch, AircraftState, FlightInformation
+
+from .base import (
+    FlightDataProvider,
+    GeographicArea,
+    ProviderCapability,
+    SupportsFlightInformationBatch,
+    fan_out_flight_information,
+    fetch_aircraft_batch,
+)
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Track recent call outcomes and decide whether upstream may be called.
+
+    The circuit opens once at least `minimum_calls` of the last `window_size`
+    outcomes are recorded and the share of failures reaches
+    `failure_rate_threshold`. After `open_seconds` it is half-open: a single
+    probe call is let through, closing the circuit on success and reopening
+    it on failure. Unavailable or invalid responses, timeouts, and calls
+    cancelled by a caller's deadline all count as failures. Rate limits are
+    not failures; request budgets own those.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_rate_threshold: float = 0.5,
+        window_size: int = 10,
+        minimum_calls: int = 5,
+        open_seconds: float = 30.0,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if not 0.0 < failure_rate_threshold <= 1.0:
+            raise ValueError("failure_rate_threshold must be in (0, 1]")
+        if not 0 < minimum_calls <= window_size:
+            raise ValueError("minimum_calls must be between 1 and window_size")
+        if open_seconds <= 0.0:
+            raise ValueError("open_seconds must be positive")
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.open_seconds = open_seconds
+        self.clock = clock
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> CircuitState:
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if self.clock() - self._opened_at < self.open_seconds:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    async def call[ResultT](self, operation: Callable[[], Awaitable[ResultT]]) -> ResultT:
+        state = self.state
+        if state is CircuitState.OPEN or (state is CircuitState.HALF_OPEN and self._probing):
+            raise ProviderUnavailable("provider circuit is open")
+
+        probing = state is CircuitState.HALF_OPEN
+        self._probing = probing
+        try:
+            result = await operation()
+        except ProviderRateLimited:
+            raise
+        except (
+            ProviderUnavailable,
+            ProviderResponseInvalid,
+            TimeoutError,
+            asyncio.CancelledError,
+        ):
+            self._record(failed=True, probing=probing)
+            raise
+        finally:
+            if probing:
+                self._probing = False
+        self._record(failed=False, probing=probing)
+        return result
+
+    def _record(self, *, failed: bool, probing: bool) -> None:
+        if probing:
+            self._outcomes.clear()
+            self._opened_at = self.clock() if failed else None
+            return
+        self._outcomes.append(failed)
+        failures = sum(self._outcomes)
+        if (
+            len(self._outcomes) >= self.minimum_calls
+            and failures / len(self._outcomes) >= self.failure_rate_threshold
+        ):
+            self._outcomes.clear()
+            self._opened_at = self.clock()
+
+
+class CircuitBreakerFlightDataProvider:
+    """Stop calling a failing provider so requests fail in microseconds.
+
+    Live state and enrichment have independent circuits, so an enrichment
+    outage does not stop live positions. While a circuit is open, calls raise
+    ProviderUnavailable without reaching upstream.
+    """
+
+    def __init__(
+        self,
+        provider: FlightDataProvider,
+        *,
+        failure_rate_threshold: float = 0.5,
+        window_size: int = 10,
+        minimum_calls: int = 5,
+        open_seconds: float = 30.0,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.provider = provider
+        self.live_circuit, self.enrichment_circuit = (
+            CircuitBreaker(
+                failure_rate_threshold=failure_rate_threshold,
+                window_size=window_size,
+                minimum_calls=minimum_calls,
+                open_seconds=open_seconds,
+                clock=clock,
+            )
+            for _ in range(2)
+        )
+
+    @property
+    def name(self) -> str:
+        return self.provider.name
+
+    @property
+    def capabilities(self) -> frozenset[ProviderCapability]:
+        return self.provider.capabilities
+
+    async def get_aircraft(self, area: GeographicArea) -> list[AircraftState]:
+        return await self.live_circuit.call(lambda: self.provider.get_aircraft(area))
+
+    async def get_aircraft_batch(self, area: GeographicArea) -> AircraftBatch:
+        return await self.live_circuit.call(lambda: fetch_aircraft_batch(self.provider, area))
+
+    async def get_flight_information(self, aircraft: AircraftState) -> FlightInformation | None:
+        return await self.enrichment_circuit.call(
+            lambda: self.provider.get_flight_information(aircraft)
+        )
+
+    async def get_flight_information_many(
+        self, aircraft: Sequence[AircraftState]
+    ) -> list[FlightInformation | None]:
+        provider = self.provider
+        if not isinstance(provider, SupportsFlightInformationBatch):
+            return await fan_out_flight_information(self.get_flight_information, aircraft)
+        return await self.enrichment_circuit.call(
+            lambda: provider.get_flight_information_many(aircraft)
+        )
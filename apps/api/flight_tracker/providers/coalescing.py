@@ -0,0 +1,201 @@
+"""Share one upstream call between concurrent identical provider requests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine, Hashable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from flight_tracker.domain.errors import ProviderError
+from flight_tracker.domain.models import AircraftBatch, AircraftState, FlightInformation
+
+from .base import (
+    FlightDataProvider,
+    GeographicArea,
+    ProviderCapability,
+    SupportsFlightInformationBatch,
+    enrichment_key,
+    fan_out_flight_information,
+    fetch_aircraft_batch,
+)
+
+
+@dataclass(slots=True)
+class _Flight[ResultT]:
+    task: asyncio.Task[ResultT]
+    waiters: int = field(default=0)
+
+
+class SingleFlight[KeyT: Hashable, ResultT]:
+    """Run at most one operation per key at a time, sharing its outcome.
+
+    Callers that arrive while a key is in flight await the same task and
+    receive its result or exception. Cancelling one caller leaves the task
+    running for the others; the task itself is cancelled only once every
+    caller has gone. Keys are forgotten as soon as their task finishes or is
+    abandoned, so a later call starts a fresh operation rather than joining
+    one that is being cancelled.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[KeyT, _Flight[ResultT]] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._flights
+
+    async def run(
+        self, key: KeyT, operation: Callable[[], Coroutine[Any, Any, ResultT]]
+    ) -> ResultT:
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._start(key, operation())
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            self._leave(key, flight)
+
+    async def run_many(
+        self,
+        keys: Sequence[KeyT],
+        operation: Callable[[list[KeyT]], Coroutine[Any, Any, Mapping[KeyT, ResultT]]],
+        *,
+        recover: Callable[[Exception], ResultT] | None = None,
+    ) -> list[ResultT]:
+        """Run `operation` once for the keys not already in flight, sharing each key.
+
+        Keys in flight join their existing operation. The rest are fetched by
+        one `operation(keys)` call whose per-key results are shared, so single
+        `run` calls arriving meanwhile join the batch instead of repeating it.
+        The batch is cancelled once every key it serves has been abandoned.
+
+        A failure of the batch itself is raised. `recover` maps a failure of
+        a joined operation to a result for that key alone; without it that
+        failure is raised too.
+        """
+
+        fresh = dict.fromkeys(key for key in keys if key not in self._flights)
+        if fresh:
+            batch = _SharedBatch(asyncio.create_task(operation(list(fresh))), len(fresh))
+            for key in fresh:
+                self._start(key, batch.pick(key)).task.add_done_callback(batch.release)
+        flights = [(key, self._flights[key]) for key in keys]
+        for _key, flight in flights:
+            flight.waiters += 1
+        try:
+            outcomes = await asyncio.gather(
+                *(asyncio.shield(flight.task) for _key, flight in flights), return_exceptions=True
+            )
+        finally:
+            for key, flight in flights:
+                self._leave(key, flight)
+        results: list[ResultT] = []
+        for (key, _flight), outcome in zip(flights, outcomes, strict=True):
+            if isinstance(outcome, Exception) and recover is not None and key not in fresh:
+                results.append(recover(outcome))
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results.append(outcome)
+        return results
+
+    def _start(self, key: KeyT, operation: Coroutine[Any, Any, ResultT]) -> _Flight[ResultT]:
+        flight = _Flight(asyncio.create_task(operation))
+        self._flights[key] = flight
+        flight.task.add_done_callback(lambda _task: self._forget(key, flight))
+        return flight
+
+    def _leave(self, key: KeyT, flight: _Flight[ResultT]) -> None:
+        flight.waiters -= 1
+        if flight.waiters == 0 and not flight.task.done():
+            flight.task.cancel()
+            self._forget(key, flight)
+
+    def _forget(self, key: KeyT, flight: _Flight[ResultT]) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+
+@dataclass(slots=True)
+class _SharedBatch[KeyT, ResultT]:
+    task: asyncio.Task[Mapping[KeyT, ResultT]]
+    keys: int
+
+    async def pick(self, key: KeyT) -> ResultT:
+        # Shielded so that abandoning one key leaves the batch for the others.
+        return (await asyncio.shield(self.task))[key]
+
+    def release(self, _flight: asyncio.Task[ResultT]) -> None:
+        self.keys -= 1
+        if self.keys == 0 and not self.task.done():
+            self.task.cancel()
+
+
+class CoalescingFlightDataProvider:
+    """Collapse concurrent identical live-state and enrichment requests.
+
+    Devices polling the same area at the same moment share one upstream
+    `get_aircraft` call, and concurrent lookups for the same flight share one
+    `get_flight_information` call. Batch enrichment joins lookups already in
+    flight and sends the rest upstream together; a joined lookup that fails
+    leaves only its aircraft unanswered. Nothing is retained once a
+    call finishes.
+    """
+
+    def __init__(self, provider: FlightDataProvider) -> None:
+        self.provider = provider
+        self._aircraft: SingleFlight[GeographicArea, list[AircraftState]] = SingleFlight()
+        self._batches: SingleFlight[GeographicArea, AircraftBatch] = SingleFlight()
+        self._enrichment: SingleFlight[tuple[str, str, str], FlightInformation | None] = (
+            SingleFlight()
+        )
+
+    @property
+    def name(self) -> str:
+        return self.provider.name
+
+    @property
+    def capabilities(self) -> frozenset[ProviderCapability]:
+        return self.provider.capabilities
+
+    async def get_aircraft(self, area: GeographicArea) -> list[AircraftState]:
+        # Callers get their own list so one cannot mutate another's result.
+        return list(await self._aircraft.run(area, lambda: self.provider.get_aircraft(area)))
+
+    async def get_aircraft_batch(self, area: GeographicArea) -> AircraftBatch:
+        # Batches are immutable, so every caller can share the same one.
+        return await self._batches.run(area, lambda: fetch_aircraft_batch(self.provider, area))
+
+    async def get_flight_information(self, aircraft: AircraftState) -> FlightInformation | None:
+        return await self._enrichment.run(
+            enrichment_key(aircraft), lambda: self.provider.get_flight_information(aircraft)
+        )
+
+    async def get_flight_information_many(
+        self, aircraft: Sequence[AircraftState]
+    ) -> list[FlightInformation | None]:
+        provider = self.provider
+        if not isinstance(provider, SupportsFlightInformationBatch):
+            return await fan_out_flight_information(self.get_flight_information, aircraft)
+        states = {enrichment_key(state): state for state in aircraft}
+
+        async def look_up(
+            keys: list[tuple[str, str, str]],
+        ) -> dict[tuple[str, str, str], FlightInformation | None]:
+            found = await provider.get_flight_information_many([states[key] for key in keys])
+            return dict(zip(keys, found, strict=True))
+
+        found = await self._enrichment.run_many(list(states), look_up, recover=_unanswered)
+        shared = dict(zip(states, found, strict=True))
+        return [shared[enrichment_key(state)] for state in aircraft]
+
+
+def _unanswered(error: Exception) -> None:
+    # A joined single lookup that failed leaves its aircraft unanswered.
+    if isinstance(error, ProviderError):
+        return None
+    raise error
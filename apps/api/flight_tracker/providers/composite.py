@@ -0,0 +1,157 @@
+"""Combine several flight-data providers into one."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Sequence
+
+from flight_tracker.domain.errors import ProviderError, ProviderTimeout
+from flight_tracker.domain.models import AircraftState, FlightInformation
+
+from .base import (
+    FlightDataProvider,
+    GeographicArea,
+    ProviderCapability,
+    fetch_flight_information_many,
+)
+
+
+def aircraft_identity(aircraft: AircraftState) -> tuple[str, ...]:
+    """Identify one physical aircraft across providers where the feed allows it."""
+
+    if aircraft.icao_hex:
+        return ("icao_hex", aircraft.icao_hex.upper())
+    if aircraft.registration:
+        return ("registration", aircraft.registration.upper().replace("-", ""))
+    return ("provider", aircraft.provider, aircraft.provider_aircraft_id)
+
+
+class CompositeFlightDataProvider:
+    """Query several providers concurrently and merge what they see.
+
+    Aircraft reported by more than one provider are de-duplicated by ICAO hex
+    or registration, keeping the freshest observation; ties go to the
+    provider listed first. A failing provider is skipped as long as another
+    one answers. Enrichment asks the provider that reported the aircraft
+    first and falls back through the rest in order; batch enrichment sends
+    each provider one request per round for the aircraft still unanswered.
+    With `provider_timeout_seconds` set, a provider that has not answered in
+    time counts as failed with ProviderTimeout, so one slow adapter cannot
+    hold back the others' results.
+    """
+
+    def __init__(
+        self,
+        providers: Sequence[FlightDataProvider],
+        *,
+        name: str = "composite",
+        provider_timeout_seconds: float | None = None,
+    ) -> None:
+        if not providers:
+            raise ValueError("a composite provider needs at least one provider")
+        if provider_timeout_seconds is not None and provider_timeout_seconds <= 0.0:
+            raise ValueError("provider_timeout_seconds must be positive")
+        self.providers = tuple(providers)
+        self.provider_timeout_seconds = provider_timeout_seconds
+        self._name = name
+        self._capabilities = frozenset().union(*(provider.capabilities for provider in providers))
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def capabilities(self) -> frozenset[ProviderCapability]:
+        return self._capabilities
+
+    async def get_aircraft(self, area: GeographicArea) -> list[AircraftState]:
+        responses = await asyncio.gather(
+            *(self._bounded(provider, provider.get_aircraft(area)) for provider in self.providers),
+            return_exceptions=True,
+        )
+        merged: dict[tuple[str, ...], AircraftState] = {}
+        errors: list[ProviderError] = []
+        for response in responses:
+            if isinstance(response, ProviderError):
+                errors.append(response)
+                continue
+            if isinstance(response, BaseException):
+                raise response
+            for aircraft in response:
+                identity = aircraft_identity(aircraft)
+                current = merged.get(identity)
+                if current is None or aircraft.observed_at > current.observed_at:
+                    merged[identity] = aircraft
+        if len(errors) == len(self.providers):
+            raise errors[0]
+        return list(merged.values())
+
+    async def get_flight_information(self, aircraft: AircraftState) -> FlightInformation | None:
+        ordered = self._enrichment_order(aircraft)
+        errors: list[ProviderError] = []
+        for provider in ordered:
+            try:
+                information = await self._bounded(
+                    provider, provider.get_flight_information(aircraft)
+                )
+            except ProviderError as error:
+                errors.append(error)
+                continue
+            if information is not None:
+                return information
+        if len(errors) == len(ordered):
+            raise errors[0]
+        return None
+
+    async def get_flight_information_many(
+        self, aircraft: Sequence[AircraftState]
+    ) -> list[FlightInformation | None]:
+        results: list[FlightInformation | None] = [None] * len(aircraft)
+        orders = [self._enrichment_order(state) for state in aircraft]
+        pending = list(range(len(aircraft)))
+        for attempt in range(len(self.providers)):
+            rounds: dict[int, tuple[FlightDataProvider, list[int]]] = {}
+            for position in pending:
+                provider = orders[position][attempt]
+                rounds.setdefault(id(provider), (provider, []))[1].append(position)
+            responses = await asyncio.gather(
+                *(
+                    self._bounded(
+                        provider,
+                        fetch_flight_information_many(provider, [aircraft[p] for p in positions]),
+                    )
+                    for provider, positions in rounds.values()
+                ),
+                return_exceptions=True,
+            )
+            pending = []
+            for (_provider, positions), response in zip(rounds.values(), responses, strict=True):
+                if isinstance(response, ProviderError):
+                    pending.extend(positions)
+                    continue
+                if isinstance(response, BaseException):
+                    raise response
+                for position, information in zip(positions, response, strict=True):
+                    if information is None:
+                        pending.append(position)
+                    else:
+                        results[position] = information
+            if not pending:
+                break
+        return results
+
+    def _enrichment_order(self, aircraft: AircraftState) -> list[FlightDataProvider]:
+        return sorted(self.providers, key=lambda provider: provider.name != aircraft.provider)
+
+    async def _bounded[ResultT](
+        self, provider: FlightDataProvider, call: Awaitable[ResultT]
+    ) -> ResultT:
+        if self.provider_timeout_seconds is None:
+            return await call
+        try:
+            async with asyncio.timeout(self.provider_timeout_seconds):
+                return await call
+        except TimeoutError:
+            raise ProviderTimeout(
+                f"{provider.name} did not answer within {self.provider_timeout_seconds:g}s"
+            ) from None
@@ -0,0 +1,79 @@
+"""Serve recent provider frames between polls by dead reckoning."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from datetime import UTC, datetime
+
+from flight_tracker.domain.models import AircraftBatch, AircraftState, FlightInformation
+from flight_tracker.domain.motion import extrapolate_batch
+
+from .base import (
+    FlightDataProvider,
+    GeographicArea,
+    ProviderCapability,
+    fetch_aircraft_batch,
+    fetch_flight_information_many,
+)
+
+
+class DeadReckoningFlightDataProvider:
+    """Reuse a provider frame for several polls, moving aircraft along track.
+
+    A frame fetched for an area is reused for `reuse_for_seconds`; during that
+    window each request extrapolates the cached aircraft to the current time
+    instead of calling upstream. Aircraft whose fix is older than
+    `max_extrapolation_seconds` are dropped rather than predicted further.
+    Frames are kept and extrapolated as columnar `AircraftBatch` data.
+    Enrichment passes straight through.
+    """
+
+    def __init__(
+        self,
+        provider: FlightDataProvider,
+        *,
+        reuse_for_seconds: float = 90.0,
+        max_extrapolation_seconds: float = 120.0,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        if reuse_for_seconds < 0.0 or max_extrapolation_seconds < 0.0:
+            raise ValueError("dead-reckoning limits must not be negative")
+        self.provider = provider
+        self.reuse_for_seconds = reuse_for_seconds
+        self.max_extrapolation_seconds = max_extrapolation_seconds
+        self.clock = clock or (lambda: datetime.now(UTC))
+        self._frames: dict[GeographicArea, tuple[datetime, AircraftBatch]] = {}
+
+    @property
+    def name(self) -> str:
+        return self.provider.name
+
+    @property
+    def capabilities(self) -> frozenset[ProviderCapability]:
+        return self.provider.capabilities
+
+    async def get_aircraft(self, area: GeographicArea) -> list[AircraftState]:
+        return list(await self.get_aircraft_batch(area))
+
+    async def get_aircraft_batch(self, area: GeographicArea) -> AircraftBatch:
+        now = self.clock()
+        frame = self._frames.get(area)
+        if frame is not None and (now - frame[0]).total_seconds() < self.reuse_for_seconds:
+            return extrapolate_batch(frame[1], now, max_age_seconds=self.max_extrapolation_seconds)
+
+        states = await fetch_aircraft_batch(self.provider, area)
+        self._frames = {
+            key: cached
+            for key, cached in self._frames.items()
+            if (now - cached[0]).total_seconds() < self.reuse_for_seconds
+        }
+        self._frames[area] = (now, states)
+        return states
+
+    async def get_flight_information(self, aircraft: AircraftState) -> FlightInformation | None:
+        return await self.provider.get_flight_information(aircraft)
+
+    async def get_flight_information_many(
+        self, aircraft: Sequence[AircraftState]
+    ) -> list[FlightInformation | None]:
+        return await fetch_flight_information_many(self.provider, aircraft)
@@ -0,0 +1,214 @@
+"""Bounded caching of flight enrichment in front of a provider."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from time import monotonic
+
+from flight_tracker.domain.errors import (
+    ProviderError,
+    ProviderRateLimited,
+    RequestBudgetExhausted,
+)
+from flight_tracker.domain.models import AircraftBatch, AircraftState, FlightInformation
+
+from .base import (
+    FlightDataProvider,
+    GeographicArea,
+    ProviderCapability,
+    SupportsFlightInformationBatch,
+    enrichment_key,
+    fan_out_flight_information,
+    fetch_aircraft_batch,
+    fresh_provider_error,
+)
+from .caching import CacheStats
+from .coalescing import SingleFlight
+
+EnrichmentKey = tuple[str, str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    expires_at: float
+    information: FlightInformation | None = None
+    error: ProviderError | None = None
+
+
+class EnrichmentCachingFlightDataProvider:
+    """Answer repeated enrichment lookups from a bounded TTL/LRU cache.
+
+    Entries are keyed by ICAO hex, then registration, then callsign, and kept
+    for `ttl_seconds`. Lookups that found nothing or failed with a provider
+    error are cached for the shorter `negative_ttl_seconds`, or for as long as
+    a rate-limited provider asks, and failures are raised again on a hit.
+    Refusals by a local request budget are not cached, since they say nothing
+    about upstream. At most `max_entries` are kept, evicting the least
+    recently used. Batch lookups answer hits locally and send only the misses
+    upstream, in one request when the provider supports it, raising if that
+    request fails; single and batch misses for the same key share one
+    upstream lookup. Live state passes straight through.
+    """
+
+    def __init__(
+        self,
+        provider: FlightDataProvider,
+        *,
+        ttl_seconds: float = 3_600.0,
+        negative_ttl_seconds: float = 120.0,
+        max_entries: int = 4_096,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if ttl_seconds <= 0.0 or negative_ttl_seconds <= 0.0:
+            raise ValueError("enrichment cache ttls must be positive")
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.provider = provider
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[EnrichmentKey, _Entry] = OrderedDict()
+        self._lookups: SingleFlight[EnrichmentKey, _Entry] = SingleFlight()
+
+    @property
+    def name(self) -> str:
+        return self.provider.name
+
+    @property
+    def capabilities(self) -> frozenset[ProviderCapability]:
+        return self.provider.capabilities
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            entries=len(self._entries),
+            evictions=self.evictions,
+        )
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def get_aircraft(self, area: GeographicArea) -> list[AircraftState]:
+        return await self.provider.get_aircraft(area)
+
+    async def get_aircraft_batch(self, area: GeographicArea) -> AircraftBatch:
+        return await fetch_aircraft_batch(self.provider, area)
+
+    async def get_flight_information(self, aircraft: AircraftState) -> FlightInformation | None:
+        key = enrichment_key(aircraft)
+        entry = self._cached(key)
+        if entry is None:
+            self.misses += 1
+            entry = await self._lookups.run(key, lambda: self._look_up(key, aircraft))
+        if entry.error is not None:
+            raise fresh_provider_error(entry.error)
+        return entry.information
+
+    async def get_flight_information_many(
+        self, aircraft: Sequence[AircraftState]
+    ) -> list[FlightInformation | None]:
+        results: list[FlightInformation | None] = [None] * len(aircraft)
+        missing: dict[EnrichmentKey, list[int]] = {}
+        for position, state in enumerate(aircraft):
+            key = enrichment_key(state)
+            entry = self._cached(key)
+            if entry is not None:
+                results[position] = entry.information
+            else:
+                self.misses += 1
+                missing.setdefault(key, []).append(position)
+        if not missing:
+            return results
+
+        requested = {key: aircraft[positions[0]] for key, positions in missing.items()}
+        provider = self.provider
+        if isinstance(provider, SupportsFlightInformationBatch):
+
+            async def look_up(keys: list[EnrichmentKey]) -> dict[EnrichmentKey, _Entry]:
+                return await self._look_up_many(provider, {key: requested[key] for key in keys})
+
+            entries = await self._lookups.run_many(
+                list(requested), look_up, recover=self._failed_entry
+            )
+            found = [entry.information for entry in entries]
+        else:
+            found = await fan_out_flight_information(
+                self._look_up_information, list(requested.values())
+            )
+
+        for positions, information in zip(missing.values(), found, strict=True):
+            for position in positions:
+                results[position] = information
+        return results
+
+    def _cached(self, key: EnrichmentKey) -> _Entry | None:
+        entry = self._entries.get(key)
+        if entry is None or self.clock() >= entry.expires_at:
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    async def _look_up_information(self, aircraft: AircraftState) -> FlightInformation | None:
+        key = enrichment_key(aircraft)
+        entry = await self._lookups.run(key, lambda: self._look_up(key, aircraft))
+        return entry.information
+
+    async def _look_up(self, key: EnrichmentKey, aircraft: AircraftState) -> _Entry:
+        try:
+            information = await self.provider.get_flight_information(aircraft)
+        except ProviderError as error:
+            return self._store_error(key, error)
+        return self._store(key, _Entry(self._expiry(information), information=information))
+
+    async def _look_up_many(
+        self,
+        provider: SupportsFlightInformationBatch,
+        requested: dict[EnrichmentKey, AircraftState],
+    ) -> dict[EnrichmentKey, _Entry]:
+        try:
+            found = await provider.get_flight_information_many(list(requested.values()))
+        except ProviderError as error:
+            for key in requested:
+                self._store_error(key, error)
+            raise
+        return {
+            key: self._store(key, _Entry(self._expiry(information), information=information))
+            for key, information in zip(requested, found, strict=True)
+        }
+
+    def _failed_entry(self, error: Exception) -> _Entry:
+        # A joined lookup that failed leaves only its own aircraft unanswered.
+        if not isinstance(error, ProviderError):
+            raise error
+        return _Entry(self.clock(), error=error)
+
+    def _store_error(self, key: EnrichmentKey, error: ProviderError) -> _Entry:
+        entry = _Entry(self._expiry(error), error=error)
+        if isinstance(error, RequestBudgetExhausted):
+            return entry
+        return self._store(key, entry)
+
+    def _expiry(self, outcome: FlightInformation | ProviderError | None) -> float:
+        if isinstance(outcome, FlightInformation):
+            return self.clock() + self.ttl_seconds
+        lifetime = self.negative_ttl_seconds
+        if isinstance(outcome, ProviderRateLimited) and outcome.retry_after_seconds:
+            lifetime = max(lifetime, outcome.retry_after_seconds)
+        return self.clock() + lifetime
+
+    def _store(self, key: EnrichmentKey, entry: _Entry) -> _Entry:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return entry
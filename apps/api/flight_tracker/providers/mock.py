@@ -2,22 +2,319 @@
 
 from __future__ import annotations
 
+import asyncio
+from array import array
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime, timedelta
 from enum import StrEnum
+from math import asin, atan2, cos, degrees, exp, nan, radians, sin, sqrt
 from random import Random
+from string import ascii_uppercase
 
-from flight_tracker.domain.errors import ProviderRateLimited, ProviderTimeout
-from flight_tracker.domain.geometry import destination_point
-from flight_tracker.domain.models import AircraftState, FlightInformation
+from flight_tracker.domain.errors import (
+    ProviderRateLimited,
+    ProviderTimeout,
+    ProviderUnavailable,
+)
+from flight_tracker.domain.geometry import (
+    EARTH_RADIUS_KM,
+    batch_within_distance,
+    covering_spans_degrees,
+    destination_point,
+    great_circle_distance_km,
+    initial_bearing_degrees,
+)
+from flight_tracker.domain.models import AircraftBatch, AircraftState, FlightInformation
 
 from .base import GeographicArea, ProviderCapability
 
+MAX_SYNTHETIC_AIRCRAFT = 100_000
+# Default airspace for synthetic traffic: 150 km around west London.
+SYNTHETIC_TRAFFIC_AREA = GeographicArea(
+    center_latitude=51.477, center_longitude=-0.210, radius_km=150.0
+)
+_SYNTHETIC_AIRLINES = (
+    ("SKY", "FT", "Window Air"),
+    ("CLD", "CU", "Cumulus Airways"),
+    ("JET", "JS", "Jetstream Express"),
+    ("NMB", "NB", "Nimbus Air"),
+)
+_KM_PER_SECOND_PER_KNOT = 1.852 / 3_600
+# Widens each route's endpoint box to cover the great circle's bulge between them.
+_ROUTE_BOX_MARGIN_DEGREES = 0.1
+_MINIMUM_ALTITUDE_FT = 1_000
+_MAXIMUM_ALTITUDE_FT = 43_000
+
 
 class MockScenario(StrEnum):
     NORMAL = "normal"
     EMPTY = "empty"
     TIMEOUT = "timeout"
     RATE_LIMITED = "rate_limited"
+    SLOW = "slow"
+    LONG_TAIL = "long_tail"
+    FLAKY = "flaky"
+    SLOW_ENRICHMENT = "slow_enrichment"
+    PARTIAL = "partial"
+
+
+class LatencyDistribution(StrEnum):
+    FIXED = "fixed"
+    LOGNORMAL = "lognormal"
+    LONG_TAIL = "long_tail"
+
+
+@dataclass(frozen=True, slots=True)
+class MockLatency:
+    """A response-time distribution sampled from the provider's seeded RNG.
+
+    `median_seconds` is the typical delay. LOGNORMAL spreads it by `sigma`;
+    LONG_TAIL does the same and multiplies a `tail_probability` fraction of
+    samples by `tail_multiplier`.
+    """
+
+    distribution: LatencyDistribution = LatencyDistribution.FIXED
+    median_seconds: float = 0.0
+    sigma: float = 0.5
+    tail_probability: float = 0.05
+    tail_multiplier: float = 10.0
+
+    def __post_init__(self) -> None:
+        if self.median_seconds < 0:
+            raise ValueError("median_seconds must not be negative")
+        if self.sigma < 0:
+            raise ValueError("sigma must not be negative")
+        if not 0 <= self.tail_probability <= 1:
+            raise ValueError("tail_probability must be between 0 and 1")
+        if self.tail_multiplier < 1:
+            raise ValueError("tail_multiplier must be at least 1")
+
+    def sample(self, rng: Random) -> float:
+        if self.median_seconds == 0 or self.distribution is LatencyDistribution.FIXED:
+            return self.median_seconds
+        delay = self.median_seconds * exp(rng.gauss(0.0, self.sigma))
+        if self.distribution is LatencyDistribution.LONG_TAIL and (
+            rng.random() < self.tail_probability
+        ):
+            delay *= self.tail_multiplier
+        return delay
+
+
+@dataclass(frozen=True, slots=True)
+class MockConditions:
+    """Upstream behaviour injected around every mock response.
+
+    Each call first waits for a sampled latency, then fails with
+    `ProviderUnavailable` at `failure_rate`. Surviving responses drop optional
+    fields from a `partial_rate` fraction of aircraft and enrichment records.
+    """
+
+    live_latency: MockLatency = field(default_factory=MockLatency)
+    enrichment_latency: MockLatency = field(default_factory=MockLatency)
+    failure_rate: float = 0.0
+    partial_rate: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not 0 <= self.failure_rate <= 1:
+            raise ValueError("failure_rate must be between 0 and 1")
+        if not 0 <= self.partial_rate <= 1:
+            raise ValueError("partial_rate must be between 0 and 1")
+
+
+_SCENARIO_CONDITIONS = {
+    MockScenario.SLOW: MockConditions(
+        live_latency=MockLatency(LatencyDistribution.LOGNORMAL, 0.25, sigma=0.6),
+        enrichment_latency=MockLatency(LatencyDistribution.LOGNORMAL, 0.4, sigma=0.6),
+    ),
+    MockScenario.LONG_TAIL: MockConditions(
+        live_latency=MockLatency(LatencyDistribution.LONG_TAIL, 0.1, tail_multiplier=20.0),
+        enrichment_latency=MockLatency(LatencyDistribution.LONG_TAIL, 0.15, tail_multiplier=20.0),
+    ),
+    MockScenario.FLAKY: MockConditions(
+        live_latency=MockLatency(median_seconds=0.05),
+        enrichment_latency=MockLatency(median_seconds=0.05),
+        failure_rate=0.2,
+    ),
+    MockScenario.SLOW_ENRICHMENT: MockConditions(
+        enrichment_latency=MockLatency(LatencyDistribution.LOGNORMAL, 1.5, sigma=0.5),
+    ),
+    MockScenario.PARTIAL: MockConditions(partial_rate=0.3),
+}
+
+_NO_CONDITIONS = MockConditions()
+
+
+def _synthetic_registration(index: int) -> str:
+    letters = []
+    for _ in range(4):
+        index, remainder = divmod(index, 26)
+        letters.append(chr(ord("A") + remainder))
+    return "G-" + "".join(reversed(letters))
+
+
+def _synthetic_flight(index: int) -> tuple[tuple[str, str, str], str]:
+    """Return the airline and a flight designator unique to each synthetic index."""
+
+    airline_count = len(_SYNTHETIC_AIRLINES)
+    serial = index // airline_count
+    # Numbers run 100-9999 per airline, then repeat with a letter suffix.
+    suffix = "" if serial < 9_900 else ascii_uppercase[serial // 9_900 - 1]
+    return _SYNTHETIC_AIRLINES[index % airline_count], f"{100 + serial % 9_900}{suffix}"
+
+
+@dataclass(frozen=True, slots=True)
+class _SyntheticFleet:
+    """Static per-aircraft parameters of a seeded synthetic traffic sample.
+
+    Every aircraft flies a great-circle chord across the traffic area at a
+    fixed speed, wrapping back to its entry point when it leaves, so traffic
+    density stays constant however long the simulation runs. Climbing and
+    descending aircraft change altitude with the distance flown since entry,
+    restarting from their entry altitude on each pass, and report level
+    flight once they reach the altitude limits.
+    """
+
+    identifiers: list[str]
+    icao_hexes: list[str]
+    callsigns: list[str]
+    registrations: list[str]
+    entry_sin_latitudes: list[float]
+    entry_cos_latitudes: list[float]
+    entry_longitudes: list[float]
+    heading_sines: list[float]
+    heading_cosines: list[float]
+    tracks: list[float]
+    path_lengths_km: list[float]
+    phases_km: list[float]
+    speeds_km_per_second: list[float]
+    ground_speeds: list[float]
+    base_altitudes: list[int]
+    vertical_speeds: list[int]
+    route_boxes: list[tuple[float, float, float, float]]
+
+    @classmethod
+    def generate(cls, seed: int, area: GeographicArea, size: int) -> _SyntheticFleet:
+        rng = Random(f"{seed}:{area.center_latitude}:{area.center_longitude}:{area.radius_km}")
+        radius = area.radius_km
+        fleet = cls(*([] for _ in range(17)))
+        for index in range(size):
+            heading = rng.uniform(0.0, 360.0)
+            offset = radius * (2.0 * rng.random() - 1.0)
+            half_chord = sqrt(max(radius * radius - offset * offset, 0.0))
+            # Enter and leave on the area's edge, passing `offset` km beside
+            # the centre, and fly the great circle between the two points.
+            entry_latitude, entry_longitude = destination_point(
+                area.center_latitude,
+                area.center_longitude,
+                (heading + degrees(atan2(offset, -half_chord))) % 360.0,
+                radius,
+            )
+            exit_latitude, exit_longitude = destination_point(
+                area.center_latitude,
+                area.center_longitude,
+                (heading + degrees(atan2(offset, half_chord))) % 360.0,
+                radius,
+            )
+            heading = initial_bearing_degrees(
+                entry_latitude, entry_longitude, exit_latitude, exit_longitude
+            )
+            path_length = great_circle_distance_km(
+                entry_latitude, entry_longitude, exit_latitude, exit_longitude
+            )
+            if rng.random() < 0.6:
+                altitude = rng.randrange(30_000, 41_001, 1_000)
+                vertical_speed = 0
+                ground_speed = rng.uniform(420.0, 520.0)
+            else:
+                altitude = rng.randrange(3_000, 25_001, 500)
+                vertical_speed = rng.choice((-1, 1)) * rng.randrange(500, 2_501, 100)
+                ground_speed = rng.uniform(220.0, 380.0)
+            (prefix, _, _), designator = _synthetic_flight(index)
+            entry_latitude_rad = radians(entry_latitude)
+            heading_rad = radians(heading)
+
+            fleet.identifiers.append(f"SYN{index:06d}")
+            fleet.icao_hexes.append(f"{0x400000 + index:06X}")
+            fleet.callsigns.append(f"{prefix}{designator}")
+            fleet.registrations.append(_synthetic_registration(index))
+            fleet.entry_sin_latitudes.append(sin(entry_latitude_rad))
+            fleet.entry_cos_latitudes.append(cos(entry_latitude_rad))
+            fleet.entry_longitudes.append(radians(entry_longitude))
+            fleet.heading_sines.append(sin(heading_rad))
+            fleet.heading_cosines.append(cos(heading_rad))
+            fleet.tracks.append(heading)
+            fleet.path_lengths_km.append(max(path_length, 1e-6))
+            fleet.phases_km.append(rng.uniform(0.0, path_length))
+            fleet.speeds_km_per_second.append(ground_speed * _KM_PER_SECOND_PER_KNOT)
+            fleet.ground_speeds.append(ground_speed)
+            fleet.base_altitudes.append(altitude)
+            fleet.vertical_speeds.append(vertical_speed)
+            fleet.route_boxes.append(
+                (
+                    min(entry_latitude, exit_latitude) - _ROUTE_BOX_MARGIN_DEGREES,
+                    max(entry_latitude, exit_latitude) + _ROUTE_BOX_MARGIN_DEGREES,
+                    min(entry_longitude, exit_longitude) - _ROUTE_BOX_MARGIN_DEGREES,
+                    max(entry_longitude, exit_longitude) + _ROUTE_BOX_MARGIN_DEGREES,
+                )
+            )
+        return fleet
+
+    def rows_near(self, area: GeographicArea) -> list[int]:
+        """Return the aircraft whose route box overlaps a box covering `area`.
+
+        Route boxes are plain longitude ranges, so traffic areas are assumed
+        not to straddle the antimeridian.
+        """
+
+        latitude_span, longitude_span = covering_spans_degrees(area.center_latitude, area.radius_km)
+        south = area.center_latitude - latitude_span
+        north = area.center_latitude + latitude_span
+        west = area.center_longitude - longitude_span
+        east = area.center_longitude + longitude_span
+        return [
+            row
+            for row, (route_south, route_north, route_west, route_east) in enumerate(
+                self.route_boxes
+            )
+            if route_north >= south
+            and route_south <= north
+            and route_east >= west
+            and route_west <= east
+        ]
+
+    def frame(
+        self, elapsed_seconds: float, rows: Sequence[int]
+    ) -> tuple[list[float], list[float], list[int], list[int]]:
+        """Return positions, altitudes, and vertical speeds of `rows` after `elapsed_seconds`."""
+
+        latitudes: list[float] = []
+        longitudes: list[float] = []
+        altitudes: list[int] = []
+        vertical_speeds: list[int] = []
+        for row in rows:
+            speed = self.speeds_km_per_second[row]
+            flown_km = (self.phases_km[row] + speed * elapsed_seconds) % self.path_lengths_km[row]
+            angle = flown_km / EARTH_RADIUS_KM
+            sin_angle = sin(angle)
+            cos_angle = cos(angle)
+            sin_start = self.entry_sin_latitudes[row]
+            cos_start = self.entry_cos_latitudes[row]
+            sin_latitude = sin_start * cos_angle + cos_start * sin_angle * self.heading_cosines[row]
+            longitude = self.entry_longitudes[row] + atan2(
+                self.heading_sines[row] * sin_angle * cos_start,
+                cos_angle - sin_start * sin_latitude,
+            )
+            latitudes.append(degrees(asin(sin_latitude)))
+            longitudes.append((degrees(longitude) + 540.0) % 360.0 - 180.0)
+            vertical_speed = self.vertical_speeds[row]
+            altitude = self.base_altitudes[row] + round(vertical_speed * flown_km / speed / 60.0)
+            if not _MINIMUM_ALTITUDE_FT <= altitude <= _MAXIMUM_ALTITUDE_FT:
+                altitude = min(max(altitude, _MINIMUM_ALTITUDE_FT), _MAXIMUM_ALTITUDE_FT)
+                vertical_speed = 0
+            altitudes.append(altitude)
+            vertical_speeds.append(vertical_speed)
+        return latitudes, longitudes, altitudes, vertical_speeds
 
 
 class MockFlightDataProvider:
@@ -27,6 +324,17 @@ class MockFlightDataProvider:
     centre, and later leaves it. MOCK002 approaches the sector more slowly,
     MOCK003 remains in the southern sky, and MOCK004 has deliberately partial
     live and enrichment data.
+
+    Setting `traffic_size` replaces those four with that many seeded synthetic
+    aircraft flying within `traffic_area`, for load testing. The provider
+    keeps one such world per seed and answers each query with the aircraft
+    inside the queried area, so overlapping queries see the same aircraft at
+    the same positions. The same seed always produces the same traffic.
+
+    The SLOW, LONG_TAIL, FLAKY, SLOW_ENRICHMENT, and PARTIAL scenarios inject
+    preset `MockConditions`; pass `conditions` to tune them. Latency, failures,
+    and partial payloads are drawn from the seed, so the same sequence of
+    calls always sees the same behaviour.
     """
 
     _capabilities = frozenset(
@@ -49,13 +357,25 @@ class MockFlightDataProvider:
         seed: int = 20260808,
         scenario: MockScenario = MockScenario.NORMAL,
         start_time: datetime = datetime(2026, 8, 8, 12, 0, tzinfo=UTC),
+        traffic_size: int | None = None,
+        traffic_area: GeographicArea = SYNTHETIC_TRAFFIC_AREA,
+        conditions: MockConditions | None = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
     ) -> None:
         if start_time.tzinfo is None or start_time.utcoffset() is None:
             raise ValueError("start_time must be timezone-aware")
+        if traffic_size is not None and not 1 <= traffic_size <= MAX_SYNTHETIC_AIRCRAFT:
+            raise ValueError(f"traffic_size must be between 1 and {MAX_SYNTHETIC_AIRCRAFT}")
         self.seed = seed
         self.scenario = scenario
         self.start_time = start_time
+        self.traffic_size = traffic_size
+        self.traffic_area = traffic_area
+        self.conditions = conditions
         self.tick = 0
+        self._fleet: _SyntheticFleet | None = None
+        self._sleep = sleep
+        self._conditions_rng = Random(f"{seed}:conditions")
 
     @property
     def name(self) -> str:
@@ -69,18 +389,51 @@ class MockFlightDataProvider:
         """Return the simulation to its first deterministic frame."""
 
         self.tick = 0
+        self._conditions_rng = Random(f"{self.seed}:conditions")
+
+    @property
+    def active_conditions(self) -> MockConditions:
+        if self.conditions is not None:
+            return self.conditions
+        return _SCENARIO_CONDITIONS.get(self.scenario, _NO_CONDITIONS)
+
+    async def _inject(self, latency: MockLatency, failure_rate: float, message: str) -> None:
+        delay = latency.sample(self._conditions_rng)
+        if delay:
+            await self._sleep(delay)
+        if failure_rate and self._conditions_rng.random() < failure_rate:
+            raise ProviderUnavailable(message)
 
     async def get_aircraft(self, area: GeographicArea) -> list[AircraftState]:
+        return list(await self.get_aircraft_batch(area))
+
+    async def get_aircraft_batch(self, area: GeographicArea) -> AircraftBatch:
+        """Return the next frame as columns without building per-aircraft states."""
+
         if self.scenario is MockScenario.TIMEOUT:
             raise ProviderTimeout("mock provider timed out")
         if self.scenario is MockScenario.RATE_LIMITED:
             raise ProviderRateLimited("mock provider rate limit reached", retry_after_seconds=60)
         if self.scenario is MockScenario.EMPTY:
             self.tick += 1
-            return []
+            return AircraftBatch.from_states(())
 
+        conditions = self.active_conditions
+        await self._inject(
+            conditions.live_latency,
+            conditions.failure_rate,
+            "mock provider failed intermittently",
+        )
         current_tick = self.tick
         self.tick += 1
+        batch = self._frame(area, current_tick)
+        if conditions.partial_rate:
+            batch = self._strip_partial(batch, conditions.partial_rate)
+        return batch
+
+    def _frame(self, area: GeographicArea, current_tick: int) -> AircraftBatch:
+        if self.traffic_size is not None:
+            return self._synthetic_batch(area, current_tick, self.traffic_size)
         rng = Random(self.seed)
         distance_adjustment = rng.uniform(-0.25, 0.25)
         observed_at = self.start_time + timedelta(seconds=current_tick * 30)
@@ -92,7 +445,16 @@ class MockFlightDataProvider:
             ("MOCK004", 345.0 + current_tick * 4.0, 30.0),
         )
 
-        states: list[AircraftState] = []
+        identifiers: list[str] = []
+        icao_hexes: list[str] = []
+        callsigns: list[str | None] = []
+        registrations: list[str | None] = []
+        latitudes: list[float] = []
+        longitudes: list[float] = []
+        altitudes: list[int | None] = []
+        ground_speeds: list[float | None] = []
+        vertical_speeds: list[int | None] = []
+        tracks: list[float | None] = []
         for index, (identifier, bearing, distance) in enumerate(definitions, start=1):
             if distance > area.radius_km:
                 continue
@@ -103,29 +465,122 @@ class MockFlightDataProvider:
                 distance,
             )
             is_partial = identifier == "MOCK004"
-            states.append(
-                AircraftState(
-                    provider=self.name,
-                    provider_aircraft_id=identifier,
-                    icao_hex=f"A0000{index}",
-                    callsign=None if is_partial else f"SKY{100 + index}",
-                    registration=None if is_partial else f"G-MK{index:02d}",
-                    latitude=latitude,
-                    longitude=longitude,
-                    altitude_ft=None if is_partial else 12_000 + index * 4_000,
-                    ground_speed_knots=None if is_partial else 300.0 + index * 12.0,
-                    vertical_speed_fpm=None if is_partial else (-400 + index * 150),
-                    track_degrees=(bearing + 95.0) % 360.0,
-                    observed_at=observed_at,
-                )
+            identifiers.append(identifier)
+            icao_hexes.append(f"A0000{index}")
+            callsigns.append(None if is_partial else f"SKY{100 + index}")
+            registrations.append(None if is_partial else f"G-MK{index:02d}")
+            latitudes.append(latitude)
+            longitudes.append(longitude)
+            altitudes.append(None if is_partial else 12_000 + index * 4_000)
+            ground_speeds.append(None if is_partial else 300.0 + index * 12.0)
+            vertical_speeds.append(None if is_partial else (-400 + index * 150))
+            tracks.append((bearing + 95.0) % 360.0)
+
+        return AircraftBatch.from_columns(
+            provider=[self.name] * len(identifiers),
+            provider_aircraft_id=identifiers,
+            icao_hex=icao_hexes,
+            callsign=callsigns,
+            registration=registrations,
+            latitude=latitudes,
+            longitude=longitudes,
+            altitude_ft=altitudes,
+            ground_speed_knots=ground_speeds,
+            vertical_speed_fpm=vertical_speeds,
+            track_degrees=tracks,
+            observed_at=[observed_at] * len(identifiers),
+        )
+
+    def _strip_partial(self, batch: AircraftBatch, rate: float) -> AircraftBatch:
+        rows = [row for row in range(len(batch)) if self._conditions_rng.random() < rate]
+        if not rows:
+            return batch
+        callsigns = list(batch.callsign)
+        registrations = list(batch.registration)
+        altitudes = array("d", batch.altitude_ft)
+        ground_speeds = array("d", batch.ground_speed_knots)
+        vertical_speeds = array("d", batch.vertical_speed_fpm)
+        for row in rows:
+            callsigns[row] = registrations[row] = None
+            altitudes[row] = ground_speeds[row] = vertical_speeds[row] = nan
+        return replace(
+            batch,
+            callsign=tuple(callsigns),
+            registration=tuple(registrations),
+            altitude_ft=altitudes,
+            ground_speed_knots=ground_speeds,
+            vertical_speed_fpm=vertical_speeds,
+        )
+
+    def _synthetic_batch(self, area: GeographicArea, tick: int, size: int) -> AircraftBatch:
+        fleet = self._fleet
+        if fleet is None:
+            fleet = self._fleet = _SyntheticFleet.generate(self.seed, self.traffic_area, size)
+        traffic = self.traffic_area
+        covers_traffic = (
+            great_circle_distance_km(
+                area.center_latitude,
+                area.center_longitude,
+                traffic.center_latitude,
+                traffic.center_longitude,
             )
-        return states
+            + traffic.radius_km
+            <= area.radius_km
+        )
+        # Only aircraft whose route passes near the area need positions.
+        rows: Sequence[int] = range(size) if covers_traffic else fleet.rows_near(area)
+        latitudes, longitudes, altitudes, vertical_speeds = fleet.frame(tick * 30.0, rows)
+        batch = AircraftBatch.from_columns(
+            provider=[self.name] * len(rows),
+            provider_aircraft_id=[fleet.identifiers[row] for row in rows],
+            icao_hex=[fleet.icao_hexes[row] for row in rows],
+            callsign=[fleet.callsigns[row] for row in rows],
+            registration=[fleet.registrations[row] for row in rows],
+            latitude=latitudes,
+            longitude=longitudes,
+            altitude_ft=altitudes,
+            ground_speed_knots=[fleet.ground_speeds[row] for row in rows],
+            vertical_speed_fpm=vertical_speeds,
+            track_degrees=[fleet.tracks[row] for row in rows],
+            observed_at=[self.start_time + timedelta(seconds=tick * 30)] * len(rows),
+            trusted=True,
+        )
+        if covers_traffic:
+            return batch
+        return batch_within_distance(
+            batch, area.center_latitude, area.center_longitude, area.radius_km
+        )
 
     async def get_flight_information(self, aircraft: AircraftState) -> FlightInformation | None:
         if self.scenario is MockScenario.TIMEOUT:
             raise ProviderTimeout("mock enrichment timed out")
         if self.scenario is MockScenario.RATE_LIMITED:
             raise ProviderRateLimited("mock provider rate limit reached", retry_after_seconds=60)
+        conditions = self.active_conditions
+        await self._inject(
+            conditions.enrichment_latency,
+            conditions.failure_rate,
+            "mock enrichment failed intermittently",
+        )
+        if conditions.partial_rate and self._conditions_rng.random() < conditions.partial_rate:
+            return FlightInformation(
+                provider=self.name,
+                enriched_at=aircraft.observed_at,
+                aircraft_type_code="A20N",
+            )
+        if aircraft.provider_aircraft_id.startswith("SYN"):
+            index = int(aircraft.provider_aircraft_id.removeprefix("SYN"))
+            (_, airline_iata, airline_name), designator = _synthetic_flight(index)
+            return FlightInformation(
+                provider=self.name,
+                enriched_at=aircraft.observed_at,
+                callsign=aircraft.callsign,
+                flight_number=f"{airline_iata}{designator}",
+                airline_name=airline_name,
+                airline_iata=airline_iata,
+                registration=aircraft.registration,
+                aircraft_type_code="A20N" if index % 3 else "B738",
+            )
         if aircraft.provider_aircraft_id == "MOCK004":
             return FlightInformation(
                 provider=self.name,
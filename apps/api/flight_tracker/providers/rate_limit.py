@@ -0,0 +1,176 @@
+"""Token-bucket request budgets for paid upstream providers."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from math import ceil
+from time import monotonic
+
+from flight_tracker.domain.errors import ProviderRateLimited, RequestBudgetExhausted
+from flight_tracker.domain.models import AircraftBatch, AircraftState, FlightInformation
+
+from .base import (
+    FlightDataProvider,
+    GeographicArea,
+    ProviderCapability,
+    SupportsFlightInformationBatch,
+    fan_out_flight_information,
+    fetch_aircraft_batch,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class BudgetStatus:
+    """Point-in-time request budget for monitoring."""
+
+    tokens_remaining: float
+    capacity: int
+    cooldown_remaining_seconds: float
+
+
+class RequestBudget:
+    """Token bucket shared by every caller of one upstream provider.
+
+    Tokens refill continuously at `requests_per_minute` up to `burst`. Live
+    state may spend any token; enrichment leaves `live_reserve` tokens behind
+    so device snapshots keep working when the budget is tight. A cooldown,
+    typically from the provider's own retry-after, blocks every request.
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: float = 60.0,
+        burst: int = 10,
+        live_reserve: int = 2,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if requests_per_minute <= 0.0 or burst <= 0:
+            raise ValueError("request rate and burst must be positive")
+        if not 0 <= live_reserve < burst:
+            raise ValueError("live_reserve must be between 0 and burst")
+        self.refill_per_second = requests_per_minute / 60.0
+        self.burst = burst
+        self.live_reserve = live_reserve
+        self.clock = clock
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self._cooldown_until = self._updated_at
+
+    @property
+    def status(self) -> BudgetStatus:
+        now = self._refill()
+        return BudgetStatus(
+            tokens_remaining=self._tokens,
+            capacity=self.burst,
+            cooldown_remaining_seconds=max(0.0, self._cooldown_until - now),
+        )
+
+    def try_acquire(self, *, live: bool) -> float:
+        """Spend one token, returning 0 or the seconds until a retry could succeed."""
+
+        now = self._refill()
+        if now < self._cooldown_until:
+            return self._cooldown_until - now
+        floor = 1.0 if live else 1.0 + self.live_reserve
+        if self._tokens >= floor:
+            self._tokens -= 1.0
+            return 0.0
+        return (floor - self._tokens) / self.refill_per_second
+
+    def cool_down(self, seconds: float) -> None:
+        """Block every request for `seconds`, extending any current cooldown."""
+
+        self._cooldown_until = max(self._cooldown_until, self._refill() + seconds)
+
+    def _refill(self) -> float:
+        now = self.clock()
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.refill_per_second)
+        self._updated_at = now
+        return now
+
+
+class RateLimitedFlightDataProvider:
+    """Keep upstream calls inside a request budget, failing fast beyond it.
+
+    Requests that the budget cannot cover raise RequestBudgetExhausted, a
+    ProviderRateLimited, without calling upstream, so callers take their
+    usual degraded paths. When the provider itself reports a rate limit, its
+    retry-after (or `default_cooldown_seconds`) pauses the shared budget.
+    """
+
+    def __init__(
+        self,
+        provider: FlightDataProvider,
+        budget: RequestBudget | None = None,
+        *,
+        default_cooldown_seconds: float = 60.0,
+    ) -> None:
+        if default_cooldown_seconds <= 0.0:
+            raise ValueError("default_cooldown_seconds must be positive")
+        self.provider = provider
+        self.budget = budget or RequestBudget()
+        self.default_cooldown_seconds = default_cooldown_seconds
+
+    @property
+    def name(self) -> str:
+        return self.provider.name
+
+    @property
+    def capabilities(self) -> frozenset[ProviderCapability]:
+        return self.provider.capabilities
+
+    @property
+    def budget_status(self) -> BudgetStatus:
+        return self.budget.status
+
+    async def get_aircraft(self, area: GeographicArea) -> list[AircraftState]:
+        self._spend(live=True)
+        try:
+            return await self.provider.get_aircraft(area)
+        except ProviderRateLimited as error:
+            self._cool_down(error)
+            raise
+
+    async def get_aircraft_batch(self, area: GeographicArea) -> AircraftBatch:
+        self._spend(live=True)
+        try:
+            return await fetch_aircraft_batch(self.provider, area)
+        except ProviderRateLimited as error:
+            self._cool_down(error)
+            raise
+
+    async def get_flight_information(self, aircraft: AircraftState) -> FlightInformation | None:
+        self._spend(live=False)
+        try:
+            return await self.provider.get_flight_information(aircraft)
+        except ProviderRateLimited as error:
+            self._cool_down(error)
+            raise
+
+    async def get_flight_information_many(
+        self, aircraft: Sequence[AircraftState]
+    ) -> list[FlightInformation | None]:
+        # A batch request spends one token; single-lookup adapters spend one per aircraft.
+        provider = self.provider
+        if not isinstance(provider, SupportsFlightInformationBatch):
+            return await fan_out_flight_information(self.get_flight_information, aircraft)
+        self._spend(live=False)
+        try:
+            return await provider.get_flight_information_many(aircraft)
+        except ProviderRateLimited as error:
+            self._cool_down(error)
+            raise
+
+    def _spend(self, *, live: bool) -> None:
+        wait_seconds = self.budget.try_acquire(live=live)
+        if wait_seconds > 0.0:
+            raise RequestBudgetExhausted(
+                f"{self.name} request budget exhausted",
+                retry_after_seconds=ceil(wait_seconds),
+            )
+
+    def _cool_down(self, error: ProviderRateLimited) -> None:
+        self.budget.cool_down(error.retry_after_seconds or self.default_cooldown_seconds)
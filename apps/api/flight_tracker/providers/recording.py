@@ -0,0 +1,351 @@
+"""Record provider exchanges to a file and replay them without a network."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import struct
+from collections import defaultdict, deque
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from dataclasses import fields
+from datetime import datetime
+from pathlib import Path
+from time import monotonic, time
+from types import TracebackType
+from typing import Any, BinaryIO, Self
+
+from flight_tracker.domain.errors import (
+    ProviderError,
+    ProviderRateLimited,
+    ProviderResponseInvalid,
+    ProviderTimeout,
+    ProviderUnavailable,
+)
+from flight_tracker.domain.models import AircraftState, FlightInformation
+
+from .base import (
+    FlightDataProvider,
+    GeographicArea,
+    ProviderCapability,
+    SupportsFlightInformationBatch,
+    enrichment_key,
+    fan_out_flight_information,
+    fresh_provider_error,
+)
+
+RECORDING_FORMAT_VERSION = 1
+_LENGTH = struct.Struct(">I")
+_AIRCRAFT_FIELDS = tuple(field.name for field in fields(AircraftState))
+_INFORMATION_FIELDS = tuple(field.name for field in fields(FlightInformation))
+_DATETIME_FIELDS = frozenset(
+    {"observed_at", "extrapolated_at", "enriched_at", "scheduled_departure", "scheduled_arrival"}
+)
+AreaKey = tuple[float, float, float]
+LiveOutcome = list[AircraftState] | ProviderError
+EnrichmentOutcome = FlightInformation | ProviderError | None
+_ERRORS: dict[str, type[ProviderError]] = {
+    error.__name__: error
+    for error in (
+        ProviderError,
+        ProviderUnavailable,
+        ProviderTimeout,
+        ProviderRateLimited,
+        ProviderResponseInvalid,
+    )
+}
+
+
+def _encode_row(names: tuple[str, ...], record: object) -> list[Any]:
+    # Plain attribute reads; `astuple` would deep-copy every field.
+    values = (getattr(record, name) for name in names)
+    return [value.isoformat() if isinstance(value, datetime) else value for value in values]
+
+
+def _decode_row(names: tuple[str, ...], row: list[Any]) -> dict[str, Any]:
+    return {
+        name: datetime.fromisoformat(value)
+        if name in _DATETIME_FIELDS and value is not None
+        else value
+        for name, value in zip(names, row, strict=True)
+    }
+
+
+def _encode_error(error: ProviderError) -> dict[str, Any]:
+    name = next(
+        (klass.__name__ for klass in type(error).__mro__ if klass.__name__ in _ERRORS),
+        ProviderError.__name__,
+    )
+    return {
+        "type": name,
+        "message": str(error),
+        "retry_after_seconds": getattr(error, "retry_after_seconds", None),
+    }
+
+
+def _decode_error(payload: dict[str, Any]) -> ProviderError:
+    error_type = _ERRORS.get(payload["type"], ProviderError)
+    if error_type is ProviderRateLimited:
+        return ProviderRateLimited(
+            payload["message"], retry_after_seconds=payload["retry_after_seconds"]
+        )
+    return error_type(payload["message"])
+
+
+def _write_record(stream: BinaryIO, record: dict[str, Any]) -> None:
+    payload = json.dumps(record, separators=(",", ":")).encode()
+    stream.write(_LENGTH.pack(len(payload)) + payload)
+
+
+def _loop_period(frames: list[tuple[float, LiveOutcome]]) -> float:
+    # The recorded span plus one average interval, so a new pass starts one
+    # poll after the previous pass ended rather than on top of its last frame.
+    if len(frames) < 2:
+        return 0.0
+    span = max(at for at, _outcome in frames) - min(at for at, _outcome in frames)
+    return span + span / (len(frames) - 1)
+
+
+def read_recording(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield the records of a recording file in the order they were written."""
+
+    with path.open("rb") as stream:
+        while header := stream.read(_LENGTH.size):
+            if len(header) < _LENGTH.size:
+                raise ProviderResponseInvalid(f"truncated record length in {path}")
+            (length,) = _LENGTH.unpack(header)
+            payload = stream.read(length)
+            if len(payload) < length:
+                raise ProviderResponseInvalid(f"truncated record in {path}")
+            yield json.loads(payload)
+
+
+class RecordingFlightDataProvider:
+    """Pass calls through to a provider while appending every exchange to a file.
+
+    Each record is a length-prefixed JSON object. Aircraft are stored as rows
+    in field order to keep large frames compact, and provider errors are
+    recorded so replays reproduce failures as well as data. The file stays
+    open for appending until `close`, or the end of a `with` block; each
+    record is flushed as it is written so a crash loses at most the exchange
+    in progress.
+    """
+
+    def __init__(
+        self,
+        provider: FlightDataProvider,
+        path: Path,
+        *,
+        clock: Callable[[], float] = time,
+    ) -> None:
+        self.provider = provider
+        self.path = path
+        self.clock = clock
+        self._stream = path.open("ab")
+        if self._stream.tell() == 0:
+            self._append(
+                {
+                    "kind": "header",
+                    "version": RECORDING_FORMAT_VERSION,
+                    "provider": provider.name,
+                    "capabilities": sorted(provider.capabilities),
+                    "aircraft_fields": _AIRCRAFT_FIELDS,
+                    "information_fields": _INFORMATION_FIELDS,
+                }
+            )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def name(self) -> str:
+        return self.provider.name
+
+    @property
+    def capabilities(self) -> frozenset[ProviderCapability]:
+        return self.provider.capabilities
+
+    async def get_aircraft(self, area: GeographicArea) -> list[AircraftState]:
+        record: dict[str, Any] = {
+            "kind": "aircraft",
+            "at": self.clock(),
+            "area": [area.center_latitude, area.center_longitude, area.radius_km],
+        }
+        try:
+            states = await self.provider.get_aircraft(area)
+        except ProviderError as error:
+            self._append(record | {"error": _encode_error(error)})
+            raise
+        self._append(
+            record | {"states": [_encode_row(_AIRCRAFT_FIELDS, state) for state in states]}
+        )
+        return states
+
+    async def get_flight_information(self, aircraft: AircraftState) -> FlightInformation | None:
+        record: dict[str, Any] = {
+            "kind": "enrichment",
+            "at": self.clock(),
+            "key": list(enrichment_key(aircraft)),
+        }
+        try:
+            information = await self.provider.get_flight_information(aircraft)
+        except ProviderError as error:
+            self._append(record | {"error": _encode_error(error)})
+            raise
+        encoded = None if information is None else _encode_row(_INFORMATION_FIELDS, information)
+        self._append(record | {"information": encoded})
+        return information
+
+    async def get_flight_information_many(
+        self, aircraft: Sequence[AircraftState]
+    ) -> list[FlightInformation | None]:
+        # Batch answers are recorded per aircraft so replays serve them singly too.
+        provider = self.provider
+        if not isinstance(provider, SupportsFlightInformationBatch):
+            return await fan_out_flight_information(self.get_flight_information, aircraft)
+        at = self.clock()
+        records: list[dict[str, Any]] = [
+            {"kind": "enrichment", "at": at, "key": list(enrichment_key(state))}
+            for state in aircraft
+        ]
+        try:
+            found = await provider.get_flight_information_many(aircraft)
+        except ProviderError as error:
+            for record in records:
+                self._append(record | {"error": _encode_error(error)})
+            raise
+        for record, information in zip(records, found, strict=True):
+            encoded = None if information is None else _encode_row(_INFORMATION_FIELDS, information)
+            self._append(record | {"information": encoded})
+        return found
+
+    def close(self) -> None:
+        """Close the recording file; later exchanges are no longer recorded."""
+
+        self._stream.close()
+
+    def _append(self, record: dict[str, Any]) -> None:
+        if self._stream.closed:
+            return
+        _write_record(self._stream, record)
+        self._stream.flush()
+
+
+class ReplayFlightDataProvider:
+    """Serve a recording back, per area, with original or accelerated timing.
+
+    With `speed` 1.0 each live-state response is released at its original
+    offset from the first one; larger values compress the gaps and None
+    returns responses as fast as possible. Enrichment is served immediately
+    with the latest recorded answer for the flight. An exhausted area raises
+    ProviderUnavailable unless `loop` restarts it from the beginning; each
+    pass is scheduled one recording period after the last, so looped replays
+    keep the original pacing.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        speed: float | None = 1.0,
+        loop: bool = False,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if speed is not None and speed <= 0.0:
+            raise ValueError("replay speed must be positive")
+        self.path = path
+        self.speed = speed
+        self.loop = loop
+        self.sleep = sleep
+        self.clock = clock
+        records = iter(read_recording(path))
+        header = next(records, None)
+        if header is None or header.get("kind") != "header":
+            raise ProviderResponseInvalid(f"{path} is not a provider recording")
+        if header["version"] != RECORDING_FORMAT_VERSION:
+            raise ProviderResponseInvalid(f"unsupported recording version {header['version']}")
+        self._name: str = header["provider"]
+        self._capabilities = frozenset(ProviderCapability(item) for item in header["capabilities"])
+        aircraft_fields = tuple(header["aircraft_fields"])
+        information_fields = tuple(header["information_fields"])
+
+        self._frames: dict[AreaKey, list[tuple[float, LiveOutcome]]] = defaultdict(list)
+        self._enrichment: dict[tuple[str, ...], EnrichmentOutcome] = {}
+        self._first_at: float | None = None
+        for record in records:
+            error = _decode_error(record["error"]) if "error" in record else None
+            if record["kind"] == "enrichment":
+                information = record.get("information")
+                self._enrichment[tuple(record["key"])] = error or (
+                    None
+                    if information is None
+                    else FlightInformation(**_decode_row(information_fields, information))
+                )
+                continue
+            at = float(record["at"])
+            self._first_at = at if self._first_at is None else min(self._first_at, at)
+            latitude, longitude, radius_km = record["area"]
+            self._frames[(latitude, longitude, radius_km)].append(
+                (
+                    at,
+                    error
+                    or [
+                        AircraftState(**_decode_row(aircraft_fields, row))
+                        for row in record["states"]
+                    ],
+                )
+            )
+        self._pending = {area: deque(frames) for area, frames in self._frames.items()}
+        self._passes: dict[AreaKey, int] = defaultdict(int)
+        self._started_at: float | None = None
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def capabilities(self) -> frozenset[ProviderCapability]:
+        return self._capabilities
+
+    @property
+    def areas(self) -> list[GeographicArea]:
+        return [GeographicArea(*area) for area in self._frames]
+
+    async def get_aircraft(self, area: GeographicArea) -> list[AircraftState]:
+        key = (area.center_latitude, area.center_longitude, area.radius_km)
+        pending = self._pending.get(key)
+        if pending is not None and not pending and self.loop:
+            self._passes[key] += 1
+            shift = self._passes[key] * _loop_period(self._frames[key])
+            pending.extend((at + shift, outcome) for at, outcome in self._frames[key])
+        if not pending:
+            raise ProviderUnavailable("recording has no further responses for this area")
+        at, outcome = pending.popleft()
+        await self._wait_until(at)
+        if isinstance(outcome, ProviderError):
+            raise fresh_provider_error(outcome)
+        return list(outcome)
+
+    async def get_flight_information(self, aircraft: AircraftState) -> FlightInformation | None:
+        outcome = self._enrichment.get(enrichment_key(aircraft))
+        if isinstance(outcome, ProviderError):
+            raise fresh_provider_error(outcome)
+        return outcome
+
+    async def _wait_until(self, at: float) -> None:
+        if self.speed is None or self._first_at is None:
+            return
+        now = self.clock()
+        if self._started_at is None:
+            self._started_at = now
+        delay = self._started_at + (at - self._first_at) / self.speed - now
+        if delay > 0.0:
+            await self.sleep(delay)
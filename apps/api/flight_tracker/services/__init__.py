@@ -1,5 +1,19 @@
 """Application services that orchestrate domain and adapter boundaries."""
 
+from .instrumentation import (
+    HistogramCollector,
+    LatencyHistogram,
+    SnapshotInstrumentation,
+    SnapshotStage,
+    SnapshotTrace,
+)
 from .snapshot_service import DeviceSnapshotService
 
-__all__ = ["DeviceSnapshotService"]
+__all__ = [
+    "DeviceSnapshotService",
+    "HistogramCollector",
+    "LatencyHistogram",
+    "SnapshotInstrumentation",
+    "SnapshotStage",
+    "SnapshotTrace",
+]
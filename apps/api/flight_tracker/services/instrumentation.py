@@ -0,0 +1,148 @@
+"""Per-stage timing of snapshot generation."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from enum import StrEnum
+from time import perf_counter
+from typing import Protocol, runtime_checkable
+
+from flight_tracker.domain.models import SnapshotStatus
+
+# Bucket upper bounds double from 10 µs to about 84 s; slower samples overflow.
+HISTOGRAM_BOUNDS_SECONDS = tuple(0.000_01 * 2.0**exponent for exponent in range(24))
+
+
+class SnapshotStage(StrEnum):
+    PROVIDER_FETCH = "provider_fetch"
+    VISIBILITY = "visibility"
+    RANKING = "ranking"
+    ENRICHMENT = "enrichment"
+    ASSEMBLY = "assembly"
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotTrace:
+    """Timings and counts for one generated snapshot.
+
+    `durations` holds only the stages that ran, so an unavailable provider
+    reports a fetch and nothing after it.
+    """
+
+    status: SnapshotStatus
+    total_seconds: float
+    durations: Mapping[SnapshotStage, float]
+    aircraft_in: int = 0
+    visible: int = 0
+    ranked: int = 0
+
+
+@runtime_checkable
+class SnapshotInstrumentation(Protocol):
+    """Receives one trace per snapshot; must be cheap and must not raise."""
+
+    def record(self, trace: SnapshotTrace) -> None: ...
+
+
+class StageTimer:
+    """Attribute elapsed time to consecutive stages of one snapshot."""
+
+    __slots__ = ("_last", "_timer", "durations", "started")
+
+    def __init__(self, timer: Callable[[], float] = perf_counter) -> None:
+        self._timer = timer
+        self.started = self._last = timer()
+        self.durations: dict[SnapshotStage, float] = {}
+
+    def lap(self, stage: SnapshotStage) -> None:
+        now = self._timer()
+        self.durations[stage] = now - self._last
+        self._last = now
+
+    def elapsed(self) -> float:
+        return self._last - self.started
+
+
+class LatencyHistogram:
+    """Fixed log-scale buckets; quantiles are accurate to a factor of two."""
+
+    __slots__ = ("buckets", "count", "maximum", "total")
+
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(HISTOGRAM_BOUNDS_SECONDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.buckets[bisect_left(HISTOGRAM_BOUNDS_SECONDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.maximum:
+            self.maximum = seconds
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, fraction: float) -> float:
+        """Return the upper bound of the bucket holding the `fraction` quantile."""
+
+        if not 0.0 <= fraction <= 1.0:
+            raise ValueError("fraction must be between 0 and 1")
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket in enumerate(self.buckets[:-1]):
+            seen += bucket
+            if seen >= rank and seen:
+                return min(HISTOGRAM_BOUNDS_SECONDS[index], self.maximum)
+        return self.maximum
+
+
+class HistogramCollector:
+    """Default in-process instrumentation aggregating traces into histograms."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.total = LatencyHistogram()
+        self.stages = {stage: LatencyHistogram() for stage in SnapshotStage}
+        self.statuses: Counter[SnapshotStatus] = Counter()
+        self.aircraft_in = 0
+        self.visible = 0
+        self.ranked = 0
+
+    def record(self, trace: SnapshotTrace) -> None:
+        self.total.observe(trace.total_seconds)
+        for stage, seconds in trace.durations.items():
+            self.stages[stage].observe(seconds)
+        self.statuses[trace.status] += 1
+        self.aircraft_in += trace.aircraft_in
+        self.visible += trace.visible
+        self.ranked += trace.ranked
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Return count, mean, p50, p95, p99 and max per stage, in milliseconds."""
+
+        histograms = {
+            "total": self.total,
+            **{str(key): value for key, value in self.stages.items()},
+        }
+        return {
+            name: {
+                "count": histogram.count,
+                "mean_ms": histogram.mean * 1_000,
+                "p50_ms": histogram.quantile(0.50) * 1_000,
+                "p95_ms": histogram.quantile(0.95) * 1_000,
+                "p99_ms": histogram.quantile(0.99) * 1_000,
+                "max_ms": histogram.maximum * 1_000,
+            }
+            for name, histogram in histograms.items()
+            if histogram.count
+        }
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
+from contextlib import suppress
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from math import ceil, floor
 
 from flight_tracker.domain.errors import ProviderError
-from flight_tracker.domain.geometry import visible_aircraft
+from flight_tracker.domain.geometry import compile_viewing_zone
 from flight_tracker.domain.models import (
+    AircraftBatch,
+    AircraftState,
     DisplayAircraft,
     DisplaySnapshot,
     FlightInformation,
@@ -15,12 +22,54 @@ from flight_tracker.domain.models import (
     ViewingZone,
     VisibleAircraft,
 )
-from flight_tracker.domain.ranking import rank_visible_aircraft
-from flight_tracker.providers.base import FlightDataProvider, GeographicArea
+from flight_tracker.domain.motion import KM_PER_NAUTICAL_MILE, earliest_entry_seconds
+from flight_tracker.domain.ranking import top_ranked_aircraft
+from flight_tracker.providers.base import (
+    FlightDataProvider,
+    GeographicArea,
+    SupportsAircraftBatch,
+    SupportsFlightInformationBatch,
+)
+from flight_tracker.providers.caching import GridCell, region_area, snap_to_region
+
+from .instrumentation import (
+    HistogramCollector,
+    SnapshotInstrumentation,
+    SnapshotStage,
+    SnapshotTrace,
+    StageTimer,
+)
+
+# Fast airliner ground speed used to size the inbound search radius.
+INBOUND_SEARCH_SPEED_KNOTS = 600.0
+# Widest margin added to live queries to find inbound aircraft, and the
+# longest quiet poll interval that margin can see ahead for.
+INBOUND_SEARCH_MAX_KM = 50.0
+INBOUND_SEARCH_HORIZON_SECONDS = floor(
+    INBOUND_SEARCH_MAX_KM / (INBOUND_SEARCH_SPEED_KNOTS * KM_PER_NAUTICAL_MILE) * 3_600
+)
+
+# Live state in whichever form the provider produces natively.
+LiveStates = AircraftBatch | list[AircraftState]
+
+
+@dataclass(frozen=True, slots=True)
+class _Region:
+    fetched_at: datetime
+    radius_steps: int
+    states: LiveStates
 
 
 class DeviceSnapshotService:
-    """Own the provider → visibility → ranking → enrichment decision flow."""
+    """Own the provider → visibility → ranking → enrichment decision flow.
+
+    With `quiet_refresh_after_seconds` set, every live query is widened by
+    the distance a fast airliner covers before the next quiet poll, so
+    inbound aircraft are seen in time. The wider area costs extra provider
+    rows and scan work on every fetch, not just quiet ones, so the margin is
+    capped at `INBOUND_SEARCH_MAX_KM` and quiet polls are shortened to the
+    `INBOUND_SEARCH_HORIZON_SECONDS` that margin covers.
+    """
 
     def __init__(
         self,
@@ -29,74 +78,310 @@ class DeviceSnapshotService:
         refresh_after_seconds: int = 30,
         degraded_refresh_after_seconds: int = 60,
         configuration_refresh_after_seconds: int = 300,
+        quiet_refresh_after_seconds: int | None = None,
+        minimum_refresh_after_seconds: int = 5,
+        enrichment_prefetch_count: int = 3,
+        stale_budget_seconds: float | None = None,
+        revalidate_after_seconds: float = 15.0,
+        region_cell_degrees: float = 0.5,
+        region_radius_step_km: float = 25.0,
+        deadline_seconds: float | None = None,
+        live_state_budget_seconds: float | None = None,
+        enrichment_budget_seconds: float | None = None,
+        instrumentation: SnapshotInstrumentation | None = None,
         clock: Callable[[], datetime] | None = None,
     ) -> None:
-        if (
-            min(
-                refresh_after_seconds,
-                degraded_refresh_after_seconds,
-                configuration_refresh_after_seconds,
-            )
-            <= 0
-        ):
+        intervals = [
+            refresh_after_seconds,
+            degraded_refresh_after_seconds,
+            configuration_refresh_after_seconds,
+            minimum_refresh_after_seconds,
+        ]
+        if quiet_refresh_after_seconds is not None:
+            intervals.append(quiet_refresh_after_seconds)
+        if min(intervals) <= 0:
             raise ValueError("snapshot refresh intervals must be positive")
+        if enrichment_prefetch_count <= 0:
+            raise ValueError("enrichment_prefetch_count must be positive")
+        if revalidate_after_seconds <= 0.0 or (
+            stale_budget_seconds is not None and stale_budget_seconds < revalidate_after_seconds
+        ):
+            raise ValueError("stale budget must cover a positive revalidation interval")
+        if region_cell_degrees <= 0.0 or region_radius_step_km <= 0.0:
+            raise ValueError("region cell size and radius step must be positive")
+        budgets = (deadline_seconds, live_state_budget_seconds, enrichment_budget_seconds)
+        if any(budget is not None and budget <= 0.0 for budget in budgets):
+            raise ValueError("snapshot time budgets must be positive")
         self.provider = provider
         self.refresh_after_seconds = refresh_after_seconds
         self.degraded_refresh_after_seconds = degraded_refresh_after_seconds
         self.configuration_refresh_after_seconds = configuration_refresh_after_seconds
+        # Setting a quiet interval enables adaptive refresh: devices wait up to
+        # it while nothing is inbound and poll sooner when an entry is due.
+        self.quiet_refresh_after_seconds = quiet_refresh_after_seconds
+        self.minimum_refresh_after_seconds = minimum_refresh_after_seconds
+        # Providers with batch enrichment also warm the next few candidates
+        # in a background request that the snapshot does not wait for.
+        self.enrichment_prefetch_count = enrichment_prefetch_count
+        # Setting a stale budget enables stale-while-revalidate: a last good
+        # regional set older than `revalidate_after_seconds` is still served,
+        # marked stale, while a background refresh replaces it. Sets are kept
+        # per snapped grid region, as in CachingFlightDataProvider, so nearby
+        # devices share one set rather than each holding their own.
+        self.stale_budget_seconds = stale_budget_seconds
+        self.revalidate_after_seconds = revalidate_after_seconds
+        self.region_cell_degrees = region_cell_degrees
+        self.region_radius_step_km = region_radius_step_km
+        # The deadline bounds a whole snapshot; each stage budget bounds one
+        # stage and is cut short by whatever remains of the deadline.
+        self.deadline_seconds = deadline_seconds
+        self.live_state_budget_seconds = live_state_budget_seconds
+        self.enrichment_budget_seconds = enrichment_budget_seconds
+        # Every snapshot reports per-stage timings and counts here, so slow
+        # snapshots can be attributed to the provider or to local CPU work.
+        self.instrumentation = HistogramCollector() if instrumentation is None else instrumentation
         self.clock = clock or (lambda: datetime.now(UTC))
+        # Kept in fetch order, so expired regions are always at the front.
+        self._regions: OrderedDict[GridCell, _Region] = OrderedDict()
+        self._refreshes: dict[GridCell, asyncio.Task[None]] = {}
+        self._prefetches: set[asyncio.Task[None]] = set()
 
     async def generate(self, viewing_zone: ViewingZone | None) -> DisplaySnapshot:
+        timer = StageTimer()
         generated_at = self.clock()
+        started_at = asyncio.get_running_loop().time()
+        deadline = None if self.deadline_seconds is None else started_at + self.deadline_seconds
         if viewing_zone is None or not viewing_zone.enabled:
-            return DisplaySnapshot(
-                generated_at=generated_at,
-                status=SnapshotStatus.CONFIGURATION_REQUIRED,
-                refresh_after_seconds=self.configuration_refresh_after_seconds,
+            return self._record(
+                timer,
+                DisplaySnapshot(
+                    generated_at=generated_at,
+                    status=SnapshotStatus.CONFIGURATION_REQUIRED,
+                    refresh_after_seconds=self.configuration_refresh_after_seconds,
+                ),
             )
 
         area = GeographicArea(
             center_latitude=viewing_zone.latitude,
             center_longitude=viewing_zone.longitude,
-            radius_km=viewing_zone.max_distance_km,
+            radius_km=viewing_zone.max_distance_km + self._inbound_search_km(),
         )
         try:
-            states = await self.provider.get_aircraft(area)
-        except ProviderError:
-            return DisplaySnapshot(
-                generated_at=generated_at,
-                status=SnapshotStatus.PROVIDER_UNAVAILABLE,
-                refresh_after_seconds=self.degraded_refresh_after_seconds,
+            async with asyncio.timeout_at(
+                self._stage_deadline(deadline, self.live_state_budget_seconds)
+            ):
+                states, stale = await self._live_states(area)
+        except (ProviderError, TimeoutError):
+            timer.lap(SnapshotStage.PROVIDER_FETCH)
+            return self._record(
+                timer,
+                DisplaySnapshot(
+                    generated_at=generated_at,
+                    status=SnapshotStatus.PROVIDER_UNAVAILABLE,
+                    refresh_after_seconds=self.degraded_refresh_after_seconds,
+                ),
             )
+        timer.lap(SnapshotStage.PROVIDER_FETCH)
 
-        ranked = rank_visible_aircraft(visible_aircraft(states, viewing_zone), viewing_zone)
+        matches = compile_viewing_zone(viewing_zone).filter(states)
+        timer.lap(SnapshotStage.VISIBILITY)
+        ranked, visible_count = top_ranked_aircraft(
+            matches, viewing_zone, self.enrichment_prefetch_count
+        )
+        timer.lap(SnapshotStage.RANKING)
+        counts = (len(states), visible_count, len(ranked))
         if not ranked:
-            return DisplaySnapshot(
+            snapshot = DisplaySnapshot(
                 generated_at=generated_at,
                 status=SnapshotStatus.NO_AIRCRAFT,
-                refresh_after_seconds=self.refresh_after_seconds,
+                refresh_after_seconds=self._refresh_after(states, viewing_zone, visible=False),
+                stale=stale,
             )
+            timer.lap(SnapshotStage.ASSEMBLY)
+            return self._record(timer, snapshot, *counts)
 
         primary_match = ranked[0]
-        enrichment = await self._get_optional_enrichment(primary_match)
+        enrichment = await self._get_optional_enrichment(
+            ranked, self._stage_deadline(deadline, self.enrichment_budget_seconds)
+        )
+        timer.lap(SnapshotStage.ENRICHMENT)
         status = (
-            SnapshotStatus.MULTIPLE_AIRCRAFT if len(ranked) > 1 else SnapshotStatus.AIRCRAFT_VISIBLE
+            SnapshotStatus.MULTIPLE_AIRCRAFT
+            if visible_count > 1
+            else SnapshotStatus.AIRCRAFT_VISIBLE
         )
-        return DisplaySnapshot(
+        snapshot = DisplaySnapshot(
             generated_at=generated_at,
             status=status,
-            refresh_after_seconds=self.refresh_after_seconds,
+            refresh_after_seconds=self._refresh_after(states, viewing_zone, visible=True),
             primary=self._display_aircraft(primary_match, enrichment),
-            secondary_count=len(ranked) - 1,
+            secondary_count=visible_count - 1,
+            stale=stale,
+        )
+        timer.lap(SnapshotStage.ASSEMBLY)
+        return self._record(timer, snapshot, *counts)
+
+    def _record(
+        self,
+        timer: StageTimer,
+        snapshot: DisplaySnapshot,
+        aircraft_in: int = 0,
+        visible: int = 0,
+        ranked: int = 0,
+    ) -> DisplaySnapshot:
+        self.instrumentation.record(
+            SnapshotTrace(
+                status=snapshot.status,
+                total_seconds=timer.elapsed(),
+                durations=timer.durations,
+                aircraft_in=aircraft_in,
+                visible=visible,
+                ranked=ranked,
+            )
+        )
+        return snapshot
+
+    @staticmethod
+    def _stage_deadline(deadline: float | None, budget_seconds: float | None) -> float | None:
+        """Return the loop time a stage must finish by, if it is bounded at all."""
+
+        if budget_seconds is None:
+            return deadline
+        stage_deadline = asyncio.get_running_loop().time() + budget_seconds
+        return stage_deadline if deadline is None else min(deadline, stage_deadline)
+
+    async def wait_for_refreshes(self) -> None:
+        """Wait for pending background refreshes and prefetches, for example before shutdown."""
+
+        await asyncio.gather(*self._refreshes.values(), *self._prefetches)
+
+    async def _live_states(self, area: GeographicArea) -> tuple[LiveStates, bool]:
+        budget_seconds = self.stale_budget_seconds
+        if budget_seconds is None:
+            return await self._fetch_live_states(area), False
+
+        cell, radius_steps, region = snap_to_region(
+            area,
+            cell_degrees=self.region_cell_degrees,
+            radius_step_km=self.region_radius_step_km,
+        )
+        now = self.clock()
+        cached = self._regions.get(cell)
+        if cached is not None and (now - cached.fetched_at).total_seconds() >= budget_seconds:
+            cached = None
+        if cached is not None and cached.radius_steps >= radius_steps:
+            age_seconds = (now - cached.fetched_at).total_seconds()
+            if age_seconds < self.revalidate_after_seconds:
+                return cached.states, False
+            self._schedule_refresh(cell, cached.radius_steps, budget_seconds)
+            return cached.states, True
+
+        states = await self._fetch_live_states(region)
+        self._store_region(cell, radius_steps, states, budget_seconds)
+        return states, False
+
+    async def _fetch_live_states(self, area: GeographicArea) -> LiveStates:
+        # Columnar providers stay columnar; converting rows would only add work.
+        if isinstance(self.provider, SupportsAircraftBatch):
+            return await self.provider.get_aircraft_batch(area)
+        return await self.provider.get_aircraft(area)
+
+    def _region_area(self, cell: GridCell, radius_steps: int) -> GeographicArea:
+        return region_area(
+            cell,
+            radius_steps,
+            cell_degrees=self.region_cell_degrees,
+            radius_step_km=self.region_radius_step_km,
+        )
+
+    def _schedule_refresh(self, cell: GridCell, radius_steps: int, budget_seconds: float) -> None:
+        if cell in self._refreshes:
+            return
+        task = asyncio.create_task(self._refresh_region(cell, radius_steps, budget_seconds))
+        self._refreshes[cell] = task
+        task.add_done_callback(lambda _task: self._refreshes.pop(cell, None))
+
+    async def _refresh_region(
+        self, cell: GridCell, radius_steps: int, budget_seconds: float
+    ) -> None:
+        # A hung refresh is abandoned after the live-state budget, or once
+        # its result would be too old to serve anyway, so the region can be
+        # refreshed again.
+        timeout_seconds = self.live_state_budget_seconds or budget_seconds
+        try:
+            async with asyncio.timeout(timeout_seconds):
+                states = await self._fetch_live_states(self._region_area(cell, radius_steps))
+        except (ProviderError, TimeoutError):
+            # Keep serving the last good set until the stale budget runs out.
+            return
+        self._store_region(cell, radius_steps, states, budget_seconds)
+
+    def _store_region(
+        self, cell: GridCell, radius_steps: int, states: LiveStates, budget_seconds: float
+    ) -> None:
+        now = self.clock()
+        while self._regions:
+            oldest = next(iter(self._regions.values()))
+            if (now - oldest.fetched_at).total_seconds() < budget_seconds:
+                break
+            self._regions.popitem(last=False)
+        self._regions.pop(cell, None)
+        self._regions[cell] = _Region(now, radius_steps, states)
+
+    def _inbound_search_km(self) -> float:
+        """Widen live queries so aircraft that could arrive before the next poll are seen."""
+
+        if self.quiet_refresh_after_seconds is None:
+            return 0.0
+        return min(
+            INBOUND_SEARCH_SPEED_KNOTS
+            * KM_PER_NAUTICAL_MILE
+            * (self.quiet_refresh_after_seconds / 3_600),
+            INBOUND_SEARCH_MAX_KM,
+        )
+
+    def _refresh_after(
+        self, states: Iterable[AircraftState], zone: ViewingZone, *, visible: bool
+    ) -> int:
+        if self.quiet_refresh_after_seconds is None:
+            return self.refresh_after_seconds
+
+        # Quiet polls never outrun what the capped inbound search can see.
+        ceiling = (
+            self.refresh_after_seconds
+            if visible
+            else min(self.quiet_refresh_after_seconds, INBOUND_SEARCH_HORIZON_SECONDS)
         )
+        entry = earliest_entry_seconds(states, zone, horizon_seconds=ceiling)
+        if entry is None:
+            return ceiling
+        return max(self.minimum_refresh_after_seconds, min(ceiling, ceil(entry)))
 
-    async def _get_optional_enrichment(self, match: VisibleAircraft) -> FlightInformation | None:
+    async def _get_optional_enrichment(
+        self, ranked: Sequence[VisibleAircraft], deadline: float | None
+    ) -> FlightInformation | None:
+        if len(ranked) > 1 and isinstance(self.provider, SupportsFlightInformationBatch):
+            # Warm likely successors in the background, so a slow candidate
+            # never holds back or discards the primary's answer.
+            task = asyncio.create_task(
+                self._prefetch_enrichment(self.provider, [match.aircraft for match in ranked[1:]])
+            )
+            self._prefetches.add(task)
+            task.add_done_callback(self._prefetches.discard)
         try:
-            return await self.provider.get_flight_information(match.aircraft)
-        except ProviderError:
-            # Live state remains useful when optional enrichment is degraded.
+            async with asyncio.timeout_at(deadline):
+                return await self.provider.get_flight_information(ranked[0].aircraft)
+        except (ProviderError, TimeoutError):
+            # Live state remains useful when optional enrichment is degraded or late.
             return None
 
+    @staticmethod
+    async def _prefetch_enrichment(
+        provider: SupportsFlightInformationBatch, aircraft: list[AircraftState]
+    ) -> None:
+        with suppress(ProviderError):
+            await provider.get_flight_information_many(aircraft)
+
     @staticmethod
     def _display_aircraft(
         match: VisibleAircraft, enrichment: FlightInformation | None
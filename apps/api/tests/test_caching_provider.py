@@ -0,0 +1,118 @@
+from unittest import IsolatedAsyncioTestCase
+
+from flight_tracker.domain.geometry import batch_within_distance, great_circle_distance_km
+from flight_tracker.domain.models import AircraftBatch, AircraftState
+from flight_tracker.providers import (
+    CachingFlightDataProvider,
+    FlightDataProvider,
+    GeographicArea,
+    MockFlightDataProvider,
+    fetch_aircraft_batch,
+)
+
+
+class BatchOnlyMockProvider(MockFlightDataProvider):
+    async def get_aircraft(self, area: GeographicArea) -> list[AircraftState]:
+        raise AssertionError("the cache should fetch columnar batches")
+
+
+class CachingProviderTests(IsolatedAsyncioTestCase):
+    area = GeographicArea(center_latitude=51.477, center_longitude=-0.210, radius_km=35.0)
+    neighbour = GeographicArea(center_latitude=51.30, center_longitude=-0.40, radius_km=20.0)
+
+    def setUp(self) -> None:
+        self.now = 1_000.0
+        self.upstream = MockFlightDataProvider()
+        self.provider = CachingFlightDataProvider(
+            self.upstream, ttl_seconds=10.0, clock=lambda: self.now
+        )
+
+    async def test_requests_in_one_bucket_share_an_upstream_fetch(self) -> None:
+        first = await self.provider.get_aircraft(self.area)
+        second = await self.provider.get_aircraft(self.neighbour)
+
+        self.assertEqual(self.upstream.tick, 1)
+        self.assertEqual(self.provider.stats.hits, 1)
+        self.assertEqual(self.provider.stats.misses, 1)
+        self.assertEqual(self.provider.stats.hit_rate, 0.5)
+        self.assertTrue(first)
+        for area, states in ((self.area, first), (self.neighbour, second)):
+            for state in states:
+                self.assertLessEqual(
+                    great_circle_distance_km(
+                        area.center_latitude,
+                        area.center_longitude,
+                        state.latitude,
+                        state.longitude,
+                    ),
+                    area.radius_km,
+                )
+
+    async def test_local_filtering_matches_the_bucket_response(self) -> None:
+        _, _, bucket = self.provider.bucket_for(self.area)
+        reference = MockFlightDataProvider()
+        expected = [
+            state
+            for state in await reference.get_aircraft(bucket)
+            if great_circle_distance_km(
+                self.area.center_latitude,
+                self.area.center_longitude,
+                state.latitude,
+                state.longitude,
+            )
+            <= self.area.radius_km
+        ]
+
+        states = await self.provider.get_aircraft(self.area)
+
+        self.assertCountEqual(states, expected)
+
+    async def test_bucket_covers_every_request_that_snaps_to_it(self) -> None:
+        for area in (self.area, self.neighbour):
+            _, _, bucket = self.provider.bucket_for(area)
+            self.assertLessEqual(
+                great_circle_distance_km(
+                    bucket.center_latitude,
+                    bucket.center_longitude,
+                    area.center_latitude,
+                    area.center_longitude,
+                )
+                + area.radius_km,
+                bucket.radius_km,
+            )
+
+    async def test_expired_buckets_are_fetched_again(self) -> None:
+        await self.provider.get_aircraft(self.area)
+        self.now += 10.0
+
+        await self.provider.get_aircraft(self.area)
+
+        self.assertEqual(self.upstream.tick, 2)
+        self.assertEqual(self.provider.stats.misses, 2)
+        self.assertEqual(self.provider.stats.entries, 1)
+
+    async def test_satisfies_the_provider_protocol(self) -> None:
+        self.assertIsInstance(self.provider, FlightDataProvider)
+        self.assertEqual(self.provider.capabilities, self.upstream.capabilities)
+
+    async def test_buckets_stay_columnar_end_to_end(self) -> None:
+        upstream = BatchOnlyMockProvider(traffic_size=500)
+        provider = CachingFlightDataProvider(upstream, clock=lambda: self.now)
+        _, _, bucket = provider.bucket_for(self.area)
+        reference = await MockFlightDataProvider(traffic_size=500).get_aircraft_batch(bucket)
+
+        batch = await fetch_aircraft_batch(provider, self.area)
+
+        self.assertIsInstance(batch, AircraftBatch)
+        self.assertEqual(
+            list(batch),
+            list(
+                batch_within_distance(
+                    reference,
+                    self.area.center_latitude,
+                    self.area.center_longitude,
+                    self.area.radius_km,
+                )
+            ),
+        )
+        self.assertTrue(0 < len(batch) < len(reference))
@@ -0,0 +1,169 @@
+import asyncio
+from contextlib import suppress
+from datetime import UTC, datetime
+from unittest import IsolatedAsyncioTestCase
+
+from flight_tracker.domain.errors import (
+    ProviderResponseInvalid,
+    ProviderTimeout,
+    ProviderUnavailable,
+)
+from flight_tracker.domain.models import AircraftState, SnapshotStatus, ViewingZone
+from flight_tracker.providers import (
+    CircuitBreakerFlightDataProvider,
+    CircuitState,
+    FlightDataProvider,
+    GeographicArea,
+    MockFlightDataProvider,
+    MockScenario,
+    fetch_flight_information_many,
+)
+from flight_tracker.services import DeviceSnapshotService
+
+
+class CountingMockProvider(MockFlightDataProvider):
+    def __init__(self, **kwargs: object) -> None:
+        super().__init__(**kwargs)  # type: ignore[arg-type]
+        self.aircraft_calls = 0
+
+    async def get_aircraft(self, area: GeographicArea) -> list[AircraftState]:
+        self.aircraft_calls += 1
+        return await super().get_aircraft(area)
+
+
+class HangingMockProvider(CountingMockProvider):
+    async def get_aircraft(self, area: GeographicArea) -> list[AircraftState]:
+        self.aircraft_calls += 1
+        await asyncio.Event().wait()
+        raise AssertionError("unreachable")
+
+
+class InvalidMockProvider(CountingMockProvider):
+    async def get_aircraft(self, area: GeographicArea) -> list[AircraftState]:
+        self.aircraft_calls += 1
+        raise ProviderResponseInvalid("payload could not be normalised")
+
+
+class CircuitBreakerTests(IsolatedAsyncioTestCase):
+    area = GeographicArea(center_latitude=51.477, center_longitude=-0.210, radius_km=35.0)
+
+    def setUp(self) -> None:
+        self.now = 0.0
+        self.upstream = CountingMockProvider(scenario=MockScenario.TIMEOUT)
+        self.provider = CircuitBreakerFlightDataProvider(
+            self.upstream,
+            failure_rate_threshold=0.5,
+            window_size=4,
+            minimum_calls=4,
+            open_seconds=30.0,
+            clock=lambda: self.now,
+        )
+
+    async def open_circuit(self) -> None:
+        for _ in range(4):
+            with self.assertRaises(ProviderTimeout):
+                await self.provider.get_aircraft(self.area)
+
+    async def test_repeated_timeouts_open_the_circuit_and_fail_fast(self) -> None:
+        await self.open_circuit()
+
+        with self.assertRaisesRegex(ProviderUnavailable, "circuit is open"):
+            await self.provider.get_aircraft(self.area)
+
+        self.assertEqual(self.provider.live_circuit.state, CircuitState.OPEN)
+        self.assertEqual(self.upstream.aircraft_calls, 4)
+
+    async def test_calls_cut_off_by_a_deadline_open_the_circuit(self) -> None:
+        upstream = HangingMockProvider()
+        provider = CircuitBreakerFlightDataProvider(
+            upstream, window_size=4, minimum_calls=4, clock=lambda: self.now
+        )
+        for _ in range(4):
+            with self.assertRaises(TimeoutError):
+                async with asyncio.timeout(0.01):
+                    await provider.get_aircraft(self.area)
+
+        self.assertEqual(provider.live_circuit.state, CircuitState.OPEN)
+        self.assertEqual(upstream.aircraft_calls, 4)
+
+    async def test_invalid_responses_open_the_circuit(self) -> None:
+        upstream = InvalidMockProvider()
+        provider = CircuitBreakerFlightDataProvider(
+            upstream, window_size=4, minimum_calls=4, clock=lambda: self.now
+        )
+        for _ in range(4):
+            with self.assertRaises(ProviderResponseInvalid):
+                await provider.get_aircraft(self.area)
+
+        self.assertEqual(provider.live_circuit.state, CircuitState.OPEN)
+
+    async def test_failure_rate_below_threshold_keeps_the_circuit_closed(self) -> None:
+        for scenario in (MockScenario.NORMAL,) * 3 + (MockScenario.TIMEOUT,):
+            self.upstream.scenario = scenario
+            with suppress(ProviderTimeout):
+                await self.provider.get_aircraft(self.area)
+        self.upstream.scenario = MockScenario.NORMAL
+        await self.provider.get_aircraft(self.area)
+
+        self.assertEqual(self.provider.live_circuit.state, CircuitState.CLOSED)
+
+    async def test_successful_probe_closes_the_circuit(self) -> None:
+        await self.open_circuit()
+        self.now += 30.0
+        self.upstream.scenario = MockScenario.NORMAL
+
+        self.assertEqual(self.provider.live_circuit.state, CircuitState.HALF_OPEN)
+        self.assertTrue(await self.provider.get_aircraft(self.area))
+        self.assertEqual(self.provider.live_circuit.state, CircuitState.CLOSED)
+
+    async def test_failed_probe_reopens_the_circuit(self) -> None:
+        await self.open_circuit()
+        self.now += 30.0
+
+        with self.assertRaises(ProviderTimeout):
+            await self.provider.get_aircraft(self.area)
+
+        self.assertEqual(self.provider.live_circuit.state, CircuitState.OPEN)
+        self.assertEqual(self.upstream.aircraft_calls, 5)
+
+    async def test_enrichment_failures_do_not_open_the_live_circuit(self) -> None:
+        self.upstream.scenario = MockScenario.NORMAL
+        states = await self.upstream.get_aircraft(self.area)
+        self.upstream.scenario = MockScenario.TIMEOUT
+        for _ in range(4):
+            with self.assertRaises(ProviderTimeout):
+                await self.provider.get_flight_information(states[0])
+
+        self.assertEqual(self.provider.enrichment_circuit.state, CircuitState.OPEN)
+        self.assertEqual(self.provider.live_circuit.state, CircuitState.CLOSED)
+
+    async def test_batch_enrichment_goes_through_the_enrichment_circuit(self) -> None:
+        states = await MockFlightDataProvider().get_aircraft(self.area)
+        for _ in range(4):
+            await fetch_flight_information_many(self.provider, states[:1])
+
+        self.assertEqual(self.provider.enrichment_circuit.state, CircuitState.OPEN)
+        self.assertEqual(self.provider.live_circuit.state, CircuitState.CLOSED)
+
+    async def test_snapshot_service_degrades_without_calling_upstream(self) -> None:
+        await self.open_circuit()
+        service = DeviceSnapshotService(
+            self.provider, clock=lambda: datetime(2026, 8, 8, 12, 0, tzinfo=UTC)
+        )
+        zone = ViewingZone(
+            device_id="device-1",
+            name="North window",
+            latitude=51.477,
+            longitude=-0.210,
+            bearing_degrees=0.0,
+            field_of_view_degrees=80.0,
+            max_distance_km=35.0,
+        )
+
+        snapshot = await service.generate(zone)
+
+        self.assertEqual(snapshot.status, SnapshotStatus.PROVIDER_UNAVAILABLE)
+        self.assertEqual(self.upstream.aircraft_calls, 4)
+
+    async def test_satisfies_the_provider_protocol(self) -> None:
+        self.assertIsInstance(self.provider, FlightDataProvider)
@@ -0,0 +1,175 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from flight_tracker.domain.errors import ProviderTimeout
+from flight_tracker.domain.models import AircraftState, FlightInformation
+from flight_tracker.providers import (
+    CachingFlightDataProvider,
+    CoalescingFlightDataProvider,
+    FlightDataProvider,
+    GeographicArea,
+    MockFlightDataProvider,
+    MockScenario,
+    SingleFlight,
+)
+
+
+class CountingMockProvider(MockFlightDataProvider):
+    def __init__(self, **kwargs: object) -> None:
+        super().__init__(**kwargs)  # type: ignore[arg-type]
+        self.aircraft_calls = 0
+        self.enrichment_calls = 0
+
+    async def get_aircraft(self, area: GeographicArea) -> list[AircraftState]:
+        self.aircraft_calls += 1
+        await asyncio.sleep(0)
+        return await super().get_aircraft(area)
+
+    async def get_flight_information(self, aircraft: AircraftState) -> FlightInformation | None:
+        self.enrichment_calls += 1
+        await asyncio.sleep(0)
+        return await super().get_flight_information(aircraft)
+
+
+class SingleFlightTests(IsolatedAsyncioTestCase):
+    async def test_cancelling_one_caller_keeps_the_shared_call_running(self) -> None:
+        flights: SingleFlight[str, int] = SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def operation() -> int:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return 7
+
+        first = asyncio.create_task(flights.run("key", operation))
+        second = asyncio.create_task(flights.run("key", operation))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        self.assertEqual(await second, 7)
+        self.assertTrue(first.cancelled())
+        self.assertEqual(calls, 1)
+        self.assertEqual(len(flights), 0)
+
+    async def test_cancelling_every_caller_cancels_the_shared_call(self) -> None:
+        flights: SingleFlight[str, None] = SingleFlight()
+        started = asyncio.Event()
+
+        async def operation() -> None:
+            started.set()
+            await asyncio.Event().wait()
+
+        caller = asyncio.create_task(flights.run("key", operation))
+        await started.wait()
+        caller.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0)
+
+        self.assertEqual(len(flights), 0)
+
+    async def test_caller_after_an_abandoned_call_starts_a_fresh_one(self) -> None:
+        flights: SingleFlight[str, int] = SingleFlight()
+        calls = 0
+
+        async def operation() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        abandoned = asyncio.create_task(flights.run("key", operation))
+        await asyncio.sleep(0)
+        abandoned.cancel()
+        await asyncio.sleep(0)
+        # The abandoned task is still unwinding its cancellation here.
+        later = asyncio.create_task(flights.run("key", operation))
+
+        self.assertEqual(await later, 2)
+        self.assertTrue(abandoned.cancelled())
+        self.assertFalse(later.cancelled())
+        self.assertEqual(len(flights), 0)
+
+    async def test_abandoned_batch_is_cancelled(self) -> None:
+        flights: SingleFlight[str, int] = SingleFlight()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def operation(keys: list[str]) -> dict[str, int]:
+            started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return dict.fromkeys(keys, 1)
+
+        caller = asyncio.create_task(flights.run_many(["a", "b"], operation))
+        await started.wait()
+        caller.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await caller
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1.0)
+        self.assertEqual(len(flights), 0)
+
+
+class CoalescingProviderTests(IsolatedAsyncioTestCase):
+    area = GeographicArea(center_latitude=51.477, center_longitude=-0.210, radius_km=35.0)
+
+    async def test_concurrent_polls_share_one_upstream_call(self) -> None:
+        upstream = CountingMockProvider()
+        provider = CoalescingFlightDataProvider(upstream)
+
+        results = await asyncio.gather(*(provider.get_aircraft(self.area) for _ in range(50)))
+
+        self.assertEqual(upstream.tick, 1)
+        self.assertTrue(all(result == results[0] for result in results))
+        self.assertIsNot(results[0], results[1])
+
+        await provider.get_aircraft(self.area)
+        self.assertEqual(upstream.tick, 2)
+
+    async def test_concurrent_enrichment_shares_one_call_per_flight(self) -> None:
+        upstream = CountingMockProvider()
+        provider = CoalescingFlightDataProvider(upstream)
+        states = await upstream.get_aircraft(self.area)
+
+        results = await asyncio.gather(
+            *(provider.get_flight_information(state) for state in states * 20)
+        )
+
+        self.assertEqual(upstream.enrichment_calls, len(states))
+        self.assertEqual(results[: len(states)], results[len(states) : 2 * len(states)])
+
+    async def test_failures_are_shared_and_not_retained(self) -> None:
+        upstream = CountingMockProvider(scenario=MockScenario.TIMEOUT)
+        provider = CoalescingFlightDataProvider(upstream)
+
+        results = await asyncio.gather(
+            *(provider.get_aircraft(self.area) for _ in range(10)), return_exceptions=True
+        )
+
+        self.assertTrue(all(isinstance(result, ProviderTimeout) for result in results))
+        self.assertEqual(upstream.aircraft_calls, 1)
+        upstream.scenario = MockScenario.NORMAL
+        self.assertTrue(await provider.get_aircraft(self.area))
+
+    async def test_caching_provider_coalesces_concurrent_bucket_misses(self) -> None:
+        upstream = CountingMockProvider()
+        provider = CachingFlightDataProvider(upstream)
+        neighbour = GeographicArea(center_latitude=51.30, center_longitude=-0.40, radius_km=35.0)
+
+        await asyncio.gather(*(provider.get_aircraft(area) for area in (self.area, neighbour) * 25))
+
+        self.assertEqual(upstream.tick, 1)
+        self.assertEqual(provider.stats.entries, 1)
+
+    async def test_satisfies_the_provider_protocol(self) -> None:
+        self.assertIsInstance(
+            CoalescingFlightDataProvider(MockFlightDataProvider()), FlightDataProvider
+        )
@@ -0,0 +1,157 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest import IsolatedAsyncioTestCase
+
+from flight_tracker.domain.errors import ProviderTimeout
+from flight_tracker.domain.models import AircraftState, FlightInformation
+from flight_tracker.providers import (
+    CompositeFlightDataProvider,
+    FlightDataProvider,
+    GeographicArea,
+    ProviderCapability,
+)
+
+NOW = datetime(2026, 8, 8, 12, 0, tzinfo=UTC)
+
+
+class StaticProvider:
+    def __init__(
+        self,
+        name: str,
+        states: list[AircraftState],
+        *,
+        capabilities: frozenset[ProviderCapability] = frozenset(),
+        delay: float = 0.0,
+        failing: bool = False,
+    ) -> None:
+        self.name = name
+        self.capabilities = capabilities | {ProviderCapability.LIVE_POSITION}
+        self.states = states
+        self.delay = delay
+        self.failing = failing
+        self.enrichment_calls = 0
+
+    async def get_aircraft(self, area: GeographicArea) -> list[AircraftState]:
+        await asyncio.sleep(self.delay)
+        if self.failing:
+            raise ProviderTimeout(f"{self.name} timed out")
+        return self.states
+
+    async def get_flight_information(self, aircraft: AircraftState) -> FlightInformation | None:
+        self.enrichment_calls += 1
+        await asyncio.sleep(self.delay)
+        if self.failing:
+            raise ProviderTimeout(f"{self.name} timed out")
+        return FlightInformation(provider=self.name, enriched_at=NOW, flight_number="FT281")
+
+
+def state(
+    provider: str, identifier: str, *, age_seconds: float = 0.0, **values: object
+) -> AircraftState:
+    return AircraftState(
+        provider=provider,
+        provider_aircraft_id=identifier,
+        latitude=51.5,
+        longitude=-0.2,
+        observed_at=NOW - timedelta(seconds=age_seconds),
+        **values,  # type: ignore[arg-type]
+    )
+
+
+class CompositeProviderTests(IsolatedAsyncioTestCase):
+    area = GeographicArea(center_latitude=51.477, center_longitude=-0.210, radius_km=35.0)
+
+    def setUp(self) -> None:
+        self.receiver = StaticProvider(
+            "receiver",
+            [
+                state("receiver", "r1", icao_hex="4ca1b2", age_seconds=1.0),
+                state("receiver", "r2", registration="G-ABCD", age_seconds=20.0),
+                state("receiver", "r3"),
+            ],
+            capabilities=frozenset({ProviderCapability.ALTITUDE}),
+        )
+        self.cloud = StaticProvider(
+            "cloud",
+            [
+                state("cloud", "c1", icao_hex="4CA1B2", age_seconds=10.0),
+                state("cloud", "c2", registration="GABCD", age_seconds=5.0),
+                state("cloud", "c3", icao_hex="400001"),
+            ],
+            capabilities=frozenset({ProviderCapability.ROUTE}),
+        )
+        self.provider = CompositeFlightDataProvider([self.receiver, self.cloud])
+
+    async def test_merges_duplicates_keeping_the_freshest_observation(self) -> None:
+        states = await self.provider.get_aircraft(self.area)
+
+        identifiers = sorted(aircraft.provider_aircraft_id for aircraft in states)
+        self.assertEqual(identifiers, ["c2", "c3", "r1", "r3"])
+
+    async def test_queries_providers_concurrently(self) -> None:
+        self.receiver.delay = self.cloud.delay = 0.05
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+
+        await self.provider.get_aircraft(self.area)
+
+        self.assertLess(loop.time() - started_at, 0.09)
+
+    async def test_tolerates_a_failing_provider(self) -> None:
+        self.cloud.failing = True
+
+        states = await self.provider.get_aircraft(self.area)
+
+        self.assertEqual(len(states), 3)
+
+    async def test_raises_when_every_provider_fails(self) -> None:
+        self.receiver.failing = self.cloud.failing = True
+
+        with self.assertRaises(ProviderTimeout):
+            await self.provider.get_aircraft(self.area)
+
+    async def test_a_late_provider_counts_as_failed(self) -> None:
+        self.cloud.delay = 5.0
+        provider = CompositeFlightDataProvider(
+            [self.receiver, self.cloud], provider_timeout_seconds=0.02
+        )
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+
+        states = await provider.get_aircraft(self.area)
+        information = await provider.get_flight_information(state("cloud", "c3"))
+
+        self.assertLess(loop.time() - started_at, 1.0)
+        self.assertEqual(len(states), 3)
+        self.assertEqual(information.provider if information else None, "receiver")
+
+    async def test_raises_a_timeout_when_every_provider_is_late(self) -> None:
+        self.receiver.delay = self.cloud.delay = 5.0
+        provider = CompositeFlightDataProvider(
+            [self.receiver, self.cloud], provider_timeout_seconds=0.02
+        )
+
+        with self.assertRaises(ProviderTimeout):
+            await provider.get_aircraft(self.area)
+
+    async def test_enrichment_prefers_the_reporting_provider_then_fails_over(self) -> None:
+        aircraft = state("cloud", "c3", icao_hex="400001")
+
+        information = await self.provider.get_flight_information(aircraft)
+        self.assertEqual(information.provider if information else None, "cloud")
+        self.assertEqual(self.receiver.enrichment_calls, 0)
+
+        self.cloud.failing = True
+        information = await self.provider.get_flight_information(aircraft)
+        self.assertEqual(information.provider if information else None, "receiver")
+
+    async def test_reports_the_union_of_capabilities(self) -> None:
+        self.assertIsInstance(self.provider, FlightDataProvider)
+        self.assertEqual(
+            self.provider.capabilities,
+            {
+                ProviderCapability.LIVE_POSITION,
+                ProviderCapability.ALTITUDE,
+                ProviderCapability.ROUTE,
+            },
+        )
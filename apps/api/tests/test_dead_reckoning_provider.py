@@ -0,0 +1,57 @@
+from datetime import UTC, datetime, timedelta
+from unittest import IsolatedAsyncioTestCase
+
+from flight_tracker.providers import (
+    DeadReckoningFlightDataProvider,
+    GeographicArea,
+    MockFlightDataProvider,
+)
+
+START = datetime(2026, 8, 8, 12, 0, tzinfo=UTC)
+
+
+class DeadReckoningProviderTests(IsolatedAsyncioTestCase):
+    area = GeographicArea(center_latitude=51.477, center_longitude=-0.210, radius_km=35.0)
+
+    def setUp(self) -> None:
+        self.now = START
+        self.upstream = MockFlightDataProvider(start_time=START)
+        self.provider = DeadReckoningFlightDataProvider(
+            self.upstream,
+            reuse_for_seconds=90.0,
+            max_extrapolation_seconds=120.0,
+            clock=lambda: self.now,
+        )
+
+    async def test_reuses_frame_with_extrapolated_positions(self) -> None:
+        fresh = await self.provider.get_aircraft(self.area)
+        self.now = START + timedelta(seconds=60)
+
+        predicted = await self.provider.get_aircraft(self.area)
+
+        self.assertEqual(self.upstream.tick, 1)
+        self.assertEqual(len(predicted), len(fresh))
+        moving = [state for state in predicted if state.ground_speed_knots is not None]
+        self.assertTrue(moving)
+        self.assertTrue(all(state.extrapolated_at == self.now for state in moving))
+        self.assertNotEqual(
+            (moving[0].latitude, moving[0].longitude),
+            (fresh[0].latitude, fresh[0].longitude),
+        )
+
+    async def test_fetches_upstream_once_the_reuse_window_expires(self) -> None:
+        await self.provider.get_aircraft(self.area)
+        self.now = START + timedelta(seconds=90)
+
+        states = await self.provider.get_aircraft(self.area)
+
+        self.assertEqual(self.upstream.tick, 2)
+        self.assertFalse(any(state.is_extrapolated for state in states))
+
+    async def test_enrichment_passes_through(self) -> None:
+        states = await self.provider.get_aircraft(self.area)
+
+        enrichment = await self.provider.get_flight_information(states[0])
+
+        self.assertEqual(enrichment, await self.upstream.get_flight_information(states[0]))
+        self.assertEqual(self.provider.name, "mock")
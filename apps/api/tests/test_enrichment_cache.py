@@ -0,0 +1,335 @@
+import asyncio
+import traceback
+from collections.abc import Sequence
+from contextlib import ExitStack
+from dataclasses import replace
+from datetime import timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import IsolatedAsyncioTestCase
+
+from flight_tracker.domain.errors import (
+    ProviderRateLimited,
+    ProviderTimeout,
+    RequestBudgetExhausted,
+)
+from flight_tracker.domain.models import AircraftState, FlightInformation
+from flight_tracker.providers import (
+    CachingFlightDataProvider,
+    CircuitBreakerFlightDataProvider,
+    CoalescingFlightDataProvider,
+    CompositeFlightDataProvider,
+    DeadReckoningFlightDataProvider,
+    EnrichmentCachingFlightDataProvider,
+    FlightDataProvider,
+    GeographicArea,
+    MockFlightDataProvider,
+    MockScenario,
+    RateLimitedFlightDataProvider,
+    RecordingFlightDataProvider,
+    RequestBudget,
+    SupportsFlightInformationBatch,
+    fetch_flight_information_many,
+)
+
+
+class CountingMockProvider(MockFlightDataProvider):
+    def __init__(self, **kwargs: object) -> None:
+        super().__init__(**kwargs)  # type: ignore[arg-type]
+        self.enrichment_calls = 0
+        self.unknown: set[str] = set()
+
+    async def get_flight_information(self, aircraft: AircraftState) -> FlightInformation | None:
+        self.enrichment_calls += 1
+        if aircraft.provider_aircraft_id in self.unknown:
+            return None
+        return await super().get_flight_information(aircraft)
+
+
+class BulkMockProvider(CountingMockProvider):
+    def __init__(self, **kwargs: object) -> None:
+        super().__init__(**kwargs)
+        self.batch_sizes: list[int] = []
+
+    async def get_flight_information_many(
+        self, aircraft: Sequence[AircraftState]
+    ) -> list[FlightInformation | None]:
+        self.batch_sizes.append(len(aircraft))
+        return [await super().get_flight_information(state) for state in aircraft]
+
+
+class BatchEnrichmentTests(IsolatedAsyncioTestCase):
+    area = GeographicArea(center_latitude=51.477, center_longitude=-0.210, radius_km=35.0)
+
+    async def asyncSetUp(self) -> None:
+        self.states = await MockFlightDataProvider().get_aircraft(self.area)
+
+    async def test_fan_out_respects_the_concurrency_limit(self) -> None:
+        active = 0
+        peak = 0
+
+        class SlowProvider(CountingMockProvider):
+            async def get_flight_information(
+                self, aircraft: AircraftState
+            ) -> FlightInformation | None:
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0)
+                active -= 1
+                return await super().get_flight_information(aircraft)
+
+        upstream = SlowProvider()
+        results = await fetch_flight_information_many(upstream, self.states * 3, concurrency=2)
+
+        self.assertEqual(peak, 2)
+        self.assertEqual(len(results), len(self.states) * 3)
+        self.assertEqual(
+            results[0], await MockFlightDataProvider().get_flight_information(self.states[0])
+        )
+
+    async def test_fan_out_turns_failed_lookups_into_none(self) -> None:
+        upstream = CountingMockProvider(scenario=MockScenario.TIMEOUT)
+
+        results = await fetch_flight_information_many(upstream, self.states)
+
+        self.assertEqual(results, [None] * len(self.states))
+
+    async def test_cache_sends_only_misses_upstream_in_one_request(self) -> None:
+        upstream = BulkMockProvider()
+        provider = EnrichmentCachingFlightDataProvider(upstream)
+        await provider.get_flight_information(self.states[0])
+
+        results = await provider.get_flight_information_many(self.states)
+        repeated = await provider.get_flight_information_many(self.states)
+
+        self.assertEqual(upstream.batch_sizes, [len(self.states) - 1])
+        self.assertEqual(results, repeated)
+        self.assertEqual(provider.stats.misses, len(self.states))
+
+    async def test_cache_fans_out_misses_for_single_lookup_providers(self) -> None:
+        upstream = CountingMockProvider()
+        provider = EnrichmentCachingFlightDataProvider(upstream)
+
+        await provider.get_flight_information_many(self.states + self.states)
+
+        self.assertEqual(upstream.enrichment_calls, len(self.states))
+        self.assertEqual(provider.stats.entries, len(self.states))
+
+    async def test_concurrent_single_and_batch_misses_share_one_lookup(self) -> None:
+        for single_first in (True, False):
+            with self.subTest(single_first=single_first):
+                upstream = BulkMockProvider()
+                provider = EnrichmentCachingFlightDataProvider(upstream)
+                single = provider.get_flight_information(self.states[0])
+                batch = provider.get_flight_information_many(self.states)
+
+                if single_first:
+                    information, results = await asyncio.gather(single, batch)
+                else:
+                    results, information = await asyncio.gather(batch, single)
+
+                self.assertEqual(upstream.enrichment_calls, len(self.states))
+                self.assertEqual(information, results[0])
+
+    async def test_wrappers_forward_batch_enrichment(self) -> None:
+        with TemporaryDirectory() as directory, ExitStack() as recordings:
+            wrappers = {
+                "caching": CachingFlightDataProvider,
+                "coalescing": CoalescingFlightDataProvider,
+                "rate_limit": RateLimitedFlightDataProvider,
+                "circuit_breaker": CircuitBreakerFlightDataProvider,
+                "dead_reckoning": DeadReckoningFlightDataProvider,
+                "composite": lambda upstream: CompositeFlightDataProvider([upstream]),
+                "recording": lambda upstream: recordings.enter_context(
+                    RecordingFlightDataProvider(upstream, Path(directory) / "enrichment.rec")
+                ),
+            }
+            expected = await MockFlightDataProvider().get_flight_information(self.states[0])
+            for name, wrap in wrappers.items():
+                with self.subTest(wrapper=name):
+                    upstream = BulkMockProvider()
+                    provider = wrap(upstream)
+
+                    results = await fetch_flight_information_many(provider, self.states)
+
+                    self.assertIsInstance(provider, SupportsFlightInformationBatch)
+                    self.assertEqual(upstream.batch_sizes, [len(self.states)])
+                    self.assertEqual(results[0], expected)
+
+    async def test_coalesced_batches_join_lookups_in_flight(self) -> None:
+        upstream = BulkMockProvider()
+        provider = CoalescingFlightDataProvider(upstream)
+
+        await asyncio.gather(
+            provider.get_flight_information(self.states[0]),
+            provider.get_flight_information_many(self.states),
+            provider.get_flight_information_many(self.states[:2]),
+        )
+
+        self.assertEqual(upstream.enrichment_calls, len(self.states))
+
+    async def test_failed_joined_lookup_leaves_only_its_aircraft_unanswered(self) -> None:
+        failing = self.states[0].provider_aircraft_id
+
+        class FailingSingleProvider(BulkMockProvider):
+            async def get_flight_information(
+                self, aircraft: AircraftState
+            ) -> FlightInformation | None:
+                if aircraft.provider_aircraft_id == failing:
+                    raise ProviderTimeout("single lookup timed out")
+                return await super().get_flight_information(aircraft)
+
+        provider = CoalescingFlightDataProvider(FailingSingleProvider())
+
+        single, results = await asyncio.gather(
+            provider.get_flight_information(self.states[0]),
+            provider.get_flight_information_many(self.states),
+            return_exceptions=True,
+        )
+
+        self.assertIsInstance(single, ProviderTimeout)
+        assert isinstance(results, list)
+        self.assertIsNone(results[0])
+        self.assertTrue(all(result is not None for result in results[1:]))
+
+    async def test_failed_batch_is_raised_and_cached(self) -> None:
+        upstream = BulkMockProvider(scenario=MockScenario.TIMEOUT)
+        provider = EnrichmentCachingFlightDataProvider(upstream)
+
+        with self.assertRaises(ProviderTimeout):
+            await provider.get_flight_information_many(self.states)
+        with self.assertRaises(ProviderTimeout):
+            await provider.get_flight_information(self.states[0])
+
+        self.assertEqual(upstream.batch_sizes, [len(self.states)])
+        self.assertEqual(upstream.enrichment_calls, 1)
+
+    async def test_composite_batch_falls_back_for_unanswered_aircraft(self) -> None:
+        primary = BulkMockProvider()
+        primary.unknown = {self.states[0].provider_aircraft_id}
+        secondary = BulkMockProvider()
+        provider = CompositeFlightDataProvider([primary, secondary])
+
+        results = await provider.get_flight_information_many(self.states)
+
+        self.assertEqual(primary.batch_sizes, [len(self.states)])
+        self.assertEqual(secondary.batch_sizes, [1])
+        self.assertIsNotNone(results[0])
+
+
+class EnrichmentCacheTests(IsolatedAsyncioTestCase):
+    area = GeographicArea(center_latitude=51.477, center_longitude=-0.210, radius_km=35.0)
+
+    async def asyncSetUp(self) -> None:
+        self.now = 1_000.0
+        self.upstream = CountingMockProvider()
+        self.provider = EnrichmentCachingFlightDataProvider(
+            self.upstream,
+            ttl_seconds=600.0,
+            negative_ttl_seconds=30.0,
+            max_entries=2,
+            clock=lambda: self.now,
+        )
+        self.states = await MockFlightDataProvider().get_aircraft(self.area)
+
+    async def test_repeated_lookups_for_a_flight_hit_the_cache(self) -> None:
+        first = await self.provider.get_flight_information(self.states[0])
+        later_fix = replace(
+            self.states[0], observed_at=self.states[0].observed_at + timedelta(seconds=30)
+        )
+        second = await self.provider.get_flight_information(later_fix)
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.upstream.enrichment_calls, 1)
+        self.assertEqual(self.provider.stats.hits, 1)
+        self.assertEqual(self.provider.stats.misses, 1)
+
+    async def test_entries_expire_after_the_ttl(self) -> None:
+        await self.provider.get_flight_information(self.states[0])
+        self.now += 600.0
+
+        await self.provider.get_flight_information(self.states[0])
+
+        self.assertEqual(self.upstream.enrichment_calls, 2)
+
+    async def test_least_recently_used_entry_is_evicted(self) -> None:
+        for state in (self.states[0], self.states[1], self.states[0], self.states[2]):
+            await self.provider.get_flight_information(state)
+
+        await self.provider.get_flight_information(self.states[0])
+        self.assertEqual(self.upstream.enrichment_calls, 3)
+        await self.provider.get_flight_information(self.states[1])
+        self.assertEqual(self.upstream.enrichment_calls, 4)
+        self.assertEqual(self.provider.stats.entries, 2)
+        self.assertEqual(self.provider.stats.evictions, 2)
+
+    async def test_missing_enrichment_is_cached_for_the_negative_ttl(self) -> None:
+        self.upstream.unknown.add(self.states[0].provider_aircraft_id)
+
+        self.assertIsNone(await self.provider.get_flight_information(self.states[0]))
+        self.assertIsNone(await self.provider.get_flight_information(self.states[0]))
+        self.assertEqual(self.upstream.enrichment_calls, 1)
+
+        self.now += 30.0
+        await self.provider.get_flight_information(self.states[0])
+        self.assertEqual(self.upstream.enrichment_calls, 2)
+
+    async def test_provider_errors_are_cached_and_raised_again(self) -> None:
+        self.upstream.scenario = MockScenario.TIMEOUT
+
+        for _ in range(2):
+            with self.assertRaises(ProviderTimeout):
+                await self.provider.get_flight_information(self.states[0])
+        self.assertEqual(self.upstream.enrichment_calls, 1)
+
+        self.upstream.scenario = MockScenario.NORMAL
+        self.now += 30.0
+        self.assertIsNotNone(await self.provider.get_flight_information(self.states[0]))
+
+    async def test_cached_errors_are_raised_with_a_fresh_traceback(self) -> None:
+        self.upstream.scenario = MockScenario.TIMEOUT
+        raised: list[ProviderTimeout] = []
+
+        for _ in range(50):
+            try:
+                await self.provider.get_flight_information(self.states[0])
+            except ProviderTimeout as error:
+                raised.append(error)
+
+        self.assertEqual(len({id(error) for error in raised}), 50)
+        self.assertEqual(
+            len(traceback.extract_tb(raised[-1].__traceback__)),
+            len(traceback.extract_tb(raised[1].__traceback__)),
+        )
+
+    async def test_rate_limits_are_cached_until_retry_after(self) -> None:
+        self.upstream.scenario = MockScenario.RATE_LIMITED
+
+        with self.assertRaises(ProviderRateLimited):
+            await self.provider.get_flight_information(self.states[0])
+        self.now += 45.0
+        with self.assertRaises(ProviderRateLimited):
+            await self.provider.get_flight_information(self.states[0])
+
+        self.assertEqual(self.upstream.enrichment_calls, 1)
+
+    async def test_local_budget_refusals_are_not_cached(self) -> None:
+        budget = RequestBudget(
+            requests_per_minute=60.0, burst=1, live_reserve=0, clock=lambda: self.now
+        )
+        provider = EnrichmentCachingFlightDataProvider(
+            RateLimitedFlightDataProvider(self.upstream, budget), clock=lambda: self.now
+        )
+        await provider.get_flight_information(self.states[0])
+
+        with self.assertRaises(RequestBudgetExhausted):
+            await provider.get_flight_information(self.states[1])
+        self.now += 1.0
+
+        self.assertIsNotNone(await provider.get_flight_information(self.states[1]))
+        self.assertEqual(self.upstream.enrichment_calls, 2)
+
+    async def test_satisfies_the_provider_protocol(self) -> None:
+        self.assertIsInstance(self.provider, FlightDataProvider)
+        self.assertEqual(await self.provider.get_aircraft(self.area), self.states)
@@ -1,14 +1,19 @@
 from datetime import UTC, datetime
+from random import Random
 from unittest import TestCase
 
 from flight_tracker.domain.geometry import (
     angular_difference_degrees,
+    compile_viewing_zone,
     destination_point,
     evaluate_aircraft,
+    evaluate_aircraft_batch,
     great_circle_distance_km,
     initial_bearing_degrees,
+    visible_aircraft,
+    visible_aircraft_by_zone,
 )
-from flight_tracker.domain.models import AircraftState, ViewingZone
+from flight_tracker.domain.models import AircraftBatch, AircraftState, ViewingZone
 
 NOW = datetime(2026, 8, 8, 12, 0, tzinfo=UTC)
 
@@ -142,3 +147,134 @@ class VisibleSkyGeometryTests(TestCase):
         zone = self.make_zone(enabled=False)
 
         self.assertFalse(evaluate_aircraft(self.aircraft_at(0.0), zone).inside_view)
+
+    def test_batch_evaluation_matches_individual_evaluation(self) -> None:
+        zone = self.make_zone(
+            bearing_degrees=350.0,
+            field_of_view_degrees=40.0,
+            min_distance_km=5.0,
+            max_distance_km=20.0,
+            min_altitude_ft=1_000,
+        )
+        states = [
+            self.aircraft_at(float(bearing), distance, altitude)
+            for bearing in range(0, 360, 5)
+            for distance in (4.9, 5.0, 12.0, 20.0, 20.1)
+            for altitude in (None, 999, 20_000)
+        ]
+
+        expected = [evaluate_aircraft(state, zone) for state in states]
+        batch = evaluate_aircraft_batch(states, zone)
+
+        self.assertEqual(batch, [match for match in expected if match.inside_view])
+        self.assertTrue(batch)
+
+    def test_batch_evaluation_of_disabled_zone_is_empty(self) -> None:
+        zone = self.make_zone(enabled=False)
+
+        self.assertEqual(evaluate_aircraft_batch([self.aircraft_at(0.0)], zone), [])
+
+    def test_compiled_zone_is_cached_by_zone_value(self) -> None:
+        zone = self.make_zone(created_at=NOW, updated_at=NOW)
+        edited = self.make_zone(bearing_degrees=90.0, created_at=NOW, updated_at=NOW)
+
+        compiled = compile_viewing_zone(zone)
+
+        self.assertIs(
+            compile_viewing_zone(self.make_zone(created_at=NOW, updated_at=NOW)), compiled
+        )
+        self.assertIsNot(compile_viewing_zone(edited), compiled)
+        self.assertEqual(
+            compiled.evaluate(self.aircraft_at(40.01)),
+            evaluate_aircraft(self.aircraft_at(40.01), zone),
+        )
+
+    def test_prefilter_never_rejects_a_visible_aircraft(self) -> None:
+        rng = Random(7)
+        zones = (
+            self.make_zone(),
+            self.make_zone(bearing_degrees=350.0, field_of_view_degrees=2.0),
+            self.make_zone(field_of_view_degrees=300.0, min_distance_km=5.0),
+            self.make_zone(latitude=89.9, longitude=10.0, max_distance_km=60.0),
+            self.make_zone(latitude=-12.0, longitude=179.95, bearing_degrees=90.0),
+            self.make_zone(max_distance_km=25_000.0, field_of_view_degrees=360.0),
+        )
+        for zone in zones:
+            states = []
+            for index in range(400):
+                # Cluster candidates on the zone's edges as well as inside it.
+                bearing = zone.bearing_degrees + rng.choice((-1.0, 1.0)) * (
+                    zone.field_of_view_degrees / 2.0 + rng.uniform(-0.02, 0.02)
+                )
+                distance = rng.choice(
+                    (
+                        zone.max_distance_km + rng.uniform(-0.02, 0.02),
+                        zone.min_distance_km + rng.uniform(0.0, 0.02),
+                        rng.uniform(0.0, zone.max_distance_km * 2.0),
+                    )
+                )
+                latitude, longitude = destination_point(
+                    zone.latitude, zone.longitude, bearing % 360.0, distance
+                )
+                states.append(
+                    AircraftState(
+                        provider="test",
+                        provider_aircraft_id=f"edge-{index}",
+                        latitude=latitude,
+                        longitude=longitude,
+                        observed_at=NOW,
+                    )
+                )
+            with self.subTest(zone=zone.latitude):
+                expected = [evaluate_aircraft(state, zone) for state in states]
+                self.assertEqual(
+                    evaluate_aircraft_batch(states, zone),
+                    [match for match in expected if match.inside_view],
+                )
+
+    def test_prefilter_rejects_distant_aircraft(self) -> None:
+        compiled = compile_viewing_zone(self.make_zone())
+        far_north = destination_point(self.latitude, self.longitude, 0.0, 200.0)
+        behind = destination_point(self.latitude, self.longitude, 180.0, 10.0)
+        ahead = destination_point(self.latitude, self.longitude, 0.0, 10.0)
+
+        self.assertFalse(compiled.may_contain(*far_north))
+        self.assertFalse(compiled.may_contain(*behind))
+        self.assertTrue(compiled.may_contain(*ahead))
+
+    def test_multi_zone_evaluation_matches_each_zone(self) -> None:
+        zones = [
+            self.make_zone(),
+            self.make_zone(bearing_degrees=180.0, max_distance_km=15.0),
+            self.make_zone(bearing_degrees=90.0, min_altitude_ft=25_000),
+            self.make_zone(latitude=51.5, longitude=-0.1, field_of_view_degrees=360.0),
+            self.make_zone(enabled=False),
+        ]
+        states = [
+            self.aircraft_at(float(bearing), distance, altitude)
+            for bearing in range(0, 360, 15)
+            for distance in (3.0, 14.0, 30.0, 60.0)
+            for altitude in (None, 30_000)
+        ]
+
+        by_zone = visible_aircraft_by_zone(states, zones)
+
+        self.assertEqual(by_zone, [visible_aircraft(states, zone) for zone in zones])
+        self.assertTrue(all(by_zone[:4]))
+        self.assertEqual(by_zone[4], [])
+
+    def test_columnar_batches_are_evaluated_natively(self) -> None:
+        zones = [self.make_zone(), self.make_zone(bearing_degrees=180.0, min_altitude_ft=1_000)]
+        states = [
+            self.aircraft_at(float(bearing), distance, altitude)
+            for bearing in range(0, 360, 20)
+            for distance in (3.0, 30.0, 60.0)
+            for altitude in (None, 30_000)
+        ]
+        batch = AircraftBatch.from_states(states)
+
+        for zone in zones:
+            self.assertEqual(visible_aircraft(batch, zone), visible_aircraft(states, zone))
+        self.assertEqual(
+            visible_aircraft_by_zone(batch, zones), visible_aircraft_by_zone(states, zones)
+        )
@@ -0,0 +1,89 @@
+from unittest import TestCase
+
+from flight_tracker.domain.models import SnapshotStatus
+from flight_tracker.services import (
+    HistogramCollector,
+    LatencyHistogram,
+    SnapshotStage,
+    SnapshotTrace,
+)
+from flight_tracker.services.instrumentation import StageTimer
+
+
+class LatencyHistogramTests(TestCase):
+    def test_quantiles_fall_within_a_factor_of_two(self) -> None:
+        histogram = LatencyHistogram()
+        for millisecond in range(1, 101):
+            histogram.observe(millisecond / 1_000)
+
+        self.assertEqual(histogram.count, 100)
+        self.assertAlmostEqual(histogram.mean, 0.0505)
+        for fraction, exact in ((0.5, 0.050), (0.95, 0.095), (0.99, 0.099)):
+            with self.subTest(fraction=fraction):
+                estimate = histogram.quantile(fraction)
+                self.assertTrue(exact <= estimate <= 2 * exact, estimate)
+        self.assertEqual(histogram.quantile(1.0), 0.1)
+
+    def test_overflow_and_empty_histograms(self) -> None:
+        histogram = LatencyHistogram()
+        self.assertEqual(histogram.quantile(0.5), 0.0)
+
+        histogram.observe(500.0)
+
+        self.assertEqual(histogram.quantile(0.5), 500.0)
+        with self.assertRaises(ValueError):
+            histogram.quantile(1.5)
+
+
+class StageTimerTests(TestCase):
+    def test_laps_attribute_time_to_consecutive_stages(self) -> None:
+        ticks = iter((10.0, 10.5, 10.75, 12.0))
+        timer = StageTimer(lambda: next(ticks))
+
+        timer.lap(SnapshotStage.PROVIDER_FETCH)
+        timer.lap(SnapshotStage.VISIBILITY)
+        timer.lap(SnapshotStage.ASSEMBLY)
+
+        self.assertEqual(
+            timer.durations,
+            {
+                SnapshotStage.PROVIDER_FETCH: 0.5,
+                SnapshotStage.VISIBILITY: 0.25,
+                SnapshotStage.ASSEMBLY: 1.25,
+            },
+        )
+        self.assertEqual(timer.elapsed(), 2.0)
+
+
+class HistogramCollectorTests(TestCase):
+    def test_aggregates_stages_statuses_and_counts(self) -> None:
+        collector = HistogramCollector()
+        collector.record(
+            SnapshotTrace(
+                status=SnapshotStatus.MULTIPLE_AIRCRAFT,
+                total_seconds=0.03,
+                durations={SnapshotStage.PROVIDER_FETCH: 0.02, SnapshotStage.RANKING: 0.01},
+                aircraft_in=40,
+                visible=3,
+                ranked=3,
+            )
+        )
+        collector.record(
+            SnapshotTrace(
+                status=SnapshotStatus.PROVIDER_UNAVAILABLE,
+                total_seconds=1.0,
+                durations={SnapshotStage.PROVIDER_FETCH: 1.0},
+            )
+        )
+
+        summary = collector.summary()
+
+        self.assertEqual(set(summary), {"total", "provider_fetch", "ranking"})
+        self.assertEqual(summary["provider_fetch"]["count"], 2)
+        self.assertEqual(summary["provider_fetch"]["max_ms"], 1_000.0)
+        self.assertEqual(collector.statuses[SnapshotStatus.PROVIDER_UNAVAILABLE], 1)
+        self.assertEqual((collector.aircraft_in, collector.visible, collector.ranked), (40, 3, 3))
+
+        collector.reset()
+
+        self.assertEqual(collector.summary(), {})
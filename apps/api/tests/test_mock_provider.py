@@ -1,9 +1,17 @@
 from unittest import IsolatedAsyncioTestCase
 
-from flight_tracker.domain.errors import ProviderRateLimited, ProviderTimeout
-from flight_tracker.domain.geometry import evaluate_aircraft
+from flight_tracker.domain.errors import ProviderRateLimited, ProviderTimeout, ProviderUnavailable
+from flight_tracker.domain.geometry import evaluate_aircraft, great_circle_distance_km
 from flight_tracker.domain.models import ViewingZone
-from flight_tracker.providers import GeographicArea, MockFlightDataProvider, MockScenario
+from flight_tracker.providers import (
+    GeographicArea,
+    LatencyDistribution,
+    MockConditions,
+    MockFlightDataProvider,
+    MockLatency,
+    MockScenario,
+    fetch_aircraft_batch,
+)
 
 
 class MockProviderTests(IsolatedAsyncioTestCase):
@@ -66,3 +74,240 @@ class MockProviderTests(IsolatedAsyncioTestCase):
         with self.assertRaises(ProviderRateLimited) as raised:
             await limited_provider.get_aircraft(self.area)
         self.assertEqual(raised.exception.retry_after_seconds, 60)
+
+    async def test_columnar_frames_match_row_frames(self) -> None:
+        rows = MockFlightDataProvider(seed=42)
+        columns = MockFlightDataProvider(seed=42)
+
+        for _ in range(3):
+            batch = await fetch_aircraft_batch(columns, self.area)
+            self.assertEqual(list(batch), await rows.get_aircraft(self.area))
+        self.assertEqual(columns.tick, 3)
+
+
+class SyntheticTrafficTests(IsolatedAsyncioTestCase):
+    area = GeographicArea(center_latitude=51.477, center_longitude=-0.210, radius_km=150.0)
+
+    async def test_same_seed_produces_identical_traffic(self) -> None:
+        first = MockFlightDataProvider(seed=7, traffic_size=500)
+        second = MockFlightDataProvider(seed=7, traffic_size=500)
+        other = MockFlightDataProvider(seed=8, traffic_size=500)
+
+        frame = await first.get_aircraft(self.area)
+
+        self.assertEqual(frame, await second.get_aircraft(self.area))
+        self.assertNotEqual(frame, await other.get_aircraft(self.area))
+
+    async def test_generates_valid_moving_aircraft_inside_the_area(self) -> None:
+        provider = MockFlightDataProvider(traffic_size=1_000)
+
+        first = await provider.get_aircraft_batch(self.area)
+        second = await provider.get_aircraft_batch(self.area)
+
+        self.assertEqual(len(first), 1_000)
+        second.validate()
+        self.assertNotEqual(list(first.latitude), list(second.latitude))
+        for _, latitude, longitude, altitude in second.positions():
+            distance = great_circle_distance_km(
+                self.area.center_latitude, self.area.center_longitude, latitude, longitude
+            )
+            self.assertLessEqual(distance, self.area.radius_km + 0.01)
+            assert altitude is not None
+            self.assertTrue(1_000 <= altitude <= 43_000)
+        self.assertEqual(len({aircraft.icao_hex for aircraft in second}), 1_000)
+
+    async def test_altitude_follows_the_reported_vertical_speed(self) -> None:
+        provider = MockFlightDataProvider(traffic_size=1_000)
+        # Two hours in, many climbs and descents have reached a limit.
+        provider.tick = 240
+
+        first = await provider.get_aircraft_batch(self.area)
+        second = await provider.get_aircraft_batch(self.area)
+
+        levelled = climbing = 0
+        for before, after in zip(first, second, strict=True):
+            assert before.altitude_ft is not None and after.altitude_ft is not None
+            if after.altitude_ft in (1_000, 43_000):
+                self.assertEqual(after.vertical_speed_fpm, 0)
+                levelled += 1
+            rate = before.vertical_speed_fpm
+            change = after.altitude_ft - before.altitude_ft
+            if rate and after.vertical_speed_fpm == rate and change * rate > 0:
+                # Frames are 30 seconds apart.
+                self.assertAlmostEqual(change, rate / 2, delta=1)
+                climbing += 1
+        self.assertGreater(levelled, 0)
+        self.assertGreater(climbing, 0)
+
+    async def test_overlapping_areas_see_one_consistent_world(self) -> None:
+        provider = MockFlightDataProvider(traffic_size=2_000)
+        west = GeographicArea(center_latitude=51.5, center_longitude=-0.4, radius_km=40.0)
+        east = GeographicArea(center_latitude=51.5, center_longitude=0.0, radius_km=40.0)
+
+        west_positions = {
+            aircraft.icao_hex: (aircraft.latitude, aircraft.longitude)
+            for aircraft in await provider.get_aircraft(west)
+        }
+        provider.tick = 0
+        east_positions = {
+            aircraft.icao_hex: (aircraft.latitude, aircraft.longitude)
+            for aircraft in await provider.get_aircraft(east)
+        }
+        provider.tick = 0
+        world = await provider.get_aircraft(self.area)
+
+        shared = west_positions.keys() & east_positions.keys()
+        self.assertTrue(shared)
+        for icao_hex in shared:
+            self.assertEqual(west_positions[icao_hex], east_positions[icao_hex])
+        self.assertLess(len(west_positions), len(world))
+        for aircraft in world:
+            distance = great_circle_distance_km(
+                west.center_latitude, west.center_longitude, aircraft.latitude, aircraft.longitude
+            )
+            self.assertEqual(aircraft.icao_hex in west_positions, distance <= west.radius_km)
+
+    async def test_areas_outside_the_traffic_area_are_empty(self) -> None:
+        provider = MockFlightDataProvider(traffic_size=1_000)
+        elsewhere = GeographicArea(center_latitude=40.64, center_longitude=-73.78, radius_km=50.0)
+
+        self.assertEqual(await provider.get_aircraft(elsewhere), [])
+
+    async def test_large_fleets_keep_callsigns_and_flight_numbers_unique(self) -> None:
+        provider = MockFlightDataProvider(traffic_size=80_000)
+
+        fleet = await provider.get_aircraft_batch(self.area)
+        sample = [fleet[row] for row in (9_899 * 4, 9_900 * 4, 19_800 * 4)]
+        flight_numbers = [
+            enrichment.flight_number if enrichment else None
+            for enrichment in [await provider.get_flight_information(state) for state in sample]
+        ]
+
+        self.assertEqual(len(set(fleet.callsign)), len(fleet))
+        self.assertEqual(len(set(flight_numbers)), len(sample))
+        self.assertEqual([state.callsign for state in sample], ["SKY9999", "SKY100A", "SKY100B"])
+
+    async def test_synthetic_aircraft_have_enrichment(self) -> None:
+        provider = MockFlightDataProvider(traffic_size=10)
+        aircraft = (await provider.get_aircraft(self.area))[5]
+
+        enrichment = await provider.get_flight_information(aircraft)
+
+        assert enrichment is not None
+        self.assertEqual(enrichment.callsign, aircraft.callsign)
+        self.assertEqual(enrichment.registration, aircraft.registration)
+
+    async def test_scenarios_still_apply(self) -> None:
+        empty = MockFlightDataProvider(scenario=MockScenario.EMPTY, traffic_size=100)
+        timeout = MockFlightDataProvider(scenario=MockScenario.TIMEOUT, traffic_size=100)
+
+        self.assertEqual(await empty.get_aircraft(self.area), [])
+        with self.assertRaises(ProviderTimeout):
+            await timeout.get_aircraft(self.area)
+
+    def test_rejects_out_of_range_traffic_sizes(self) -> None:
+        for size in (0, 100_001):
+            with self.assertRaisesRegex(ValueError, "traffic_size"):
+                MockFlightDataProvider(traffic_size=size)
+
+
+class InjectedConditionsTests(IsolatedAsyncioTestCase):
+    area = GeographicArea(center_latitude=51.477, center_longitude=-0.210, radius_km=150.0)
+
+    def provider(
+        self,
+        *,
+        scenario: MockScenario = MockScenario.NORMAL,
+        conditions: MockConditions | None = None,
+        traffic_size: int | None = None,
+    ) -> tuple[MockFlightDataProvider, list[float]]:
+        delays: list[float] = []
+
+        async def sleep(seconds: float) -> None:
+            delays.append(seconds)
+
+        provider = MockFlightDataProvider(
+            seed=11,
+            scenario=scenario,
+            conditions=conditions,
+            traffic_size=traffic_size,
+            sleep=sleep,
+        )
+        return provider, delays
+
+    async def record(self, provider: MockFlightDataProvider, calls: int) -> list[str]:
+        outcomes: list[str] = []
+        for _ in range(calls):
+            try:
+                frame = await provider.get_aircraft(self.area)
+            except ProviderUnavailable:
+                outcomes.append("failed")
+            else:
+                outcomes.append(",".join(str(item.altitude_ft) for item in frame))
+        return outcomes
+
+    async def test_latency_and_failures_repeat_for_the_same_seed(self) -> None:
+        conditions = MockConditions(
+            live_latency=MockLatency(LatencyDistribution.LONG_TAIL, 0.1, tail_probability=0.2),
+            failure_rate=0.3,
+            partial_rate=0.2,
+        )
+        first, first_delays = self.provider(conditions=conditions, traffic_size=50)
+        second, second_delays = self.provider(conditions=conditions, traffic_size=50)
+
+        outcomes = await self.record(first, 40)
+
+        self.assertEqual(outcomes, await self.record(second, 40))
+        self.assertEqual(first_delays, second_delays)
+        self.assertIn("failed", outcomes)
+        self.assertGreater(max(first_delays), 0.5)
+        self.assertEqual(first.tick, 40 - outcomes.count("failed"))
+
+    async def test_fixed_and_lognormal_latency(self) -> None:
+        fixed, fixed_delays = self.provider(
+            conditions=MockConditions(live_latency=MockLatency(median_seconds=0.2))
+        )
+        spread, spread_delays = self.provider(
+            conditions=MockConditions(
+                live_latency=MockLatency(LatencyDistribution.LOGNORMAL, 0.2, sigma=0.5)
+            )
+        )
+
+        for _ in range(20):
+            await fixed.get_aircraft(self.area)
+            await spread.get_aircraft(self.area)
+
+        self.assertEqual(fixed_delays, [0.2] * 20)
+        self.assertEqual(len(set(spread_delays)), 20)
+        self.assertLess(min(spread_delays), 0.2)
+        self.assertGreater(max(spread_delays), 0.2)
+
+    async def test_slow_enrichment_scenario_delays_only_enrichment(self) -> None:
+        provider, delays = self.provider(scenario=MockScenario.SLOW_ENRICHMENT)
+
+        frame = await provider.get_aircraft(self.area)
+        self.assertEqual(delays, [])
+        await provider.get_flight_information(frame[0])
+
+        self.assertEqual(len(delays), 1)
+        self.assertGreater(delays[0], 0.5)
+
+    async def test_partial_scenario_drops_optional_fields(self) -> None:
+        provider, _ = self.provider(scenario=MockScenario.PARTIAL, traffic_size=200)
+
+        frame = await fetch_aircraft_batch(provider, self.area)
+        enrichments = [await provider.get_flight_information(item) for item in list(frame)[:50]]
+
+        stripped = [row for row in range(len(frame)) if frame[row].callsign is None]
+        self.assertTrue(20 < len(stripped) < 100)
+        self.assertTrue(all(frame[row].altitude_ft is None for row in stripped))
+        self.assertTrue(all(frame[row].latitude for row in stripped))
+        self.assertTrue(
+            any(item is not None and item.flight_number is None for item in enrichments)
+        )
+
+    def test_rejects_invalid_conditions(self) -> None:
+        with self.assertRaises(ValueError):
+            MockConditions(failure_rate=1.5)
+        with self.assertRaises(ValueError):
+            MockLatency(median_seconds=-1.0)
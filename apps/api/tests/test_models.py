@@ -1,8 +1,9 @@
 from datetime import UTC, datetime
 from unittest import TestCase
 
-from flight_tracker.domain.errors import DomainValidationError
+from flight_tracker.domain.errors import AircraftRowsInvalid, DomainValidationError
 from flight_tracker.domain.models import (
+    AircraftBatch,
     AircraftState,
     DisplayAircraft,
     DisplaySnapshot,
@@ -76,6 +77,98 @@ class AircraftStateValidationTests(TestCase):
             )
 
 
+class AircraftBatchTests(TestCase):
+    states = (
+        AircraftState(
+            provider="mock",
+            provider_aircraft_id="aircraft-1",
+            latitude=51.5,
+            longitude=-0.2,
+            observed_at=NOW,
+            icao_hex="A00001",
+            callsign="SKY101",
+            registration="G-MK01",
+            altitude_ft=16_000,
+            ground_speed_knots=312.5,
+            vertical_speed_fpm=-250,
+            track_degrees=95.0,
+        ),
+        AircraftState(
+            provider="mock",
+            provider_aircraft_id="aircraft-2",
+            latitude=51.6,
+            longitude=-0.1,
+            observed_at=NOW,
+        ),
+    )
+
+    def test_round_trips_states_including_missing_values(self) -> None:
+        batch = AircraftBatch.from_states(self.states)
+
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(list(batch), list(self.states))
+        self.assertEqual(batch[1].altitude_ft, None)
+        self.assertIsInstance(batch[0].altitude_ft, int)
+
+    def test_interns_repeated_strings(self) -> None:
+        batch = AircraftBatch.from_states(self.states)
+
+        self.assertIs(batch.provider[0], batch.provider[1])
+
+    def test_rejects_columns_of_different_lengths(self) -> None:
+        with self.assertRaisesRegex(DomainValidationError, "equal lengths"):
+            AircraftBatch.from_columns(
+                provider=["mock"],
+                provider_aircraft_id=["aircraft-1", "aircraft-2"],
+                latitude=[51.5, 51.6],
+                longitude=[-0.2, -0.1],
+                observed_at=[NOW, NOW],
+            )
+
+    def test_bulk_validation_reports_invalid_row_indices(self) -> None:
+        naive = datetime(2026, 8, 8, 12, 0)
+
+        with self.assertRaises(AircraftRowsInvalid) as raised:
+            AircraftBatch.from_columns(
+                provider=["mock", "mock", "mock", " "],
+                provider_aircraft_id=["a", "b", "c", "d"],
+                latitude=[51.5, 91.0, 51.5, 51.5],
+                longitude=[-0.2, -0.2, -0.2, -0.2],
+                observed_at=[NOW, NOW, naive, NOW],
+                track_degrees=[None, 90.0, 360.0, None],
+            )
+
+        self.assertIsInstance(raised.exception, DomainValidationError)
+        self.assertEqual(
+            raised.exception.row_errors,
+            {
+                1: "latitude must be between -90 and 90",
+                2: "observed_at must be timezone-aware",
+                3: "provider must not be empty",
+            },
+        )
+        self.assertIn("row 1: latitude", str(raised.exception))
+
+    def test_take_selects_rows_without_materialising_the_rest(self) -> None:
+        batch = AircraftBatch.from_states(self.states)
+
+        self.assertEqual(list(batch.take([1, 0])), [self.states[1], self.states[0]])
+        self.assertEqual(len(batch.take([])), 0)
+
+    def test_trusted_construction_matches_validated_construction(self) -> None:
+        values = {
+            "provider": "mock",
+            "provider_aircraft_id": "aircraft-1",
+            "latitude": 51.5,
+            "longitude": -0.2,
+            "observed_at": NOW,
+            "altitude_ft": 12_000,
+            "track_degrees": 95.0,
+        }
+
+        self.assertEqual(AircraftState.trusted(**values), AircraftState(**values))  # type: ignore[arg-type]
+
+
 class DisplaySnapshotValidationTests(TestCase):
     def test_visible_state_requires_primary_aircraft(self) -> None:
         with self.assertRaisesRegex(DomainValidationError, "require primary"):
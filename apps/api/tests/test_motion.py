@@ -0,0 +1,183 @@
+from datetime import UTC, datetime, timedelta
+from unittest import TestCase
+
+from flight_tracker.domain.geometry import (
+    destination_point,
+    great_circle_distance_km,
+    initial_bearing_degrees,
+)
+from flight_tracker.domain.models import AircraftBatch, AircraftState, ViewingZone
+from flight_tracker.domain.motion import (
+    earliest_entry_seconds,
+    extrapolate_aircraft,
+    extrapolate_batch,
+    seconds_until_visible,
+)
+
+NOW = datetime(2026, 8, 8, 12, 0, tzinfo=UTC)
+
+
+class DeadReckoningTests(TestCase):
+    def make_state(self, **overrides: object) -> AircraftState:
+        values: dict[str, object] = {
+            "provider": "test",
+            "provider_aircraft_id": "aircraft-1",
+            "latitude": 51.477,
+            "longitude": -0.210,
+            "observed_at": NOW,
+            "altitude_ft": 20_000,
+            "ground_speed_knots": 360.0,
+            "vertical_speed_fpm": -1_000,
+            "track_degrees": 90.0,
+        }
+        values.update(overrides)
+        return AircraftState(**values)  # type: ignore[arg-type]
+
+    def test_moves_along_track_at_ground_speed(self) -> None:
+        state = self.make_state()
+
+        predicted = extrapolate_aircraft(state, NOW + timedelta(minutes=1), max_age_seconds=120)
+
+        assert predicted is not None
+        distance = great_circle_distance_km(
+            state.latitude, state.longitude, predicted.latitude, predicted.longitude
+        )
+        bearing = initial_bearing_degrees(
+            state.latitude, state.longitude, predicted.latitude, predicted.longitude
+        )
+        self.assertAlmostEqual(distance, 6 * 1.852, places=6)
+        self.assertAlmostEqual(bearing, 90.0, places=6)
+        self.assertEqual(predicted.altitude_ft, 19_000)
+        self.assertEqual(predicted.observed_at, NOW)
+        self.assertEqual(predicted.extrapolated_at, NOW + timedelta(minutes=1))
+        self.assertTrue(predicted.is_extrapolated)
+        self.assertFalse(state.is_extrapolated)
+
+    def test_stale_observations_are_dropped(self) -> None:
+        state = self.make_state()
+
+        self.assertIsNone(
+            extrapolate_aircraft(state, NOW + timedelta(seconds=121), max_age_seconds=120)
+        )
+
+    def test_aircraft_without_motion_data_are_returned_unchanged(self) -> None:
+        state = self.make_state(track_degrees=None)
+
+        self.assertIs(
+            extrapolate_aircraft(state, NOW + timedelta(seconds=30), max_age_seconds=120), state
+        )
+
+    def test_fix_time_returns_the_observation(self) -> None:
+        state = self.make_state()
+
+        self.assertIs(extrapolate_aircraft(state, NOW, max_age_seconds=120), state)
+
+    def test_batch_extrapolation_matches_each_row(self) -> None:
+        states = [
+            self.make_state(),
+            self.make_state(provider_aircraft_id="static", track_degrees=None),
+            self.make_state(provider_aircraft_id="stale", observed_at=NOW - timedelta(minutes=5)),
+            self.make_state(provider_aircraft_id="level", vertical_speed_fpm=None),
+            self.make_state(provider_aircraft_id="future", observed_at=NOW + timedelta(minutes=5)),
+        ]
+        at = NOW + timedelta(seconds=45)
+
+        predicted = extrapolate_batch(AircraftBatch.from_states(states), at, max_age_seconds=120)
+
+        expected = [extrapolate_aircraft(state, at, max_age_seconds=120) for state in states]
+        self.assertEqual(list(predicted), [state for state in expected if state is not None])
+
+
+class SectorEntryTests(TestCase):
+    zone = ViewingZone(
+        device_id="device-1",
+        name="North window",
+        latitude=51.477,
+        longitude=-0.210,
+        bearing_degrees=0.0,
+        field_of_view_degrees=80.0,
+        max_distance_km=35.0,
+        min_altitude_ft=10_000,
+    )
+
+    def aircraft_at(
+        self,
+        bearing: float,
+        distance_km: float,
+        track: float | None,
+        *,
+        altitude_ft: int = 20_000,
+        vertical_speed_fpm: int | None = None,
+    ) -> AircraftState:
+        latitude, longitude = destination_point(
+            self.zone.latitude, self.zone.longitude, bearing, distance_km
+        )
+        return AircraftState(
+            provider="test",
+            provider_aircraft_id=f"aircraft-{bearing}-{distance_km}-{track}",
+            latitude=latitude,
+            longitude=longitude,
+            observed_at=NOW,
+            altitude_ft=altitude_ft,
+            ground_speed_knots=360.0,
+            vertical_speed_fpm=vertical_speed_fpm,
+            track_degrees=track,
+        )
+
+    def test_inbound_aircraft_crossing_the_outer_ring(self) -> None:
+        inbound = self.aircraft_at(0.0, 50.0, 180.0)
+
+        entry = seconds_until_visible(inbound, self.zone, horizon_seconds=300.0)
+
+        assert entry is not None
+        # 15 km at 360 knots.
+        self.assertAlmostEqual(entry, 15.0 / (360.0 * 1.852 / 3_600.0), delta=0.5)
+
+    def test_aircraft_crossing_a_sector_edge(self) -> None:
+        crossing = self.aircraft_at(60.0, 20.0, 270.0)
+
+        entry = seconds_until_visible(crossing, self.zone, horizon_seconds=300.0)
+
+        assert entry is not None
+        self.assertGreater(entry, 0.0)
+        self.assertLess(entry, 60.0)
+
+    def test_climbing_aircraft_enters_through_altitude_floor(self) -> None:
+        climbing = self.aircraft_at(0.0, 10.0, 0.0, altitude_ft=9_000, vertical_speed_fpm=2_000)
+
+        entry = seconds_until_visible(climbing, self.zone, horizon_seconds=300.0)
+
+        assert entry is not None
+        self.assertAlmostEqual(entry, 30.0, places=6)
+
+    def test_inside_outbound_and_static_aircraft(self) -> None:
+        self.assertEqual(
+            seconds_until_visible(self.aircraft_at(0.0, 10.0, 0.0), self.zone, horizon_seconds=60),
+            0.0,
+        )
+        self.assertIsNone(
+            seconds_until_visible(self.aircraft_at(0.0, 50.0, 0.0), self.zone, horizon_seconds=600)
+        )
+        self.assertIsNone(
+            seconds_until_visible(self.aircraft_at(0.0, 50.0, None), self.zone, horizon_seconds=600)
+        )
+
+    def test_earliest_entry_ignores_visible_and_unreachable_aircraft(self) -> None:
+        states = [
+            self.aircraft_at(0.0, 10.0, 0.0),
+            self.aircraft_at(0.0, 50.0, 180.0),
+            self.aircraft_at(0.0, 40.0, 180.0),
+            self.aircraft_at(0.0, 400.0, 180.0),
+        ]
+
+        entry = earliest_entry_seconds(states, self.zone, horizon_seconds=300.0)
+
+        assert entry is not None
+        self.assertAlmostEqual(entry, 5.0 / (360.0 * 1.852 / 3_600.0), delta=0.5)
+        self.assertIsNone(earliest_entry_seconds(states[:1], self.zone, horizon_seconds=300.0))
+        self.assertEqual(
+            earliest_entry_seconds(
+                AircraftBatch.from_states(states), self.zone, horizon_seconds=300.0
+            ),
+            entry,
+        )
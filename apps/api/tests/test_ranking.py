@@ -3,7 +3,11 @@ from unittest import TestCase
 
 from flight_tracker.domain.geometry import destination_point, evaluate_aircraft
 from flight_tracker.domain.models import AircraftState, ViewingZone
-from flight_tracker.domain.ranking import rank_visible_aircraft, relevance_score
+from flight_tracker.domain.ranking import (
+    rank_visible_aircraft,
+    relevance_score,
+    top_ranked_aircraft,
+)
 
 NOW = datetime(2026, 8, 8, 12, 0, tzinfo=UTC)
 
@@ -77,3 +81,25 @@ class AircraftRankingTests(TestCase):
 
         self.assertEqual(relevance_score(outside, self.zone), 0.0)
         self.assertEqual(rank_visible_aircraft([outside], self.zone), [])
+
+    def test_top_k_matches_head_of_full_ranking(self) -> None:
+        matches = [
+            self.make_match("centred", bearing=0.0, distance=25.0),
+            self.make_match("edge", bearing=35.0, distance=5.0),
+            self.make_match("tie-b", bearing=10.0, distance=10.0),
+            self.make_match("tie-a", bearing=10.0, distance=10.0),
+            self.make_match("partial", bearing=0.0, distance=10.0, complete=False),
+            self.make_match("outside", bearing=180.0, distance=10.0),
+        ]
+        ranked = rank_visible_aircraft(matches, self.zone)
+
+        for top_k in range(len(matches) + 1):
+            with self.subTest(top_k=top_k):
+                winners, total = top_ranked_aircraft(matches, self.zone, top_k)
+
+                self.assertEqual(winners, ranked[:top_k])
+                self.assertEqual(total, 5)
+
+    def test_top_k_rejects_negative_size(self) -> None:
+        with self.assertRaises(ValueError):
+            top_ranked_aircraft([], self.zone, -1)
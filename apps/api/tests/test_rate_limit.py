@@ -0,0 +1,102 @@
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from flight_tracker.domain.errors import ProviderRateLimited
+from flight_tracker.providers import (
+    FlightDataProvider,
+    GeographicArea,
+    MockFlightDataProvider,
+    MockScenario,
+    RateLimitedFlightDataProvider,
+    RequestBudget,
+    fetch_flight_information_many,
+)
+
+
+class RequestBudgetTests(TestCase):
+    def setUp(self) -> None:
+        self.now = 0.0
+        self.budget = RequestBudget(
+            requests_per_minute=60.0, burst=4, live_reserve=2, clock=lambda: self.now
+        )
+
+    def test_tokens_refill_up_to_the_burst(self) -> None:
+        for _ in range(4):
+            self.assertEqual(self.budget.try_acquire(live=True), 0.0)
+        self.assertAlmostEqual(self.budget.try_acquire(live=True), 1.0)
+
+        self.now += 60.0
+
+        self.assertEqual(self.budget.status.tokens_remaining, 4.0)
+
+    def test_enrichment_leaves_the_live_reserve(self) -> None:
+        self.assertEqual(self.budget.try_acquire(live=False), 0.0)
+        self.assertEqual(self.budget.try_acquire(live=False), 0.0)
+
+        self.assertGreater(self.budget.try_acquire(live=False), 0.0)
+        self.assertEqual(self.budget.try_acquire(live=True), 0.0)
+        self.assertEqual(self.budget.try_acquire(live=True), 0.0)
+
+    def test_cooldown_blocks_every_request(self) -> None:
+        self.budget.cool_down(30.0)
+
+        self.assertEqual(self.budget.try_acquire(live=True), 30.0)
+        self.assertEqual(self.budget.status.cooldown_remaining_seconds, 30.0)
+        self.now += 30.0
+        self.assertEqual(self.budget.try_acquire(live=True), 0.0)
+
+
+class RateLimitedProviderTests(IsolatedAsyncioTestCase):
+    area = GeographicArea(center_latitude=51.477, center_longitude=-0.210, radius_km=35.0)
+
+    def setUp(self) -> None:
+        self.now = 0.0
+        self.upstream = MockFlightDataProvider()
+        self.budget = RequestBudget(
+            requests_per_minute=6.0, burst=3, live_reserve=1, clock=lambda: self.now
+        )
+        self.provider = RateLimitedFlightDataProvider(self.upstream, self.budget)
+
+    async def test_exhausted_budget_fails_fast_without_upstream_calls(self) -> None:
+        for _ in range(3):
+            await self.provider.get_aircraft(self.area)
+
+        with self.assertRaises(ProviderRateLimited) as raised:
+            await self.provider.get_aircraft(self.area)
+
+        self.assertEqual(self.upstream.tick, 3)
+        self.assertEqual(raised.exception.retry_after_seconds, 10)
+
+    async def test_live_state_is_prioritised_over_enrichment(self) -> None:
+        states = await self.provider.get_aircraft(self.area)
+        await self.provider.get_flight_information(states[0])
+
+        with self.assertRaises(ProviderRateLimited):
+            await self.provider.get_flight_information(states[0])
+        self.assertTrue(await self.provider.get_aircraft(self.area))
+
+    async def test_batch_enrichment_spends_the_budget(self) -> None:
+        states = await self.provider.get_aircraft(self.area)
+        await fetch_flight_information_many(self.provider, states[:1])
+
+        results = await fetch_flight_information_many(self.provider, states)
+
+        self.assertEqual(results, [None] * len(states))
+        self.assertTrue(await self.provider.get_aircraft(self.area))
+
+    async def test_upstream_retry_after_starts_a_shared_cooldown(self) -> None:
+        states = await self.provider.get_aircraft(self.area)
+        self.upstream.scenario = MockScenario.RATE_LIMITED
+        with self.assertRaises(ProviderRateLimited):
+            await self.provider.get_flight_information(states[0])
+        self.upstream.scenario = MockScenario.NORMAL
+        sibling = RateLimitedFlightDataProvider(MockFlightDataProvider(), self.budget)
+
+        with self.assertRaises(ProviderRateLimited):
+            await sibling.get_aircraft(self.area)
+        self.assertEqual(self.provider.budget_status.cooldown_remaining_seconds, 60.0)
+
+        self.now += 60.0
+        self.assertTrue(await sibling.get_aircraft(self.area))
+
+    async def test_satisfies_the_provider_protocol(self) -> None:
+        self.assertIsInstance(self.provider, FlightDataProvider)
@@ -0,0 +1,172 @@
+import traceback
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import IsolatedAsyncioTestCase
+
+from flight_tracker.domain.errors import (
+    ProviderRateLimited,
+    ProviderResponseInvalid,
+    ProviderTimeout,
+    ProviderUnavailable,
+)
+from flight_tracker.domain.models import AircraftState
+from flight_tracker.providers import (
+    FlightDataProvider,
+    GeographicArea,
+    MockFlightDataProvider,
+    MockScenario,
+    RecordingFlightDataProvider,
+    ReplayFlightDataProvider,
+    read_recording,
+)
+
+
+class RecordReplayTests(IsolatedAsyncioTestCase):
+    area = GeographicArea(center_latitude=51.477, center_longitude=-0.210, radius_km=35.0)
+
+    def setUp(self) -> None:
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "traffic.rec"
+        self.now = 1_000.0
+        self.upstream = MockFlightDataProvider()
+        self.recorder = self.enterContext(
+            RecordingFlightDataProvider(self.upstream, self.path, clock=lambda: self.now)
+        )
+
+    async def record_polls(self, count: int) -> list[list[AircraftState]]:
+        frames: list[list[AircraftState]] = []
+        for _ in range(count):
+            frames.append(list(await self.recorder.get_aircraft(self.area)))
+            self.now += 30.0
+        return frames
+
+    async def test_replay_reproduces_recorded_frames_and_enrichment(self) -> None:
+        frames = await self.record_polls(3)
+        information = await self.recorder.get_flight_information(frames[0][0])
+
+        replay = ReplayFlightDataProvider(self.path, speed=None)
+
+        self.assertEqual([await replay.get_aircraft(self.area) for _ in range(3)], frames)
+        self.assertEqual(await replay.get_flight_information(frames[2][0]), information)
+        self.assertEqual(replay.name, "mock")
+        self.assertEqual(replay.capabilities, self.upstream.capabilities)
+        self.assertEqual(replay.areas, [self.area])
+        self.assertIsInstance(replay, FlightDataProvider)
+
+    async def test_replay_preserves_timing_scaled_by_speed(self) -> None:
+        await self.record_polls(3)
+        delays: list[float] = []
+
+        async def sleep(seconds: float) -> None:
+            delays.append(seconds)
+
+        replay = ReplayFlightDataProvider(self.path, speed=10.0, sleep=sleep)
+        for _ in range(3):
+            await replay.get_aircraft(self.area)
+
+        self.assertEqual(len(delays), 2)
+        self.assertAlmostEqual(delays[0], 3.0, places=1)
+        self.assertAlmostEqual(delays[1], 6.0, places=1)
+
+    async def test_looped_passes_keep_the_recorded_pacing(self) -> None:
+        await self.record_polls(3)
+        clock = 0.0
+        delays: list[float] = []
+
+        async def sleep(seconds: float) -> None:
+            nonlocal clock
+            delays.append(seconds)
+            clock += seconds
+
+        replay = ReplayFlightDataProvider(
+            self.path, speed=1.0, loop=True, sleep=sleep, clock=lambda: clock
+        )
+        for _ in range(7):
+            await replay.get_aircraft(self.area)
+
+        self.assertEqual(delays, [30.0] * 6)
+
+    async def test_provider_errors_are_recorded_and_replayed(self) -> None:
+        await self.record_polls(1)
+        self.upstream.scenario = MockScenario.TIMEOUT
+        with self.assertRaises(ProviderTimeout):
+            await self.recorder.get_aircraft(self.area)
+        self.upstream.scenario = MockScenario.RATE_LIMITED
+        states = await MockFlightDataProvider().get_aircraft(self.area)
+        with self.assertRaises(ProviderRateLimited):
+            await self.recorder.get_flight_information(states[0])
+
+        replay = ReplayFlightDataProvider(self.path, speed=None)
+        await replay.get_aircraft(self.area)
+
+        with self.assertRaises(ProviderTimeout):
+            await replay.get_aircraft(self.area)
+        with self.assertRaises(ProviderRateLimited) as raised:
+            await replay.get_flight_information(states[0])
+        self.assertEqual(raised.exception.retry_after_seconds, 60)
+
+    async def test_replayed_errors_are_raised_with_a_fresh_traceback(self) -> None:
+        self.upstream.scenario = MockScenario.RATE_LIMITED
+        states = await MockFlightDataProvider().get_aircraft(self.area)
+        with self.assertRaises(ProviderRateLimited):
+            await self.recorder.get_flight_information(states[0])
+        replay = ReplayFlightDataProvider(self.path, speed=None)
+
+        depths = []
+        for _ in range(3):
+            with self.assertRaises(ProviderRateLimited) as raised:
+                await replay.get_flight_information(states[0])
+            depths.append(len(traceback.extract_tb(raised.exception.__traceback__)))
+
+        self.assertEqual(depths[0], depths[-1])
+
+    async def test_exhausted_area_fails_unless_looping(self) -> None:
+        frames = await self.record_polls(2)
+
+        once = ReplayFlightDataProvider(self.path, speed=None)
+        looping = ReplayFlightDataProvider(self.path, speed=None, loop=True)
+        for replay in (once, looping):
+            for _ in range(2):
+                await replay.get_aircraft(self.area)
+
+        with self.assertRaises(ProviderUnavailable):
+            await once.get_aircraft(self.area)
+        self.assertEqual(await looping.get_aircraft(self.area), frames[0])
+
+    async def test_recording_is_append_only_across_sessions(self) -> None:
+        await self.record_polls(1)
+        with RecordingFlightDataProvider(
+            self.upstream, self.path, clock=lambda: self.now
+        ) as resumed:
+            await resumed.get_aircraft(self.area)
+
+        kinds = [record["kind"] for record in read_recording(self.path)]
+
+        self.assertEqual(kinds, ["header", "aircraft", "aircraft"])
+
+    async def test_closed_recorder_stops_recording(self) -> None:
+        await self.record_polls(1)
+        self.recorder.close()
+
+        await self.recorder.get_aircraft(self.area)
+
+        kinds = [record["kind"] for record in read_recording(self.path)]
+        self.assertEqual(kinds, ["header", "aircraft"])
+
+    async def test_with_block_closes_the_recording(self) -> None:
+        path = self.path.with_name("session.rec")
+        with RecordingFlightDataProvider(self.upstream, path) as recorder:
+            await recorder.get_aircraft(self.area)
+
+        await recorder.get_aircraft(self.area)
+
+        kinds = [record["kind"] for record in read_recording(path)]
+        self.assertEqual(kinds, ["header", "aircraft"])
+
+    async def test_truncated_recording_is_rejected(self) -> None:
+        await self.record_polls(1)
+        self.path.write_bytes(self.path.read_bytes()[:-5])
+
+        with self.assertRaises(ProviderResponseInvalid):
+            ReplayFlightDataProvider(self.path)
@@ -1,12 +1,32 @@
-from datetime import UTC, datetime
+import asyncio
+from collections.abc import Sequence
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
 from unittest import IsolatedAsyncioTestCase
 
 from flight_tracker.domain.errors import ProviderTimeout
 from flight_tracker.domain.geometry import destination_point
-from flight_tracker.domain.models import AircraftState, SnapshotStatus, ViewingZone
-from flight_tracker.providers import GeographicArea, MockFlightDataProvider, MockScenario
+from flight_tracker.domain.models import (
+    AircraftBatch,
+    AircraftState,
+    FlightInformation,
+    SnapshotStatus,
+    ViewingZone,
+)
+from flight_tracker.providers import (
+    CachingFlightDataProvider,
+    EnrichmentCachingFlightDataProvider,
+    GeographicArea,
+    MockFlightDataProvider,
+    MockScenario,
+)
 from flight_tracker.providers.base import ProviderCapability
-from flight_tracker.services import DeviceSnapshotService
+from flight_tracker.services import (
+    DeviceSnapshotService,
+    HistogramCollector,
+    SnapshotStage,
+    SnapshotTrace,
+)
 
 NOW = datetime(2026, 8, 8, 14, 30, tzinfo=UTC)
 
@@ -38,6 +58,88 @@ class LiveOnlyProvider:
         raise ProviderTimeout("optional enrichment timed out")
 
 
+class InboundProvider:
+    name = "inbound"
+    capabilities = frozenset({ProviderCapability.LIVE_POSITION})
+
+    def __init__(self, distance_km: float) -> None:
+        self.distance_km = distance_km
+        self.areas: list[GeographicArea] = []
+
+    async def get_aircraft(self, area: GeographicArea) -> list[AircraftState]:
+        self.areas.append(area)
+        latitude, longitude = destination_point(
+            area.center_latitude,
+            area.center_longitude,
+            0.0,
+            self.distance_km,
+        )
+        return [
+            AircraftState(
+                provider=self.name,
+                provider_aircraft_id="INBOUND001",
+                latitude=latitude,
+                longitude=longitude,
+                altitude_ft=18_000,
+                ground_speed_knots=360.0,
+                track_degrees=180.0,
+                observed_at=NOW,
+            )
+        ]
+
+    async def get_flight_information(self, aircraft: AircraftState) -> None:
+        return None
+
+
+class GatedProvider(MockFlightDataProvider):
+    def __init__(self) -> None:
+        super().__init__()
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.calls = 0
+
+    async def get_aircraft_batch(self, area: GeographicArea) -> AircraftBatch:
+        self.calls += 1
+        await self.gate.wait()
+        return await super().get_aircraft_batch(area)
+
+
+class BatchOnlyProvider(MockFlightDataProvider):
+    async def get_aircraft(self, area: GeographicArea) -> list[AircraftState]:
+        raise AssertionError("snapshots should read columnar batches")
+
+
+class SlowProvider(MockFlightDataProvider):
+    def __init__(self, *, live_delay: float = 0.0, enrichment_delay: float = 0.0) -> None:
+        super().__init__()
+        self.live_delay = live_delay
+        self.enrichment_delay = enrichment_delay
+
+    async def get_aircraft_batch(self, area: GeographicArea) -> AircraftBatch:
+        await asyncio.sleep(self.live_delay)
+        return await super().get_aircraft_batch(area)
+
+    async def get_flight_information(self, aircraft: AircraftState) -> FlightInformation | None:
+        await asyncio.sleep(self.enrichment_delay)
+        return await super().get_flight_information(aircraft)
+
+
+class GatedBatchProvider(MockFlightDataProvider):
+    """Answers single lookups at once but holds batch lookups until released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.gate = asyncio.Event()
+        self.prefetched: list[list[str | None]] = []
+
+    async def get_flight_information_many(
+        self, aircraft: Sequence[AircraftState]
+    ) -> list[FlightInformation | None]:
+        self.prefetched.append([state.callsign for state in aircraft])
+        await self.gate.wait()
+        return [await self.get_flight_information(state) for state in aircraft]
+
+
 class DeviceSnapshotServiceTests(IsolatedAsyncioTestCase):
     def make_zone(self, **overrides: object) -> ViewingZone:
         values: dict[str, object] = {
@@ -95,6 +197,13 @@ class DeviceSnapshotServiceTests(IsolatedAsyncioTestCase):
         self.assertEqual(snapshot.primary.origin, "LHR")
         self.assertEqual(snapshot.primary.destination, "JFK")
 
+    async def test_live_state_is_read_as_a_columnar_batch(self) -> None:
+        service = self.service(CachingFlightDataProvider(BatchOnlyProvider(traffic_size=300)))
+
+        snapshot = await service.generate(self.make_zone(field_of_view_degrees=120.0))
+
+        self.assertEqual(snapshot.status, SnapshotStatus.MULTIPLE_AIRCRAFT)
+
     async def test_multiple_visible_aircraft_reports_secondary_count(self) -> None:
         provider = MockFlightDataProvider()
         service = self.service(provider)
@@ -107,6 +216,37 @@ class DeviceSnapshotServiceTests(IsolatedAsyncioTestCase):
         self.assertEqual(snapshot.status, SnapshotStatus.MULTIPLE_AIRCRAFT)
         self.assertGreaterEqual(snapshot.secondary_count, 1)
 
+    async def test_batch_enrichment_warms_the_next_candidates(self) -> None:
+        upstream = MockFlightDataProvider()
+        provider = EnrichmentCachingFlightDataProvider(upstream)
+        service = self.service(provider)
+        zone = self.make_zone()
+        await service.generate(zone)
+        await service.generate(zone)
+
+        snapshot = await service.generate(zone)
+        await service.wait_for_refreshes()
+
+        self.assertEqual(snapshot.status, SnapshotStatus.MULTIPLE_AIRCRAFT)
+        self.assertEqual(provider.stats.misses, provider.stats.entries)
+        self.assertGreater(provider.stats.entries, 1)
+
+    async def test_slow_prefetch_does_not_hold_back_the_primary(self) -> None:
+        provider = GatedBatchProvider()
+        service = DeviceSnapshotService(provider, enrichment_budget_seconds=0.05, clock=lambda: NOW)
+
+        zone = self.make_zone(bearing_degrees=300.0, field_of_view_degrees=120.0)
+
+        snapshot = await asyncio.wait_for(service.generate(zone), timeout=1.0)
+        provider.gate.set()
+        await service.wait_for_refreshes()
+
+        self.assertEqual(snapshot.status, SnapshotStatus.MULTIPLE_AIRCRAFT)
+        assert snapshot.primary is not None
+        self.assertIsNotNone(snapshot.primary.flight_number)
+        self.assertEqual(len(provider.prefetched), 1)
+        self.assertNotIn(snapshot.primary.callsign, provider.prefetched[0])
+
     async def test_enrichment_failure_preserves_useful_live_state(self) -> None:
         service = self.service(LiveOnlyProvider())
 
@@ -119,3 +259,264 @@ class DeviceSnapshotServiceTests(IsolatedAsyncioTestCase):
         self.assertEqual(snapshot.primary.altitude_ft, 18_000)
         self.assertIsNone(snapshot.primary.flight_number)
         self.assertIsNone(snapshot.primary.origin)
+
+    async def test_adaptive_refresh_polls_sooner_when_aircraft_is_inbound(self) -> None:
+        provider = InboundProvider(distance_km=39.0)
+        service = DeviceSnapshotService(
+            provider, quiet_refresh_after_seconds=120, clock=lambda: NOW
+        )
+
+        snapshot = await service.generate(self.make_zone())
+
+        self.assertEqual(snapshot.status, SnapshotStatus.NO_AIRCRAFT)
+        # 4 km at 360 knots is just under 22 seconds.
+        self.assertEqual(snapshot.refresh_after_seconds, 22)
+        self.assertGreater(provider.areas[0].radius_km, 35.0)
+
+    async def test_adaptive_refresh_waits_longer_when_nothing_is_inbound(self) -> None:
+        service = DeviceSnapshotService(
+            MockFlightDataProvider(scenario=MockScenario.EMPTY),
+            quiet_refresh_after_seconds=120,
+            clock=lambda: NOW,
+        )
+
+        snapshot = await service.generate(self.make_zone())
+
+        self.assertEqual(snapshot.refresh_after_seconds, 120)
+
+    async def test_inbound_search_margin_is_capped(self) -> None:
+        provider = InboundProvider(distance_km=500.0)
+        service = DeviceSnapshotService(
+            provider, quiet_refresh_after_seconds=600, clock=lambda: NOW
+        )
+
+        snapshot = await service.generate(self.make_zone())
+
+        self.assertEqual(snapshot.status, SnapshotStatus.NO_AIRCRAFT)
+        # 50 km at 600 knots takes just over 161 seconds.
+        self.assertEqual(snapshot.refresh_after_seconds, 161)
+        self.assertLessEqual(provider.areas[0].radius_km, 35.0 + 50.0)
+
+    async def test_adaptive_refresh_never_drops_below_the_minimum(self) -> None:
+        service = DeviceSnapshotService(
+            InboundProvider(distance_km=35.2), quiet_refresh_after_seconds=120, clock=lambda: NOW
+        )
+
+        snapshot = await service.generate(self.make_zone())
+
+        self.assertEqual(snapshot.refresh_after_seconds, 5)
+
+
+class StaleWhileRevalidateTests(IsolatedAsyncioTestCase):
+    # Centred on its region cell, so the mock fleet around the fetched region
+    # centre is also around the device.
+    zone = ViewingZone(
+        device_id="device-1",
+        name="North window",
+        latitude=51.25,
+        longitude=-0.25,
+        bearing_degrees=0.0,
+        field_of_view_degrees=80.0,
+        max_distance_km=35.0,
+    )
+
+    def setUp(self) -> None:
+        self.now = NOW
+        self.provider = GatedProvider()
+        self.service = DeviceSnapshotService(
+            self.provider,
+            stale_budget_seconds=120.0,
+            revalidate_after_seconds=15.0,
+            clock=lambda: self.now,
+        )
+
+    async def test_fresh_regional_set_is_reused_without_upstream(self) -> None:
+        first = await self.service.generate(self.zone)
+        self.now += timedelta(seconds=10)
+
+        second = await self.service.generate(self.zone)
+
+        self.assertEqual(self.provider.calls, 1)
+        self.assertFalse(second.stale)
+        self.assertEqual(second.primary, first.primary)
+
+    async def test_stale_set_is_served_while_a_slow_refresh_runs(self) -> None:
+        first = await self.service.generate(self.zone)
+        self.provider.gate.clear()
+        self.now += timedelta(seconds=30)
+
+        stale = await asyncio.wait_for(self.service.generate(self.zone), timeout=1.0)
+        again = await asyncio.wait_for(self.service.generate(self.zone), timeout=1.0)
+        await asyncio.sleep(0)
+
+        self.assertTrue(stale.stale)
+        self.assertEqual(stale.primary, first.primary)
+        self.assertTrue(again.stale)
+        self.assertEqual(self.provider.calls, 2)
+
+        self.provider.gate.set()
+        await self.service.wait_for_refreshes()
+        refreshed = await self.service.generate(self.zone)
+
+        self.assertFalse(refreshed.stale)
+        self.assertEqual(self.provider.tick, 2)
+
+    async def test_hung_refresh_is_abandoned_after_the_live_state_budget(self) -> None:
+        service = DeviceSnapshotService(
+            self.provider,
+            stale_budget_seconds=120.0,
+            revalidate_after_seconds=15.0,
+            live_state_budget_seconds=0.01,
+            clock=lambda: self.now,
+        )
+        await service.generate(self.zone)
+        self.provider.gate.clear()
+        self.now += timedelta(seconds=30)
+
+        stale = await service.generate(self.zone)
+        await asyncio.wait_for(service.wait_for_refreshes(), timeout=1.0)
+        again = await service.generate(self.zone)
+        await asyncio.sleep(0)
+
+        self.assertTrue(stale.stale)
+        self.assertTrue(again.stale)
+        self.assertEqual(self.provider.calls, 3)
+        self.provider.gate.set()
+        await service.wait_for_refreshes()
+
+    async def test_failed_refresh_keeps_serving_until_the_budget_runs_out(self) -> None:
+        await self.service.generate(self.zone)
+        self.provider.scenario = MockScenario.TIMEOUT
+        self.now += timedelta(seconds=60)
+
+        stale = await self.service.generate(self.zone)
+        await self.service.wait_for_refreshes()
+        self.now += timedelta(seconds=60)
+        expired = await self.service.generate(self.zone)
+
+        self.assertTrue(stale.stale)
+        self.assertIsNotNone(stale.primary)
+        self.assertEqual(expired.status, SnapshotStatus.PROVIDER_UNAVAILABLE)
+
+    async def test_nearby_devices_share_one_regional_set(self) -> None:
+        neighbour = replace(self.zone, device_id="device-2", latitude=51.3, longitude=-0.2)
+
+        await self.service.generate(self.zone)
+        await self.service.generate(neighbour)
+
+        self.assertEqual(self.provider.calls, 1)
+
+    async def test_wider_request_in_a_region_refetches_it(self) -> None:
+        wide = replace(self.zone, device_id="device-2", max_distance_km=80.0)
+
+        await self.service.generate(self.zone)
+        await self.service.generate(wide)
+        await self.service.generate(self.zone)
+
+        self.assertEqual(self.provider.calls, 2)
+
+
+class SnapshotDeadlineTests(IsolatedAsyncioTestCase):
+    zone = ViewingZone(
+        device_id="device-1",
+        name="Living Room Window",
+        latitude=51.477,
+        longitude=-0.210,
+        bearing_degrees=300.0,
+        field_of_view_degrees=10.0,
+        max_distance_km=35.0,
+    )
+
+    async def test_slow_live_state_degrades_within_its_budget(self) -> None:
+        service = DeviceSnapshotService(
+            SlowProvider(live_delay=5.0), live_state_budget_seconds=0.01, clock=lambda: NOW
+        )
+
+        snapshot = await asyncio.wait_for(service.generate(self.zone), timeout=1.0)
+
+        self.assertEqual(snapshot.status, SnapshotStatus.PROVIDER_UNAVAILABLE)
+
+    async def test_slow_enrichment_is_abandoned_for_live_only_content(self) -> None:
+        service = DeviceSnapshotService(
+            SlowProvider(enrichment_delay=5.0), enrichment_budget_seconds=0.01, clock=lambda: NOW
+        )
+
+        snapshot = await asyncio.wait_for(service.generate(self.zone), timeout=1.0)
+
+        self.assertEqual(snapshot.status, SnapshotStatus.AIRCRAFT_VISIBLE)
+        assert snapshot.primary is not None
+        self.assertEqual(snapshot.primary.callsign, "SKY101")
+        self.assertIsNone(snapshot.primary.flight_number)
+
+    async def test_stage_budgets_are_cut_short_by_the_overall_deadline(self) -> None:
+        service = DeviceSnapshotService(
+            SlowProvider(live_delay=0.05, enrichment_delay=0.2),
+            deadline_seconds=0.1,
+            enrichment_budget_seconds=5.0,
+            clock=lambda: NOW,
+        )
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+
+        snapshot = await service.generate(self.zone)
+
+        self.assertLess(loop.time() - started_at, 0.2)
+        assert snapshot.primary is not None
+        self.assertIsNone(snapshot.primary.flight_number)
+
+    def test_rejects_non_positive_budgets(self) -> None:
+        with self.assertRaisesRegex(ValueError, "time budgets"):
+            DeviceSnapshotService(MockFlightDataProvider(), enrichment_budget_seconds=0.0)
+
+
+class RecordingInstrumentation:
+    def __init__(self) -> None:
+        self.traces: list[SnapshotTrace] = []
+
+    def record(self, trace: SnapshotTrace) -> None:
+        self.traces.append(trace)
+
+
+class SnapshotInstrumentationTests(IsolatedAsyncioTestCase):
+    zone = SnapshotDeadlineTests.zone
+
+    async def test_visible_snapshot_times_every_stage(self) -> None:
+        instrumentation = RecordingInstrumentation()
+        service = DeviceSnapshotService(
+            SlowProvider(live_delay=0.02), instrumentation=instrumentation, clock=lambda: NOW
+        )
+
+        snapshot = await service.generate(self.zone)
+
+        [trace] = instrumentation.traces
+        self.assertEqual(trace.status, snapshot.status)
+        self.assertEqual(list(trace.durations), list(SnapshotStage))
+        self.assertGreaterEqual(trace.durations[SnapshotStage.PROVIDER_FETCH], 0.02)
+        self.assertAlmostEqual(trace.total_seconds, sum(trace.durations.values()))
+        self.assertEqual((trace.aircraft_in, trace.visible, trace.ranked), (4, 1, 1))
+
+    async def test_failed_fetch_records_only_the_provider_stage(self) -> None:
+        instrumentation = RecordingInstrumentation()
+        service = DeviceSnapshotService(
+            MockFlightDataProvider(scenario=MockScenario.TIMEOUT),
+            instrumentation=instrumentation,
+            clock=lambda: NOW,
+        )
+
+        await service.generate(self.zone)
+        await service.generate(None)
+
+        failed, unconfigured = instrumentation.traces
+        self.assertEqual(list(failed.durations), [SnapshotStage.PROVIDER_FETCH])
+        self.assertEqual(failed.status, SnapshotStatus.PROVIDER_UNAVAILABLE)
+        self.assertEqual(unconfigured.durations, {})
+
+    async def test_histogram_collector_is_the_default(self) -> None:
+        service = DeviceSnapshotService(MockFlightDataProvider(), clock=lambda: NOW)
+
+        for _ in range(3):
+            await service.generate(self.zone)
+
+        assert isinstance(service.instrumentation, HistogramCollector)
+        self.assertEqual(service.instrumentation.total.count, 3)
+        self.assertEqual(service.instrumentation.summary()["ranking"]["count"], 3)
@@ -23,6 +23,9 @@ RUN_DIRECTORY = PROJECT_ROOT / ".run"
 REGISTRY_FILE = RUN_DIRECTORY / "stack.json"
 STATE_DIRECTORY = PROJECT_ROOT / ".state"
 RUNTIME_CONFIG_FILE = STATE_DIRECTORY / "backend.toml"
+# The dev backend serves live upstream data from /api/flights, so the default
+# fleet stays small; later ARGS override these.
+LOAD_TEST_DEFAULTS = ["--path", "/api/flights", "--devices", "20"]
 
 
 @dataclass(frozen=True, slots=True)
@@ -383,26 +386,54 @@ def doctor(runtime_python: Path) -> int:
     return 0
 
 
-def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description=__doc__)
-    parser.add_argument("action", choices=("dev", "pi", "stop", "status", "doctor"))
+def load_test(runtime_python: Path, fleet_arguments: list[str]) -> int:
+    if not _wait_for_url("http://127.0.0.1:8000/api/health", 2.0):
+        print("API is not running on port 8000. Start it with `make dev` first.")
+        return 1
+    command = [
+        str(runtime_python),
+        "-m",
+        "benchmarks.fleet",
+        "--url",
+        "http://127.0.0.1:8000",
+        *LOAD_TEST_DEFAULTS,
+        *fleet_arguments,
+    ]
+    return subprocess.run(
+        command, cwd=PROJECT_ROOT / "apps/api", check=False
+    ).returncode
+
+
+def parse_args() -> tuple[argparse.Namespace, list[str]]:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        epilog="Arguments after `load` that are not listed here go to benchmarks.fleet.",
+    )
+    parser.add_argument(
+        "action", choices=("dev", "pi", "stop", "status", "doctor", "load")
+    )
     parser.add_argument(
         "--python",
         type=Path,
         default=PROJECT_ROOT / ".venv/bin/python",
         help="Python executable used for managed services",
     )
-    return parser.parse_args()
+    return parser.parse_known_args()
 
 
 def main() -> int:
-    args = parse_args()
+    args, extra_arguments = parse_args()
+    if extra_arguments and args.action != "load":
+        print(f"Unrecognised arguments: {' '.join(extra_arguments)}")
+        return 2
     if args.action == "stop":
         return stop_stack()
     if args.action == "status":
         return show_status()
     if args.action == "doctor":
         return doctor(args.python)
+    if args.action == "load":
+        return load_test(args.python, extra_arguments)
     return run_stack(args.action, args.python)
 
 
@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 import math
 import os
 import time
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 from FlightRadar24 import FlightRadar24API
 from geopy.extra.rate_limiter import RateLimiter
 from geopy.geocoders import Nominatim
@@ -163,6 +163,12 @@ class FlightTrackerService:
             
             # Filter flights by actual distance
             flights_in_range = []
+            sector_contains = self._compile_sector(
+                center_lat,
+                center_lon,
+                bearing_degrees,
+                field_of_view_degrees,
+            )
             
             for flight in flights_data:
                 # Flight object from get_flights() has attributes, not array indices
@@ -179,17 +185,7 @@ class FlightTrackerService:
                     # Calculate distance
                     distance = geodesic(center_coords, flight_coords).meters
                     
-                    aircraft_bearing = self._bearing_between(
-                        center_lat,
-                        center_lon,
-                        float(flight_lat),
-                        float(flight_lon),
-                    )
-                    inside_view = self._bearing_is_visible(
-                        aircraft_bearing,
-                        bearing_degrees,
-                        field_of_view_degrees,
-                    )
+                    inside_view = sector_contains(float(flight_lat), float(flight_lon))
 
                     if min_distance_meters <= distance <= radius_meters and inside_view:
                         self._enrich_flight(flight)
@@ -224,17 +220,65 @@ class FlightTrackerService:
         """Calculate the initial compass bearing from the observer to an aircraft."""
 
         origin_latitude_radians = math.radians(origin_latitude)
+        return FlightTrackerService._bearing_from_origin_terms(
+            math.sin(origin_latitude_radians),
+            math.cos(origin_latitude_radians),
+            origin_longitude,
+            target_latitude,
+            target_longitude,
+        )
+
+    @staticmethod
+    def _bearing_from_origin_terms(
+        origin_sin: float,
+        origin_cos: float,
+        origin_longitude: float,
+        target_latitude: float,
+        target_longitude: float,
+    ) -> float:
+        """Calculate a bearing with the observer's latitude sine and cosine supplied."""
+
         target_latitude_radians = math.radians(target_latitude)
+        target_cos = math.cos(target_latitude_radians)
         longitude_delta = math.radians(target_longitude - origin_longitude)
-        x = math.sin(longitude_delta) * math.cos(target_latitude_radians)
+        x = math.sin(longitude_delta) * target_cos
         y = (
-            math.cos(origin_latitude_radians) * math.sin(target_latitude_radians)
-            - math.sin(origin_latitude_radians)
-            * math.cos(target_latitude_radians)
-            * math.cos(longitude_delta)
+            origin_cos * math.sin(target_latitude_radians)
+            - origin_sin * target_cos * math.cos(longitude_delta)
         )
         return (math.degrees(math.atan2(x, y)) + 360) % 360
 
+    @staticmethod
+    def _compile_sector(
+        origin_latitude: float,
+        origin_longitude: float,
+        centre_bearing: Optional[float],
+        field_of_view: Optional[float],
+    ) -> Callable[[float, float], bool]:
+        """Build a sector test with the observer trigonometry resolved once.
+
+        The returned predicate applies ``_bearing_is_visible`` to the same
+        bearing as ``_bearing_between`` but computes the observer's latitude
+        terms once per response instead of once per flight.
+        """
+
+        if centre_bearing is None or field_of_view is None or field_of_view >= 360:
+            return lambda _latitude, _longitude: True
+
+        origin_latitude_radians = math.radians(origin_latitude)
+        origin_sin = math.sin(origin_latitude_radians)
+        origin_cos = math.cos(origin_latitude_radians)
+        bearing_from_origin = FlightTrackerService._bearing_from_origin_terms
+        bearing_is_visible = FlightTrackerService._bearing_is_visible
+
+        def contains(target_latitude: float, target_longitude: float) -> bool:
+            aircraft_bearing = bearing_from_origin(
+                origin_sin, origin_cos, origin_longitude, target_latitude, target_longitude
+            )
+            return bearing_is_visible(aircraft_bearing, centre_bearing, field_of_view)
+
+        return contains
+
     @staticmethod
     def _bearing_is_visible(
         aircraft_bearing: float,
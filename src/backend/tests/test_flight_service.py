@@ -91,3 +91,14 @@ class FlightTrackerServiceAirportTests(TestCase):
         self.assertTrue(FlightTrackerService._bearing_is_visible(5, 0, 20))
         self.assertFalse(FlightTrackerService._bearing_is_visible(25, 0, 20))
         self.assertTrue(FlightTrackerService._bearing_is_visible(180, None, None))
+
+    def test_compiled_sector_matches_per_flight_bearing_check(self) -> None:
+        contains = FlightTrackerService._compile_sector(51.5, -0.1, 0, 20)
+
+        for target in ((52.5, -0.1), (52.5, -0.3), (52.5, 0.2), (51.5, 0.9), (50.5, -0.1)):
+            with self.subTest(target=target):
+                expected = FlightTrackerService._bearing_is_visible(
+                    FlightTrackerService._bearing_between(51.5, -0.1, *target), 0, 20
+                )
+                self.assertEqual(contains(*target), expected)
+        self.assertTrue(FlightTrackerService._compile_sector(51.5, -0.1, None, None)(0, 0))